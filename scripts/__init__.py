@@ -6,8 +6,31 @@ OCR and Text-to-Speech for accessibility
 __version__ = '1.0.0'
 __author__ = 'Reading Eye Project'
 
-from .camera import PiCamera
-from .ocr import OCR
-from .tts import TTS
+import importlib
 
-__all__ = ['PiCamera', 'OCR', 'TTS']
+# Public classes and the submodule defining each; a submodule (and its heavy
+# libraries such as OpenCV or the TTS engines) is imported on first access
+_EXPORTS = {
+    'PiCamera': 'camera',
+    'FileCamera': 'camera',
+    'OCR': 'ocr',
+    'TTS': 'tts',
+    'SceneChangeDetector': 'scene',
+    'Pipeline': 'pipeline',
+    'NoveltyFilter': 'novelty',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,12 +12,30 @@ import sys
 import os
 import json
 import time
+import signal
+import threading
+from contextlib import nullcontext
 from pathlib import Path
 
-# Import local modules
-from camera import PiCamera
-from ocr import OCR
-from tts import TTS
+# Import local modules (timed for --profile-startup)
+from startup import profile as startup
+
+with startup.step('import camera'):
+    from camera import PiCamera, FileCamera
+with startup.step('import ocr'):
+    from ocr import OCR
+with startup.step('import tts'):
+    from tts import TTS
+with startup.step('import helpers'):
+    from scene import SceneChangeDetector
+    from pipeline import Pipeline
+    from novelty import NoveltyFilter
+    from scheduler import AdaptiveScheduler
+    from metrics import registry as metrics, start_server, JsonLogReporter
+    from daemon import ReadingEyeDaemon
+    from batch import BatchRunner
+    from capture_store import CaptureWriter
+    from memory import MemoryWatchdog
 
 # Setup logging
 LOG_DIR = Path(__file__).parent.parent / 'logs'
@@ -37,29 +55,134 @@ logger = logging.getLogger(__name__)
 class ReadingEyeApp:
     """Main Reading Eye application"""
     
-    def __init__(self, config_path=None):
+    def __init__(self, config_path=None, camera_source=None, enable_metrics=False,
+                 components=('camera', 'ocr', 'tts')):
         """
         Initialize application
         
         Args:
             config_path: Path to configuration file
+            camera_source: Image file or directory to read frames from
+                instead of the Pi camera (default from config)
+            enable_metrics: Collect runtime metrics even if disabled in config
+            components: Which of 'camera', 'ocr' and 'tts' to start (batch
+                mode needs no camera and runs OCR in worker processes)
         """
         self.config_path = config_path or self._get_default_config_path()
-        self.config = self._load_config()
+        with startup.step('load config'):
+            self.config = self._load_config()
+        self.metrics_server = None
+        self.metrics_reporter = None
+        self.capture_writer = None
+        self.memory = None
+        if self.config.get('memory_budget_mb') or self.config.get('memory_trace'):
+            self.memory = MemoryWatchdog(
+                budget_mb=self.config.get('memory_budget_mb', 0),
+                interval=self.config.get('memory_check_interval', 30),
+                trace=self.config.get('memory_trace', False),
+                exit_over_budget=self.config.get('memory_exit_over_budget', False)
+            ).start()
+        if enable_metrics or self.config.get('metrics_enabled', False):
+            self._start_metrics()
         
         # Initialize components
-        self.camera = PiCamera(resolution=self.config.get('camera_resolution', (1280, 720)))
-        self.ocr = OCR(
+        self.camera = self.ocr = self.tts = None
+        # Serializes camera access when pipeline workers capture bursts
+        self._camera_lock = threading.Lock()
+        if 'camera' in components:
+            with startup.step('init camera'):
+                self.camera = self._create_camera(camera_source or self.config.get('camera_source'))
+        if 'ocr' in components:
+            with startup.step('init ocr'):
+                self.ocr = OCR(**self._ocr_settings())
+                # Index word lists in the background while the rest starts up
+                self.ocr.preload_lexicons(self.config.get('ocr_language', 'fra+eng'))
+        if 'tts' in components:
+            with startup.step('init tts'):
+                self.tts = self._create_tts()
+        metrics.set_gauge('startup_seconds', round(startup.elapsed(), 3))
+        
+        logger.info("Reading Eye App initialized")
+
+    def _ocr_settings(self):
+        """OCR() keyword arguments from config"""
+        return dict(
             tesseract_cmd=self.config.get('tesseract_path'),
-            tessdata_prefix=self.config.get('tessdata_prefix')
+            tessdata_prefix=self.config.get('tessdata_prefix'),
+            backend=self.config.get('ocr_backend', 'auto'),
+            use_regions=self.config.get('ocr_regions', False),
+            region_workers=self.config.get('ocr_workers') or None,
+            auto_languages=self.config.get('ocr_auto_languages'),
+            cache_size=self.config.get('ocr_cache_size', 0),
+            cache_path=self._project_path(self.config.get('ocr_cache_path')),
+            preprocess=self.config.get('ocr_preprocess', True),
+            text_height=self.config.get('ocr_text_height', 20),
+            deskew=self.config.get('ocr_deskew', True),
+            binarize=self.config.get('ocr_binarize', True),
+            multipass=self.config.get('ocr_multipass', True),
+            escalate_confidence=self.config.get('ocr_escalate_confidence', 80),
+            fast_scale=self.config.get('ocr_fast_scale', 0.75),
+            lexicon_dir=self._project_path(self.config.get('ocr_lexicon_dir')),
+            lexicon_words=self.config.get('ocr_lexicon_words', 30000),
+            correction_confidence=self.config.get('ocr_correction_confidence', 0.6)
         )
-        self.tts = TTS(
+
+    def _create_tts(self):
+        """Create the TTS engine from config"""
+        return TTS(
             language=self.config.get('tts_language', 'fr'),
             rate=self.config.get('tts_rate', 150),
-            volume=self.config.get('tts_volume', 0.9)
+            volume=self.config.get('tts_volume', 0.9),
+            use_gtts=self.config.get('tts_use_gtts', False),
+            cache_dir=self._project_path(self.config.get('tts_cache_dir')),
+            cache_max_mb=self.config.get('tts_cache_max_mb', 50),
+            streaming=self.config.get('tts_streaming', True),
+            audio_sink=self.config.get('audio_sink', 'auto'),
+            queue_size=self.config.get('tts_queue_size', 4),
+            queue_policy=self.config.get('tts_queue_policy', 'drop_oldest'),
+            max_age=self.config.get('tts_max_age', 30.0)
         )
-        
-        logger.info("Reading Eye App initialized")
+
+    def _create_camera(self, source=None):
+        """Create the Pi camera, or a file-backed camera when a source is given"""
+        color_format = self.config.get('camera_format', 'yuv420')
+        frame_pool = 0
+        if self.config.get('camera_frame_pool', True):
+            # Frames alive at once: a burst, plus two per pipeline stage queue
+            frame_pool = (self.config.get('camera_burst_frames', 1)
+                          + 2 * (self.config.get('pipeline_queue_size', 2) + 1) + 2)
+        if source:
+            logger.info(f"Using file camera source: {source}")
+            return FileCamera(source, color_format=color_format, frame_pool=frame_pool)
+        return PiCamera(
+            resolution=self.config.get('camera_resolution', (1280, 720)),
+            color_format=color_format,
+            streaming=self.config.get('camera_streaming', False),
+            stream_resolution=self.config.get('camera_stream_resolution', (1280, 720)),
+            buffer_size=self.config.get('camera_buffer_size', 3),
+            frame_pool=frame_pool
+        )
+
+    def _start_metrics(self):
+        """Enable metric collection, the local endpoint and JSON log lines"""
+        metrics.enabled = True
+        self.metrics_server = start_server(
+            port=self.config.get('metrics_port'),
+            socket_path=self._project_path(self.config.get('metrics_socket'))
+        )
+        log_interval = self.config.get('metrics_log_interval', 60)
+        if log_interval:
+            self.metrics_reporter = JsonLogReporter(interval=log_interval).start()
+
+    @staticmethod
+    def _project_path(path):
+        """Resolve a config path relative to the project directory"""
+        if not path:
+            return None
+        path = Path(path)
+        if not path.is_absolute():
+            path = Path(__file__).parent.parent / path
+        return str(path)
 
     def _get_default_config_path(self):
         """Get default config file path"""
@@ -72,10 +195,74 @@ class ReadingEyeApp:
             'ocr_language': 'fra+eng',
             'tts_language': 'fr',
             'camera_resolution': [1920, 1080],
+            'camera_format': 'yuv420',
+            'camera_source': None,
+            'camera_streaming': False,
+            'camera_stream_resolution': [1280, 720],
+            'camera_buffer_size': 3,
+            'camera_still_confidence': 60,
+            'camera_frame_pool': True,
+            'camera_burst_frames': 1,
+            'camera_burst_method': 'mean',
+            'capture_dir': 'capture',
+            'capture_format': 'png',
+            'capture_quality': 90,
+            'capture_max_files': 500,
+            'capture_max_mb': 200,
+            'capture_max_age_hours': 168,
+            'capture_queue_size': 4,
             'tts_rate': 150,
             'tts_volume': 0.9,
+            'tts_use_gtts': False,
+            'tts_cache_dir': 'cache/tts',
+            'tts_cache_max_mb': 50,
+            'tts_streaming': True,
+            'audio_sink': 'auto',
+            'tts_queue_size': 4,
+            'tts_queue_policy': 'drop_oldest',
+            'tts_max_age': 30.0,
             'tesseract_path': '/usr/bin/tesseract',
-            'tessdata_prefix': '/usr/share/tesseract-ocr'
+            'tessdata_prefix': '/usr/share/tesseract-ocr',
+            'ocr_backend': 'auto',
+            'ocr_regions': False,
+            'ocr_workers': 0,
+            'ocr_auto_languages': ['fra', 'eng', 'ara'],
+            'ocr_cache_size': 256,
+            'ocr_cache_path': 'cache/ocr_cache.json',
+            'ocr_preprocess': True,
+            'ocr_text_height': 20,
+            'ocr_deskew': True,
+            'ocr_binarize': True,
+            'ocr_multipass': True,
+            'ocr_escalate_confidence': 80,
+            'ocr_fast_scale': 0.75,
+            'ocr_min_confidence': 40,
+            'ocr_lexicon_dir': None,
+            'ocr_lexicon_words': 30000,
+            'ocr_correction_confidence': 0.6,
+            'scene_gating': True,
+            'scene_change_threshold': 8.0,
+            'scene_settle_time': 1.0,
+            'speak_only_new': True,
+            'novelty_max_entries': 256,
+            'novelty_similarity': 0.85,
+            'adaptive_schedule': True,
+            'schedule_min_interval': 0.5,
+            'schedule_max_interval': 30.0,
+            'schedule_backoff': 1.5,
+            'pipeline_queue_size': 2,
+            'pipeline_drop_policy': 'drop_oldest',
+            'metrics_enabled': False,
+            'metrics_port': 9108,
+            'metrics_socket': None,
+            'metrics_log_interval': 60,
+            'daemon_socket': 'cache/reading_eye.sock',
+            'daemon_queue_size': 8,
+            'batch_workers': 0,
+            'memory_budget_mb': 0,
+            'memory_check_interval': 30,
+            'memory_trace': False,
+            'memory_exit_over_budget': False
         }
         
         try:
@@ -102,22 +289,16 @@ class ReadingEyeApp:
         logger.info("Capturing single frame...")
         
         # Capture
-        gray = self.camera.get_grayscale_frame()
+        start = time.perf_counter()
+        gray = self._capture_for_ocr()
         if gray is None:
             logger.error("Failed to capture frame")
             return False
+        timings = {'capture_ms': round(1000 * (time.perf_counter() - start), 2)}
         
-        # Save if requested
-        if save_image:
-            timestamp = time.strftime('%Y%m%d_%H%M%S')
-            capture_dir = Path(__file__).parent.parent / 'capture'
-            capture_dir.mkdir(exist_ok=True)
-            image_path = capture_dir / f'capture_{timestamp}.png'
-            self.camera.capture_with_save(str(image_path))
-        
-        # OCR
+        # OCR (the exact frame is saved in the background if requested)
         logger.info(f"Running OCR with language: {lang}")
-        text = self.ocr.extract_text_from_image(gray, lang=lang)
+        text = self._recognize(gray, lang, save_image=save_image, timings=timings)
         
         if text:
             logger.info("=== Detected Text ===")
@@ -133,18 +314,152 @@ class ReadingEyeApp:
         
         return True
 
-    def capture_loop(self, interval=5.0, lang=None, duration=None):
+    def recognize_frame(self, lang=None, save_image=False):
+        """
+        Capture one frame and OCR it without speaking (daemon requests)
+        
+        Args:
+            lang: OCR language (default from config)
+            save_image: Save captured image to disk
+        
+        Returns:
+            Dict with 'text', 'confidence', 'passes', 'language' (and
+            'image' when saved), or None if the capture failed
+        """
+        lang = lang or self.config.get('ocr_language', 'fra+eng')
+        start = time.perf_counter()
+        gray = self._capture_for_ocr()
+        if gray is None:
+            logger.error("Failed to capture frame")
+            return None
+        timings = {'capture_ms': round(1000 * (time.perf_counter() - start), 2)}
+        return self._recognize_result(gray, lang, save_image=save_image, timings=timings)
+
+    def _capture_for_ocr(self, first=None):
+        """
+        Frame to run OCR on: a single capture, or a fused burst of
+        camera_burst_frames captures when that is above 1
+        
+        Args:
+            first: Frame already captured (e.g. for scene detection) to start the burst with
+        
+        Returns:
+            Grayscale image or None
+        """
+        count = self.config.get('camera_burst_frames', 1)
+        with self._stage('capture'), self._camera_lock:
+            if count <= 1:
+                return first if first is not None else self.camera.get_grayscale_frame()
+            return self.camera.capture_burst(
+                count, method=self.config.get('camera_burst_method', 'mean'), first=first
+            )
+
+    def _capture_frame(self):
+        """Single grayscale capture, safe to call alongside burst captures"""
+        with self._stage('capture'), self._camera_lock:
+            return self.camera.get_grayscale_frame()
+
+    def _stage(self, name):
+        """Memory accounting for a stage when the watchdog is enabled"""
+        return self.memory.stage(name) if self.memory else nullcontext()
+
+    def _save_capture(self, gray, result, timings):
+        """
+        Queue the OCR'd frame and a sidecar with its result for the background writer
+        
+        Returns:
+            Path the image will be written to, or None if it was dropped
+        """
+        if self.capture_writer is None:
+            self.capture_writer = CaptureWriter(
+                self._project_path(self.config.get('capture_dir', 'capture')),
+                image_format=self.config.get('capture_format', 'png'),
+                quality=self.config.get('capture_quality', 90),
+                max_files=self.config.get('capture_max_files', 500),
+                max_mb=self.config.get('capture_max_mb', 200),
+                max_age_hours=self.config.get('capture_max_age_hours', 168),
+                queue_size=self.config.get('capture_queue_size', 4)
+            )
+        metadata = {key: result.get(key) for key in ('text', 'confidence', 'passes', 'language',
+                                                     'corrections')}
+        metadata['low_confidence'] = bool(result.get('low_confidence'))
+        metadata['timings'] = timings
+        return self.capture_writer.save(gray, metadata)
+
+    def run_batch(self, directory, output_path=None, lang=None, workers=None,
+                  audio_dir=None, resume=True):
+        """
+        OCR every image in a directory into a JSONL results file
+        
+        Args:
+            directory: Image directory (default: the capture_dir folder)
+            output_path: Results file (default: ocr_results.jsonl in directory)
+            lang: OCR language (default from config)
+            workers: OCR processes (default from config, 0 = one per core)
+            audio_dir: Render each page's text to an audio file here
+            resume: Skip images already present in the results file
+        """
+        directory = directory or str(self._project_path(self.config.get('capture_dir', 'capture')))
+        if not os.path.isdir(directory):
+            logger.error(f"Not a directory: {directory}")
+            return None
+        runner = BatchRunner(
+            ocr_settings=self._ocr_settings(),
+            lang=lang or self.config.get('ocr_language', 'fra+eng'),
+            workers=workers or self.config.get('batch_workers') or None,
+            tts=self.tts if audio_dir else None,
+            audio_dir=audio_dir,
+            min_confidence=self.config.get('ocr_min_confidence', 0)
+        )
+        try:
+            return runner.run(
+                directory,
+                output_path or os.path.join(directory, 'ocr_results.jsonl'),
+                resume=resume
+            )
+        except KeyboardInterrupt:
+            logger.info("Batch interrupted by user - rerun to resume")
+            return None
+        finally:
+            self.cleanup()
+
+    def run_daemon(self):
+        """Serve capture/read/speak requests over a Unix socket until stopped"""
+        daemon = ReadingEyeDaemon(
+            self,
+            socket_path=self._project_path(self.config.get('daemon_socket', 'cache/reading_eye.sock')),
+            queue_size=self.config.get('daemon_queue_size', 8)
+        )
+        # systemd stops services with SIGTERM
+        signal.signal(signal.SIGTERM, lambda signum, frame: daemon.shutdown())
+        
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Daemon interrupted by user")
+        except (OSError, RuntimeError) as e:
+            logger.error(f"Daemon error: {e}")
+        finally:
+            daemon.close()
+            self.cleanup()
+
+    def capture_loop(self, interval=5.0, lang=None, duration=None, save_image=False):
         """
         Continuous capture loop
         
         Args:
-            interval: Seconds between captures
+            interval: Target seconds between captures (adapted to scene
+                activity when adaptive scheduling is enabled)
             lang: OCR language (default from config)
             duration: Total duration in seconds (None = infinite)
+            save_image: Save every OCR'd frame (with its text) to disk
         """
         lang = lang or self.config.get('ocr_language', 'fra+eng')
         start_time = time.time()
         last_text = ""
+        scene = self._create_scene_detector()
+        novelty = self._create_novelty_filter()
+        scheduler = self._create_scheduler(interval)
         
         logger.info(f"Starting capture loop: interval={interval}s, duration={duration}s")
         
@@ -156,22 +471,37 @@ class ReadingEyeApp:
                     break
                 
                 # Capture and process
+                scheduler.start_cycle()
+                cycle_start = time.perf_counter()
                 gray = self.camera.get_grayscale_frame()
                 if gray is None:
                     logger.error("Capture failed, skipping")
-                    time.sleep(interval)
+                    scheduler.wait()
+                    continue
+                
+                # Skip OCR until the scene has changed and settled
+                if scene and not scene.update(gray):
+                    metrics.inc('frames_skipped')
+                    # Re-check sooner while a change is settling
+                    scheduler.report(changed=scene.pending)
+                    scheduler.wait()
                     continue
                 
-                # OCR
-                text = self.ocr.extract_text_from_image(gray, lang=lang)
+                # OCR (on a fused burst when enabled)
+                gray = self._capture_for_ocr(first=gray)
+                timings = {'capture_ms': round(1000 * (time.perf_counter() - cycle_start), 2)}
+                text = self._recognize(gray, lang, save_image=save_image, timings=timings)
                 
-                # Only speak if text changed
-                if text and text != last_text:
-                    logger.info(f"New text detected: {text[:100]}")
-                    self.tts.speak(text)
+                # Only speak what has not been read out yet
+                new_text = self._select_new_text(text, last_text, novelty)
+                if new_text:
+                    logger.info(f"New text detected: {new_text[:100]}")
+                    self.tts.speak(new_text)
                     last_text = text
                 
-                time.sleep(interval)
+                metrics.observe('cycle', time.perf_counter() - cycle_start)
+                scheduler.report(changed=bool(scene) or bool(new_text))
+                scheduler.wait()
         
         except KeyboardInterrupt:
             logger.info("Capture loop interrupted by user")
@@ -179,13 +509,218 @@ class ReadingEyeApp:
         finally:
             self.cleanup()
 
+    def capture_pipeline(self, interval=5.0, lang=None, duration=None, save_image=False):
+        """
+        Continuous capture with capture, preprocess, OCR and TTS running
+        concurrently in separate workers linked by bounded queues
+        
+        Args:
+            interval: Minimum seconds between captures
+            lang: OCR language (default from config)
+            duration: Total duration in seconds (None = infinite)
+            save_image: Save every OCR'd frame (with its text) to disk
+        """
+        lang = lang or self.config.get('ocr_language', 'fra+eng')
+        scene = self._create_scene_detector()
+        novelty = self._create_novelty_filter()
+        state = {'last_text': ""}
+
+        scheduler = self._create_scheduler(interval)
+
+        # As in capture_loop, the period only drops back to the fastest rate
+        # when the scene detector saw a change or new text was read; without a
+        # scene detector that is decided once a frame has been through OCR
+        def preprocess(gray):
+            # Drop frames until the scene has changed and settled
+            if scene:
+                settled = scene.update(gray)
+                scheduler.report(changed=settled or scene.pending)
+                if not settled:
+                    metrics.inc('frames_skipped')
+                    return None
+            return self._capture_for_ocr(first=gray)
+
+        def recognize(gray):
+            text = self._recognize(gray, lang, save_image=save_image)
+            if not text and not scene:
+                scheduler.report(changed=False)
+            return text or None
+
+        def speak(text):
+            new_text = self._select_new_text(text, state['last_text'], novelty)
+            if not scene:
+                scheduler.report(changed=bool(new_text))
+            if not new_text:
+                return None
+            logger.info(f"New text detected: {new_text[:100]}")
+            state['last_text'] = text
+            with self._stage('speech'):
+                utterance = self.tts.speak(new_text)
+                if utterance:
+                    utterance.wait(timeout=60)
+            return new_text
+
+        pipeline = Pipeline(
+            source=self._capture_frame,
+            stages=[('preprocess', preprocess), ('ocr', recognize), ('tts', speak)],
+            scheduler=scheduler,
+            queue_size=self.config.get('pipeline_queue_size', 2),
+            drop_policy=self.config.get('pipeline_drop_policy', 'drop_oldest')
+        )
+        
+        logger.info(f"Starting capture pipeline: interval={interval}s, duration={duration}s")
+        start_time = time.time()
+        
+        try:
+            pipeline.start()
+            while not duration or (time.time() - start_time) < duration:
+                time.sleep(0.5)
+            logger.info("Duration reached, stopping")
+        
+        except KeyboardInterrupt:
+            logger.info("Capture pipeline interrupted by user")
+        
+        finally:
+            pipeline.stop()
+            self.cleanup()
+
+    def prewarm_tts(self, phrases_path):
+        """
+        Render a phrase list into the TTS audio cache
+        
+        Args:
+            phrases_path: Text file with one phrase per line
+        """
+        try:
+            with open(phrases_path, 'r', encoding='utf-8') as f:
+                phrases = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            logger.error(f"Cannot read phrase list: {e}")
+            return False
+        
+        logger.info(f"Prewarming TTS cache with {len(phrases)} phrases...")
+        ready = self.tts.prewarm(phrases)
+        self.cleanup()
+        return ready == len(phrases)
+
+    def _recognize(self, gray, lang, save_image=False, timings=None):
+        """
+        Run OCR; in auto language mode, switch TTS to the detected language
+        
+        Returns:
+            Text to speak ('' when nothing was read or OCR is not confident enough)
+        """
+        return self._recognize_result(gray, lang, save_image, timings)['text']
+
+    def _recognize_result(self, gray, lang, save_image=False, timings=None):
+        """
+        OCR result dict; 'text' is emptied when confidence is below ocr_min_confidence
+        
+        Args:
+            gray: Frame to OCR
+            lang: OCR language
+            save_image: Queue the frame and its result for saving ('image' holds the path)
+            timings: Earlier stage timings (ms) to record in the saved sidecar
+        """
+        start = time.perf_counter()
+        with self._stage('ocr'):
+            result = self.ocr.extract_text_with_confidence(gray, lang=lang)
+        logger.debug(f"OCR confidence {result['confidence']} after {result['passes']} pass(es)")
+        
+        # Streamed frames are lower resolution: retry unsure text on a full-resolution still
+        still_confidence = self.config.get('camera_still_confidence', 0)
+        if (result['text'] and result['confidence'] < still_confidence
+                and self.camera is not None and self.camera.streaming):
+            with self._camera_lock:
+                still = self.camera.capture_still()
+            if still is not None:
+                detailed = self.ocr.extract_text_with_confidence(still, lang=lang)
+                logger.debug(f"Still OCR confidence {detailed['confidence']} (stream {result['confidence']})")
+                if detailed['confidence'] > result['confidence']:
+                    gray = still
+                    result = dict(detailed, passes=result['passes'] + detailed['passes'])
+        
+        min_confidence = self.config.get('ocr_min_confidence', 0)
+        if result['text'] and result['confidence'] < min_confidence:
+            logger.info(f"Low OCR confidence ({result['confidence']:.0f} < {min_confidence}), not speaking")
+            metrics.inc('frames_low_confidence')
+            result = dict(result, low_confidence=True)
+        
+        if save_image:
+            timings = dict(timings or {}, ocr_ms=round(1000 * (time.perf_counter() - start), 2))
+            image_path = self._save_capture(gray, result, timings)
+            if image_path:
+                result = dict(result, image=image_path)
+        if result.get('low_confidence'):
+            return dict(result, text="")
+        
+        if lang == 'auto':
+            tts_language = OCR.to_tts_language(self.ocr.last_language)
+            if tts_language and tts_language != self.tts.language:
+                self.tts.set_language(tts_language)
+        return result
+
+    @staticmethod
+    def _select_new_text(text, last_text, novelty):
+        """Part of text that should be spoken ('' if nothing is new)"""
+        if not text:
+            return ""
+        if novelty:
+            return novelty.filter(text)
+        return text if text != last_text else ""
+
+    def _create_novelty_filter(self):
+        """Create the speak-only-new filter, or None if disabled"""
+        if not self.config.get('speak_only_new', True):
+            return None
+        return NoveltyFilter(
+            max_entries=self.config.get('novelty_max_entries', 256),
+            similarity=self.config.get('novelty_similarity', 0.85)
+        )
+
+    def _create_scheduler(self, interval):
+        """Capture cadence: adaptive, or a fixed drift-free period"""
+        if not self.config.get('adaptive_schedule', True):
+            return AdaptiveScheduler(interval=interval, min_interval=interval, max_interval=interval)
+        return AdaptiveScheduler(
+            interval=interval,
+            min_interval=self.config.get('schedule_min_interval', 0.5),
+            max_interval=max(interval, self.config.get('schedule_max_interval', 30.0)),
+            backoff=self.config.get('schedule_backoff', 1.5)
+        )
+
+    def _create_scene_detector(self):
+        """Create the OCR gating detector, or None if gating is disabled"""
+        if not self.config.get('scene_gating', True):
+            return None
+        return SceneChangeDetector(
+            threshold=self.config.get('scene_change_threshold', 8.0),
+            settle_time=self.config.get('scene_settle_time', 1.0)
+        )
+
     def cleanup(self):
         """Clean up resources"""
         logger.info("Cleaning up...")
         if self.camera:
             self.camera.close()
+        if self.capture_writer:
+            # Finish writing queued captures
+            self.capture_writer.close()
+        if self.ocr:
+            if self.ocr.cache_stats():
+                logger.info(f"OCR cache: {self.ocr.cache_stats()}")
+            self.ocr.close()
         if self.tts:
+            if self.tts.audio_cache:
+                logger.info(f"TTS audio cache: {self.tts.audio_cache.stats()}")
             self.tts.stop()
+        if self.memory:
+            self.memory.stop()
+        if self.metrics_reporter:
+            self.metrics_reporter.stop()
+        if self.metrics_server:
+            self.metrics_server.shutdown()
+            self.metrics_server.server_close()
         logger.info("Cleanup complete")
 
 
@@ -207,6 +742,23 @@ def main():
         action='store_true',
         help='Continuous capture loop'
     )
+    mode_group.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Keep camera, OCR and TTS warm and serve requests from scripts/client.py'
+    )
+    mode_group.add_argument(
+        '--batch',
+        nargs='?',
+        const='',
+        metavar='DIR',
+        help='OCR all images in DIR (default: capture/) into a JSONL file and exit'
+    )
+    mode_group.add_argument(
+        '--prewarm',
+        metavar='PHRASES_FILE',
+        help='Render phrases (one per line) into the TTS audio cache and exit'
+    )
     
     # Options
     parser.add_argument(
@@ -222,18 +774,55 @@ def main():
     )
     parser.add_argument(
         '--lang',
-        default='fra+eng',
-        help='OCR language (eng, fra, ara, or combinations like eng+fra)'
+        help='OCR language (eng, fra, ara, combinations like eng+fra, or auto; '
+             'default from config)'
     )
     parser.add_argument(
         '--save-image',
         action='store_true',
-        help='Save captured images to disk'
+        help="Save each OCR'd frame and its text to the capture directory"
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Run loop mode as a concurrent capture/OCR/TTS pipeline'
+    )
+    parser.add_argument(
+        '--source',
+        help='Read frames from an image file or directory instead of the camera'
     )
     parser.add_argument(
         '--config',
         help='Path to configuration file'
     )
+    parser.add_argument(
+        '--output',
+        help='Batch mode: results file (default: DIR/ocr_results.jsonl)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Batch mode: OCR processes (default from config, 0 = one per core)'
+    )
+    parser.add_argument(
+        '--audio-dir',
+        help='Batch mode: also render each page to an audio file in this directory'
+    )
+    parser.add_argument(
+        '--no-resume',
+        action='store_true',
+        help='Batch mode: start a new results file instead of skipping finished images'
+    )
+    parser.add_argument(
+        '--metrics',
+        action='store_true',
+        help='Collect runtime metrics and serve them locally (see metrics_* config)'
+    )
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help='Log import and component init times (appended to logs/startup_profile.jsonl)'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -248,21 +837,56 @@ def main():
     
     try:
         # Initialize app
-        app = ReadingEyeApp(config_path=args.config)
+        components = ('camera', 'ocr', 'tts')
+        if args.batch is not None:
+            components = ('tts',) if args.audio_dir else ()
+        app = ReadingEyeApp(
+            config_path=args.config,
+            camera_source=args.source,
+            enable_metrics=args.metrics,
+            components=components
+        )
+        if args.profile_startup:
+            startup.report(LOG_DIR / 'startup_profile.jsonl')
         
         # Run
         if args.single:
             app.capture_single(lang=args.lang, save_image=args.save_image)
+        elif args.daemon:
+            app.run_daemon()
+        elif args.batch is not None:
+            app.run_batch(
+                args.batch or None,
+                output_path=args.output,
+                lang=args.lang,
+                workers=args.workers,
+                audio_dir=args.audio_dir,
+                resume=not args.no_resume
+            )
+        elif args.prewarm:
+            app.prewarm_tts(args.prewarm)
+        elif args.loop and args.pipeline:
+            app.capture_pipeline(
+                interval=args.interval,
+                lang=args.lang,
+                duration=args.duration,
+                save_image=args.save_image
+            )
         elif args.loop:
             app.capture_loop(
                 interval=args.interval,
                 lang=args.lang,
-                duration=args.duration
+                duration=args.duration,
+                save_image=args.save_image
             )
     
     except Exception as e:
         logger.error(f"Application error: {e}", exc_info=True)
         sys.exit(1)
+    
+    if app.memory and app.memory.exceeded:
+        # Non-zero so the service manager restarts the application
+        sys.exit(3)
 
 
 if __name__ == '__main__':
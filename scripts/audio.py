@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Audio Output for Reading Eye - Raspberry Pi
+- Long-lived output sink chosen once at startup
+- pygame mixer plays MP3/WAV from memory in-process (no player fork, no temp files)
+- Fallback: one long-lived command-line player fed raw PCM over stdin; WAV is
+  converted in-process, MP3 decoded by mpg123/ffmpeg (which never opens the
+  audio device), volume is applied to the samples, and the player is
+  restarted only if it dies
+- Null sink for benchmarks and machines without audio
+"""
+import io
+import os
+import time
+import wave
+import shutil
+import threading
+import subprocess
+import logging
+
+logger = logging.getLogger(__name__)
+
+AUDIO_SINKS = ('auto', 'pygame', 'process', 'null')
+
+# Fixed format of the long-lived player: 16-bit little-endian mono PCM
+PCM_RATE = 22050
+_PCM_BYTES_PER_SECOND = 2 * PCM_RATE
+# Bytes written per pipe write (about 0.1 s), so stop() takes effect quickly
+_WRITE_SIZE = 4096
+
+# Command-line players reading that format from stdin, in order of preference
+_PCM_PLAYERS = [
+    ('aplay', ['aplay', '-q', '-t', 'raw', '-f', 'S16_LE', '-c', '1', '-r', str(PCM_RATE), '-']),
+    ('paplay', ['paplay', '--raw', '--format=s16le', '--channels=1', f'--rate={PCM_RATE}']),
+    ('play', ['play', '-q', '-t', 'raw', '-e', 'signed', '-b', '16', '-c', '1',
+              '-r', str(PCM_RATE), '-']),  # SoX
+]
+
+# MP3 decoders writing the same PCM to stdout
+_MP3_DECODERS = [
+    ('mpg123', ['mpg123', '-q', '-m', '-r', str(PCM_RATE), '-e', 's16', '-s', '-']),
+    ('ffmpeg', ['ffmpeg', '-loglevel', 'quiet', '-i', 'pipe:0', '-f', 's16le',
+                '-ac', '1', '-ar', str(PCM_RATE), 'pipe:1']),
+]
+
+
+def _format_of(path):
+    """Audio format from a file extension"""
+    return 'wav' if path.lower().endswith('.wav') else 'mp3'
+
+
+def wav_to_pcm(data):
+    """
+    Convert WAV data to the player's PCM format (16-bit mono at PCM_RATE)
+
+    Args:
+        data: Bytes of an 8, 16 or 32-bit PCM WAV file
+
+    Returns:
+        Raw PCM bytes
+    """
+    import numpy as np
+    with wave.open(io.BytesIO(data)) as wav:
+        channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+    if width == 1:
+        samples = (np.frombuffer(frames, np.uint8).astype(np.int16) - 128) << 8
+    elif width == 2:
+        samples = np.frombuffer(frames, '<i2')
+    elif width == 4:
+        samples = (np.frombuffer(frames, '<i4') >> 16).astype(np.int16)
+    else:
+        raise ValueError(f"unsupported {8 * width}-bit WAV")
+    samples = samples[:len(samples) - len(samples) % channels]
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if rate != PCM_RATE and len(samples):
+        positions = np.arange(0, len(samples) - 1, rate / float(PCM_RATE))
+        samples = np.interp(positions, np.arange(len(samples)), samples)
+    return np.asarray(samples).astype('<i2').tobytes()
+
+
+def scale_pcm(pcm, volume):
+    """
+    Apply a volume (0.0-1.0) to 16-bit PCM
+
+    Args:
+        pcm: Raw 16-bit little-endian samples
+        volume: Gain; 1.0 returns the data unchanged
+
+    Returns:
+        Raw PCM bytes
+    """
+    import numpy as np
+    volume = min(max(float(volume), 0.0), 1.0)
+    if volume == 1.0:
+        return pcm
+    samples = np.frombuffer(pcm[:len(pcm) - len(pcm) % 2], '<i2')
+    return (samples * volume).astype('<i2').tobytes()
+
+
+class NullSink:
+    """Discards audio (benchmarks, headless tests)"""
+
+    name = 'null'
+
+    def play_bytes(self, data, fmt='mp3'):
+        """Pretend to play in-memory audio"""
+        return True
+
+    def play_file(self, path):
+        """Pretend to play an audio file"""
+        return True
+
+    def set_volume(self, volume):
+        """No output to adjust"""
+
+    def stop(self):
+        """Nothing is ever playing"""
+
+    def close(self):
+        """Nothing to release"""
+
+
+class PygameSink:
+    """In-process playback through a single pygame mixer"""
+
+    name = 'pygame'
+
+    def __init__(self, volume=1.0):
+        """
+        Initialize the mixer once
+
+        Args:
+            volume: Playback volume (0.0-1.0)
+        """
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+        import pygame
+        self._pygame = pygame
+        pygame.mixer.init()
+        pygame.mixer.music.set_volume(volume)
+        self._stopped = threading.Event()
+
+    def _wait(self):
+        """Block until playback finishes or stop() is called"""
+        music = self._pygame.mixer.music
+        while music.get_busy() and not self._stopped.is_set():
+            time.sleep(0.02)
+
+    def play_bytes(self, data, fmt='mp3'):
+        """Decode and play in-memory MP3/WAV data"""
+        self._stopped.clear()
+        self._pygame.mixer.music.load(io.BytesIO(data), fmt)
+        self._pygame.mixer.music.play()
+        self._wait()
+        return True
+
+    def play_file(self, path):
+        """Play an audio file"""
+        self._stopped.clear()
+        self._pygame.mixer.music.load(path)
+        self._pygame.mixer.music.play()
+        self._wait()
+        return True
+
+    def set_volume(self, volume):
+        """Change playback volume"""
+        self._pygame.mixer.music.set_volume(volume)
+
+    def stop(self):
+        """Interrupt current playback"""
+        self._stopped.set()
+        self._pygame.mixer.music.stop()
+
+    def close(self):
+        """Shut down the mixer"""
+        try:
+            self._pygame.mixer.quit()
+        except Exception as e:
+            logger.error(f"Mixer close error: {e}")
+
+
+class ProcessSink:
+    """
+    One command-line player kept running and fed raw PCM over stdin
+
+    The player opens the audio device once; play_bytes() writes the decoded
+    samples and blocks until they have had time to play.
+    """
+
+    name = 'process'
+
+    def __init__(self, volume=1.0):
+        """
+        Detect the PCM player and MP3 decoder once
+
+        Args:
+            volume: Playback volume (0.0-1.0), applied to the samples
+        """
+        self.volume = volume
+        self.command = next((command for binary, command in _PCM_PLAYERS if shutil.which(binary)), None)
+        self.decoder = next((command for binary, command in _MP3_DECODERS if shutil.which(binary)), None)
+        if self.command is None:
+            raise RuntimeError("no audio player found")
+        self._process = None
+        # Monotonic time at which everything written so far has been played
+        self._playing_until = 0.0
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    def _player(self):
+        """The running player, (re)started if it is not running"""
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                if self._process is not None:
+                    logger.warning(f"Audio player exited ({self._process.returncode}), restarting")
+                self._process = subprocess.Popen(
+                    self.command,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                self._playing_until = 0.0
+            return self._process
+
+    def _to_pcm(self, data, fmt):
+        """Decode MP3/WAV data to the player's PCM format, at the sink volume"""
+        if fmt == 'wav':
+            return scale_pcm(wav_to_pcm(data), self.volume)
+        if self.decoder is None:
+            raise ValueError("no MP3 decoder installed (mpg123 or ffmpeg)")
+        result = subprocess.run(self.decoder, input=data, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, timeout=60, check=True)
+        return scale_pcm(result.stdout, self.volume)
+
+    def play_bytes(self, data, fmt='mp3'):
+        """Decode in-memory audio and play it through the running player"""
+        try:
+            pcm = self._to_pcm(data, fmt)
+        except (ValueError, EOFError, wave.Error, OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"Cannot decode {fmt} audio: {e}")
+            return False
+
+        self._stopped.clear()
+        process = self._player()
+        start = max(time.monotonic(), self._playing_until)
+        self._playing_until = start + len(pcm) / float(_PCM_BYTES_PER_SECOND)
+        try:
+            for offset in range(0, len(pcm), _WRITE_SIZE):
+                if self._stopped.is_set():
+                    return False
+                process.stdin.write(pcm[offset:offset + _WRITE_SIZE])
+            process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError):
+            # Stopped, or the player died; the next call starts a new one
+            return False
+
+        # The pipe and device buffers still hold the end of the audio
+        remaining = self._playing_until - time.monotonic()
+        if remaining > 0 and self._stopped.wait(remaining):
+            return False
+        return True
+
+    def play_file(self, path):
+        """Play an audio file"""
+        with open(path, 'rb') as f:
+            return self.play_bytes(f.read(), _format_of(path))
+
+    def set_volume(self, volume):
+        """Change playback volume (from the next utterance)"""
+        self.volume = volume
+
+    def stop(self):
+        """Interrupt current playback (buffered audio is dropped with the player)"""
+        self._stopped.set()
+        with self._lock:
+            process, self._process = self._process, None
+            self._playing_until = 0.0
+        if process and process.poll() is None:
+            process.terminate()
+
+    def close(self):
+        """Stop the player"""
+        self.stop()
+
+
+def create_sink(name='auto', volume=1.0):
+    """
+    Create the audio sink once at startup
+
+    Args:
+        name: 'auto', 'pygame', 'process' or 'null'
+        volume: Playback volume (0.0-1.0)
+
+    Returns:
+        Sink instance (NullSink if no audio output is available)
+    """
+    name = (name or 'auto').lower()
+    if name not in AUDIO_SINKS:
+        logger.warning(f"Unknown audio sink '{name}', using auto")
+        name = 'auto'
+    if name == 'null':
+        return NullSink()
+
+    if name in ('auto', 'pygame'):
+        try:
+            sink = PygameSink(volume=volume)
+            logger.info("Audio output: pygame mixer")
+            return sink
+        except Exception as e:
+            logger.warning(f"pygame audio unavailable: {e}")
+
+    try:
+        sink = ProcessSink(volume=volume)
+        logger.info(f"Audio output: {' '.join(sink.command)}")
+        return sink
+    except RuntimeError as e:
+        logger.warning(f"Audio output unavailable: {e}")
+    return NullSink()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Batch OCR for Reading Eye - Raspberry Pi
+- Walks a directory of images (e.g. the capture/ folder written by --save-image)
+- OCR runs across a process pool, one OCR engine per worker process
+- Results stream to a JSONL file as they complete; reruns skip finished pages
+- Optional per-page audio files rendered through the TTS layer
+"""
+import os
+import json
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+try:
+    from .camera import IMAGE_EXTENSIONS
+    from .ocr import OCR
+except ImportError:
+    from camera import IMAGE_EXTENSIONS
+    from ocr import OCR
+
+logger = logging.getLogger(__name__)
+
+
+def find_images(directory):
+    """
+    All images below a directory, in path order
+
+    Args:
+        directory: Directory to walk (recursively)
+
+    Returns:
+        List of absolute image paths
+    """
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                paths.append(os.path.abspath(os.path.join(root, name)))
+    return sorted(paths)
+
+
+def load_finished(output_path):
+    """Image paths already recorded without error in a results file"""
+    finished = set()
+    if not os.path.exists(output_path):
+        return finished
+    with open(output_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Truncated last line from an interrupted run
+                continue
+            if not record.get('error'):
+                finished.add(record.get('path'))
+    return finished
+
+
+# Per-process OCR engine used by the batch pool
+_worker_ocr = None
+
+
+def _init_batch_worker(ocr_settings, lang):
+    """Process pool initializer - one OCR engine per worker"""
+    global _worker_ocr
+    _worker_ocr = OCR(**ocr_settings)
+    # Every page should get the same post-correction, including the first ones
+    _worker_ocr.preload_lexicons(lang, wait=True)
+
+
+def _ocr_page(path, lang):
+    """Process pool task - OCR one image file"""
+    import cv2
+    record = {'path': path}
+    try:
+        start = time.perf_counter()
+        gray = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+        loaded = time.perf_counter()
+        if gray is None:
+            record['error'] = 'unreadable image'
+            return record
+        result = _worker_ocr.extract_text_with_confidence(gray, lang=lang)
+        done = time.perf_counter()
+        if result.get('error'):
+            # The engine itself failed; a blank page is recorded with empty text
+            record['error'] = f"OCR failed: {result['error']}"
+            return record
+        record.update(
+            language=result['language'],
+            text=result['text'],
+            confidence=result['confidence'],
+            passes=result['passes'],
+            corrections=result['corrections'],
+            timings={'read_ms': round(1000 * (loaded - start), 2),
+                     'ocr_ms': round(1000 * (done - loaded), 2)}
+        )
+    except Exception as e:
+        record['error'] = str(e)
+    return record
+
+
+class BatchRunner:
+    """OCR a directory of images into a JSONL results file"""
+
+    def __init__(self, ocr_settings, lang, workers=None, tts=None, audio_dir=None,
+                 min_confidence=0):
+        """
+        Initialize runner
+
+        Args:
+            ocr_settings: Keyword arguments for OCR() in each worker
+            lang: OCR language
+            workers: Process pool size (None = one per CPU core)
+            tts: TTS instance for per-page audio (None = no audio)
+            audio_dir: Directory for per-page audio files
+            min_confidence: Pages below this OCR confidence get no audio
+        """
+        # The pool already uses every core; no nested pools or shared cache files
+        self.ocr_settings = dict(ocr_settings, region_workers=1, cache_size=0, cache_path=None)
+        self.lang = lang
+        self.workers = workers or os.cpu_count() or 1
+        self.tts = tts
+        self.audio_dir = audio_dir
+        self.min_confidence = min_confidence
+
+    def run(self, directory, output_path, resume=True):
+        """
+        Process every image below directory
+
+        Args:
+            directory: Image directory
+            output_path: JSONL results file (appended to)
+            resume: Skip images already in output_path; otherwise start a new file
+
+        Returns:
+            Summary dict (pages, skipped, failed, elapsed_s, pages_per_s)
+        """
+        images = find_images(directory)
+        finished = load_finished(output_path) if resume else set()
+        todo = [path for path in images if path not in finished]
+        logger.info(f"Batch: {len(images)} images, {len(images) - len(todo)} already done, "
+                    f"{len(todo)} to process with {self.workers} workers")
+        if self.audio_dir:
+            os.makedirs(self.audio_dir, exist_ok=True)
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(output_dir, exist_ok=True)
+
+        summary = {'pages': 0, 'skipped': len(images) - len(todo), 'failed': 0}
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_batch_worker,
+                                 initargs=(self.ocr_settings, self.lang)) as pool, \
+                open(output_path, 'a' if resume else 'w', encoding='utf-8') as out:
+            pending = set()
+            for path in todo:
+                pending.add(pool.submit(_ocr_page, path, self.lang))
+                # Keep a couple of pages per worker in flight, write the rest as they finish
+                if len(pending) >= 2 * self.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    self._write_results(done, directory, out, summary)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                self._write_results(done, directory, out, summary)
+
+        elapsed = time.perf_counter() - started
+        summary['elapsed_s'] = round(elapsed, 2)
+        summary['pages_per_s'] = round(summary['pages'] / elapsed, 3) if elapsed and summary['pages'] else 0.0
+        logger.info(f"Batch complete: {summary}")
+        return summary
+
+    def _write_results(self, futures, directory, out, summary):
+        """Add audio (optional) and append each finished record to the results file"""
+        for future in futures:
+            record = future.result()
+            if record.get('error'):
+                summary['failed'] += 1
+                logger.warning(f"Batch: {record['path']}: {record['error']}")
+            else:
+                summary['pages'] += 1
+                if self.tts is not None:
+                    self._render_audio(record, directory)
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            out.flush()
+
+    def _render_audio(self, record, directory):
+        """Render a page's text to an audio file next to the other pages"""
+        if not record['text'] or record['confidence'] < self.min_confidence:
+            return
+        tts_language = OCR.to_tts_language(record['language'])
+        if tts_language and tts_language != self.tts.language:
+            self.tts.set_language(tts_language)
+        name = os.path.splitext(os.path.relpath(record['path'], directory))[0].replace(os.sep, '_')
+        start = time.perf_counter()
+        path = self.tts.render_to_file(record['text'], os.path.join(self.audio_dir, name))
+        if path:
+            record['audio'] = path
+            record['timings']['audio_ms'] = round(1000 * (time.perf_counter() - start), 2)
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmark for Reading Eye - camera -> OCR -> TTS
+- Renders synthetic French, English and Arabic text images
+  (several font sizes, noise levels and skews)
+- Replays them through a file-backed camera, OCR and TTS with a null audio sink
+- OCR and TTS use the settings of the app's config file (as shipped, unless
+  overridden on the command line); speech is synthesized into memory, so the
+  TTS stage times synthesis, not an audio device
+- Reports per-stage latency percentiles, throughput and character accuracy as JSON
+- Runs on a plain Linux box, no camera or speaker needed
+
+Usage:
+    python3 benchmark.py --output bench.json
+    python3 benchmark.py --compare bench.json      # diff against a previous run
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+from camera import FileCamera
+from ocr import OCR
+
+logger = logging.getLogger(__name__)
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG = os.path.join(PROJECT_DIR, 'config', 'reading_eye_config.json')
+
+SAMPLE_TEXTS = {
+    'fra': [
+        "Sortie de secours au fond du couloir",
+        "Prendre deux comprimés par jour après le repas",
+        "La pharmacie est ouverte du lundi au samedi",
+    ],
+    'eng': [
+        "Emergency exit at the end of the corridor",
+        "Take two tablets a day after meals",
+        "The pharmacy is open Monday to Saturday",
+    ],
+    'ara': [
+        "مخرج الطوارئ في نهاية الممر",
+        "تناول قرصين يوميا بعد الأكل",
+        "الصيدلية مفتوحة من الاثنين إلى السبت",
+    ],
+}
+
+FONT_CANDIDATES = [
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/usr/share/fonts/dejavu/DejaVuSans.ttf',
+    '/usr/share/fonts/truetype/freefont/FreeSans.ttf',
+    '/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf',
+]
+
+
+def find_font(path=None):
+    """Return a TrueType font path (covering Latin and Arabic), or None"""
+    for candidate in ([path] if path else []) + FONT_CANDIDATES:
+        if candidate and os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def render_text_image(text, font_path, font_size, size=(1280, 720), noise=0.0, skew=0.0,
+                      rtl=False):
+    """
+    Render text on a white page
+
+    Args:
+        text: Text to draw
+        font_path: TrueType font file
+        font_size: Font size in pixels
+        size: Image (width, height)
+        noise: Standard deviation of added Gaussian noise (0-255 scale)
+        skew: Rotation in degrees
+        rtl: Right-to-left text (needs Pillow built with libraqm)
+
+    Returns:
+        BGR image
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    width, height = size
+    layout = ImageFont.Layout.RAQM if rtl else ImageFont.Layout.BASIC
+    font = ImageFont.truetype(font_path, font_size, layout_engine=layout)
+    page = Image.new('L', size, 255)
+    draw = ImageDraw.Draw(page)
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    x = max(10, (width - (right - left)) // 2)
+    y = max(10, (height - (bottom - top)) // 2)
+    draw.text((x, y), text, fill=0, font=font)
+
+    gray = np.array(page)
+    if skew:
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), skew, 1.0)
+        gray = cv2.warpAffine(gray, matrix, size, borderValue=255)
+    if noise:
+        rng = np.random.default_rng(0)
+        gray = np.clip(gray + rng.normal(0, noise, gray.shape), 0, 255).astype(np.uint8)
+    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+
+def character_accuracy(reference, hypothesis):
+    """1 - normalized Levenshtein distance between whitespace-normalized strings"""
+    reference = ' '.join(reference.split())
+    hypothesis = ' '.join(hypothesis.split())
+    if not reference:
+        return 1.0 if not hypothesis else 0.0
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_char in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_char in enumerate(hypothesis, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_char != hyp_char)
+            ))
+        previous = current
+    return max(0.0, 1.0 - previous[-1] / float(len(reference)))
+
+
+def percentiles(values):
+    """Latency summary in milliseconds"""
+    if not values:
+        return None
+    ordered = sorted(values)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+    return {
+        'count': len(ordered),
+        'mean_ms': round(1000 * sum(ordered) / len(ordered), 2),
+        'p50_ms': round(1000 * pick(0.50), 2),
+        'p90_ms': round(1000 * pick(0.90), 2),
+        'p99_ms': round(1000 * pick(0.99), 2),
+        'max_ms': round(1000 * ordered[-1], 2),
+    }
+
+
+def build_cases(args, font_path):
+    """List of benchmark cases (language, text, font size, noise, skew)"""
+    rtl_supported = False
+    try:
+        from PIL import features
+        rtl_supported = features.check('raqm')
+    except Exception:
+        pass
+
+    cases = []
+    for language in args.languages:
+        if language == 'ara' and not rtl_supported:
+            logger.warning("Pillow has no libraqm - Arabic cannot be shaped, skipping 'ara'")
+            continue
+        for text in SAMPLE_TEXTS[language]:
+            for font_size in args.sizes:
+                for noise in args.noise:
+                    for skew in args.skew:
+                        cases.append({
+                            'language': language,
+                            'text': text,
+                            'font_size': font_size,
+                            'noise': noise,
+                            'skew': skew,
+                        })
+    return cases
+
+
+def load_config(path):
+    """App settings from a JSON config file (empty if it cannot be read)"""
+    if not path:
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Cannot read config {path}: {e}, using built-in OCR settings")
+        return {}
+
+
+def ocr_settings(args, config):
+    """
+    OCR() keyword arguments: the app's config (same defaults as the app),
+    with command-line flags taking precedence
+
+    The result cache stays off so every frame is really recognized.
+    """
+    def pick(value, key, default):
+        return config.get(key, default) if value is None else value
+
+    lexicon_dir = args.lexicon_dir or config.get('ocr_lexicon_dir')
+    if lexicon_dir and not os.path.isabs(lexicon_dir):
+        lexicon_dir = os.path.join(PROJECT_DIR, lexicon_dir)
+    return dict(
+        backend=pick(args.backend, 'ocr_backend', 'auto'),
+        use_regions=pick(args.regions, 'ocr_regions', False),
+        region_workers=config.get('ocr_workers') or None,
+        auto_languages=config.get('ocr_auto_languages'),
+        preprocess=pick(args.preprocess, 'ocr_preprocess', True),
+        text_height=config.get('ocr_text_height', 20),
+        deskew=config.get('ocr_deskew', True),
+        binarize=config.get('ocr_binarize', True),
+        multipass=pick(args.multipass, 'ocr_multipass', True),
+        escalate_confidence=config.get('ocr_escalate_confidence', 80),
+        fast_scale=config.get('ocr_fast_scale', 0.75),
+        lexicon_dir=lexicon_dir,
+        lexicon_words=config.get('ocr_lexicon_words', 30000),
+        correction_confidence=config.get('ocr_correction_confidence', 0.6),
+    )
+
+
+def git_commit():
+    """Current commit hash, if run inside the git checkout"""
+    try:
+        res = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        return res.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run_benchmark(args):
+    """Render the cases, run them through the pipeline and return the report"""
+    font_path = find_font(args.font)
+    if not font_path:
+        raise RuntimeError("No TrueType font found - pass one with --font")
+
+    cases = build_cases(args, font_path)
+    if not cases:
+        raise RuntimeError("No benchmark cases to run")
+
+    workdir = tempfile.mkdtemp(prefix='reading_eye_bench_')
+    try:
+        for index, case in enumerate(cases):
+            image = render_text_image(
+                case['text'], font_path, case['font_size'],
+                size=tuple(args.resolution), noise=case['noise'], skew=case['skew'],
+                rtl=case['language'] == 'ara'
+            )
+            cv2.imwrite(os.path.join(workdir, f'{index:04d}.png'), image)
+
+        camera = FileCamera(workdir, color_format=args.camera_format, frame_repeat=args.burst,
+                            noise=args.sensor_noise, jitter=args.jitter)
+        config = load_config(args.config)
+        settings = ocr_settings(args, config)
+        ocr = OCR(**settings)
+        streaming = config.get('tts_streaming', False) if args.streaming is None else args.streaming
+        tts = None
+        if not args.no_tts:
+            from tts import TTS
+            # No speech cache: every utterance is synthesized, then discarded by the null sink
+            tts = TTS(language='fr', rate=config.get('tts_rate', 150), audio_sink='null',
+                      streaming=streaming)
+
+        timings = {'capture': [], 'ocr': [], 'tts': [], 'total': []}
+        by_language = {}
+        samples = []
+
+        # Warm-up: first OCR call loads models (and word lists), keep it out of the numbers
+        for language in {case['language'] for case in cases}:
+            ocr.preload_lexicons(language, wait=True)
+        warmup = cv2.imread(os.path.join(workdir, '0000.png'), cv2.IMREAD_GRAYSCALE)
+        ocr.extract_text_from_image(warmup, lang=cases[0]['language'])
+
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            for case in cases:
+                t0 = time.perf_counter()
+                if args.burst > 1:
+                    gray = camera.capture_burst(args.burst, method=args.burst_method)
+                else:
+                    gray = camera.get_grayscale_frame()
+                t1 = time.perf_counter()
+                lang = 'auto' if args.auto_language else case['language']
+                result = ocr.extract_text_with_confidence(gray, lang=lang)
+                text = result['text']
+                t2 = time.perf_counter()
+                if tts and text:
+                    tts.set_language(OCR.to_tts_language(ocr.last_language or case['language']))
+                    utterance = tts.speak(text)
+                    if utterance:
+                        utterance.wait(timeout=60)
+                t3 = time.perf_counter()
+
+                accuracy = character_accuracy(case['text'], text)
+                timings['capture'].append(t1 - t0)
+                timings['ocr'].append(t2 - t1)
+                if tts and text:
+                    timings['tts'].append(t3 - t2)
+                timings['total'].append(t3 - t0)
+                by_language.setdefault(case['language'], []).append(accuracy)
+                samples.append(dict(case, recognized=text, accuracy=round(accuracy, 4),
+                                    confidence=result['confidence'], passes=result['passes'],
+                                    corrections=len(result['corrections']),
+                                    ocr_ms=round(1000 * (t2 - t1), 2)))
+        elapsed = time.perf_counter() - started
+
+        ocr.close()
+        camera.close()
+        if tts:
+            tts.stop()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    all_accuracy = [s['accuracy'] for s in samples]
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'backend': ocr.backend.name,
+            'config': args.config,
+            'regions': settings['use_regions'],
+            'preprocess': settings['preprocess'],
+            'multipass': settings['multipass'],
+            'lexicon_dir': settings['lexicon_dir'],
+            'auto_language': args.auto_language,
+            'camera_format': args.camera_format,
+            'burst': args.burst,
+            'burst_method': args.burst_method,
+            'sensor_noise': args.sensor_noise,
+            'jitter': args.jitter,
+            'resolution': list(args.resolution),
+            'tts': not args.no_tts,
+            'tts_streaming': streaming,
+        },
+        'frames': len(samples),
+        'elapsed_s': round(elapsed, 3),
+        'throughput_fps': round(len(samples) / elapsed, 3) if elapsed else None,
+        'latency': {stage: percentiles(values) for stage, values in timings.items()},
+        'ocr_passes_mean': round(sum(s['passes'] for s in samples) / len(samples), 3),
+        'accuracy': {
+            'overall': round(sum(all_accuracy) / len(all_accuracy), 4),
+            'by_language': {
+                lang: round(sum(values) / len(values), 4) for lang, values in by_language.items()
+            },
+        },
+    }
+    if args.details:
+        report['samples'] = samples
+    return report
+
+
+def compare_reports(current, baseline):
+    """Relative change of the headline metrics against a previous report"""
+    def delta(new, old):
+        if new is None or old in (None, 0):
+            return None
+        return round((new - old) / old * 100.0, 1)
+
+    result = {
+        'baseline_commit': baseline.get('meta', {}).get('commit'),
+        'throughput_fps_pct': delta(current.get('throughput_fps'), baseline.get('throughput_fps')),
+        'accuracy_overall_diff': round(
+            current['accuracy']['overall'] - baseline.get('accuracy', {}).get('overall', 0.0), 4
+        ),
+        'latency_p50_pct': {},
+    }
+    for stage, stats in current['latency'].items():
+        old = (baseline.get('latency') or {}).get(stage)
+        if stats and old:
+            result['latency_p50_pct'][stage] = delta(stats['p50_ms'], old['p50_ms'])
+    return result
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(
+        description='Reading Eye - offline camera/OCR/TTS benchmark'
+    )
+    parser.add_argument('--languages', nargs='+', default=['fra', 'eng', 'ara'],
+                        choices=sorted(SAMPLE_TEXTS), help='Languages to render')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[20, 32, 48],
+                        help='Font sizes in pixels')
+    parser.add_argument('--noise', nargs='+', type=float, default=[0.0, 12.0],
+                        help='Gaussian noise levels (0-255 scale)')
+    parser.add_argument('--skew', nargs='+', type=float, default=[0.0, 3.0],
+                        help='Rotation angles in degrees')
+    parser.add_argument('--resolution', nargs=2, type=int, default=[1280, 720],
+                        metavar=('WIDTH', 'HEIGHT'), help='Rendered frame size')
+    parser.add_argument('--repeat', type=int, default=1, help='Passes over all cases')
+    parser.add_argument('--config', default=DEFAULT_CONFIG,
+                        help='App config to take OCR/TTS settings from (default: the shipped one)')
+    parser.add_argument('--backend', help='OCR backend (default from config)')
+    parser.add_argument('--regions', action=argparse.BooleanOptionalAction,
+                        help='Use text-region OCR (default from config)')
+    parser.add_argument('--preprocess', action=argparse.BooleanOptionalAction,
+                        help='Normalize glyph height, deskew and binarize before OCR '
+                             '(default from config)')
+    parser.add_argument('--multipass', action=argparse.BooleanOptionalAction,
+                        help='Fast first OCR pass, escalating only low-confidence frames '
+                             '(default from config)')
+    parser.add_argument('--lexicon-dir',
+                        help='Word lists for lexicon post-correction (default: ocr_lexicon_dir)')
+    parser.add_argument('--auto-language', action='store_true',
+                        help="OCR with lang='auto' instead of the known language")
+    parser.add_argument('--burst', type=int, default=1,
+                        help='Frames fused per OCR call (1 = no burst)')
+    parser.add_argument('--burst-method', default='mean', choices=['mean', 'sharpest'])
+    parser.add_argument('--sensor-noise', type=float, default=0.0,
+                        help='Gaussian noise sigma added to every captured frame')
+    parser.add_argument('--jitter', type=int, default=0,
+                        help='Random per-frame shift in pixels (hand shake)')
+    parser.add_argument('--camera-format', default='yuv420', choices=['rgb', 'yuv420'])
+    parser.add_argument('--no-tts', action='store_true', help='Skip the TTS stage')
+    parser.add_argument('--streaming', action=argparse.BooleanOptionalAction,
+                        help='Streaming TTS (default from config)')
+    parser.add_argument('--font', help='TrueType font to render with')
+    parser.add_argument('--details', action='store_true', help='Include per-sample results')
+    parser.add_argument('--output', help='Write the JSON report to this file')
+    parser.add_argument('--compare', help='Previous JSON report to compare against')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stderr
+    )
+
+    try:
+        report = run_benchmark(args)
+        if args.compare:
+            with open(args.compare, 'r', encoding='utf-8') as f:
+                report['comparison'] = compare_reports(report, json.load(f))
+    except Exception as e:
+        logger.error(f"Benchmark error: {e}")
+        sys.exit(1)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Result Caches for Reading Eye - Raspberry Pi
+- OCR results keyed by a perceptual fingerprint + language + config, so a
+  noisy recapture of the same page hits while a different page misses
+- Bounded size with LRU eviction and optional JSON persistence
+- Synthesized speech stored on disk, keyed by text + voice settings
+"""
+import os
+import json
+import time
+import zlib
+import base64
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# Persisted OCR cache layout; files written with another version are ignored
+OCR_CACHE_VERSION = 3
+
+
+def hamming_distance(a, b):
+    """Number of differing bits between two hashes"""
+    return bin(a ^ b).count('1')
+
+
+def _median(values):
+    """Median of non-negative small integers (a histogram beats sorting)"""
+    import numpy as np
+    counts = np.cumsum(np.bincount(values))
+    return int(np.searchsorted(counts, values.size // 2, side='right'))
+
+
+def thumbnail_difference(a, b, max_noise=12.0):
+    """
+    Largest pixel difference between two thumbnails, in units of their noise
+
+    A uniform exposure shift is removed first and the sensor noise is
+    estimated from the median deviation, so two captures of one page score
+    a few units while a single changed word or digit stands out far above
+    the noise (a mean difference would average it away).
+
+    Args:
+        a, b: uint8 thumbnails
+        max_noise: Typical difference (gray levels) above which the frames
+            are different images rather than noisy captures of one
+
+    Returns:
+        Score (inf when the thumbnails differ in shape or overall)
+    """
+    import numpy as np
+    if a.shape != b.shape:
+        return float('inf')
+    diff = a.astype(np.int16) - b
+    # Medians of a quarter of the pixels are plenty
+    sample = diff[::2, ::2].ravel()
+    offset = _median(sample + 255) - 255
+    noise = 1.4826 * _median(np.abs(sample - offset))
+    if noise > max_noise:
+        return float('inf')
+    return float(np.abs(diff - offset).max()) / (noise + 1.0)
+
+
+class OCRCache:
+    """LRU cache of OCR results addressed by image fingerprint"""
+
+    def __init__(self, max_entries=256, path=None, save_every=20,
+                 max_distance=32, max_difference=6.0):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum number of cached results
+            path: JSON file to persist entries to (None = memory only)
+            save_every: Write to disk after this many new entries
+            max_distance: Hash bits that may differ for an entry to be
+                checked against the frame (cheap prefilter)
+            max_difference: Largest thumbnail_difference score still
+                treated as the same page
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.path = path
+        self.save_every = save_every
+        self.max_distance = max_distance
+        self.max_difference = max_difference
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # (hash, language, config, serial) -> (thumbnail, value); the serial
+        # keeps apart different pages whose hashes collide
+        self._entries = OrderedDict()
+        self._serial = 0
+        self._unsaved = 0
+        self._lock = threading.Lock()
+
+        if self.path:
+            self.load()
+
+    def _find(self, fingerprint, language, config):
+        """Key of the entry showing the same page, or None (lock held)"""
+        frame_hash, thumbnail = fingerprint
+        # Tolerate flipped hash bits from noise or exposure changes, then
+        # confirm on the thumbnail so pages that differ by a word miss
+        candidates = sorted(
+            (hamming_distance(key[0], frame_hash), key[3], key)
+            for key in self._entries
+            if key[1] == language and key[2] == config
+        )
+        for distance, _, key in candidates:
+            if distance > self.max_distance:
+                break
+            if thumbnail_difference(self._entries[key][0], thumbnail) <= self.max_difference:
+                return key
+        return None
+
+    def _add(self, frame_hash, language, config, thumbnail, value):
+        """Insert a new most recent entry (lock held)"""
+        self._serial += 1
+        self._entries[(frame_hash, language, config, self._serial)] = (thumbnail, value)
+
+    def get(self, fingerprint, language, config):
+        """
+        Look up a result
+
+        Args:
+            fingerprint: (hash, thumbnail) from ocr.frame_fingerprint
+            language: Requested OCR language
+            config: OCR configuration string
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            key = self._find(fingerprint, language, config)
+            if key is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][1]
+
+    def put(self, fingerprint, language, config, value):
+        """Store a result, evicting the least recently used entry if full"""
+        frame_hash, thumbnail = fingerprint
+        with self._lock:
+            # A recapture of a cached page replaces its entry
+            key = self._find(fingerprint, language, config)
+            if key is not None:
+                del self._entries[key]
+            self._add(frame_hash, language, config, thumbnail, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._unsaved += 1
+            should_save = self.path and self._unsaved >= self.save_every
+
+        if should_save:
+            self.save()
+
+    def stats(self):
+        """Hit/miss counters for tuning"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            }
+
+    def load(self):
+        """Load persisted entries from disk"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != OCR_CACHE_VERSION:
+                logger.info(f"OCR cache {self.path} has an old format, starting empty")
+                return
+            import numpy as np
+            with self._lock:
+                for item in data.get('entries', [])[-self.max_entries:]:
+                    pixels = zlib.decompress(base64.b64decode(item['thumbnail']))
+                    thumbnail = np.frombuffer(pixels, np.uint8).reshape(item['shape'])
+                    self._add(int(item['hash'], 16), item['language'], item['config'],
+                              thumbnail, item['value'])
+            logger.info(f"OCR cache loaded: {len(self._entries)} entries from {self.path}")
+        except Exception as e:
+            logger.error(f"Error loading OCR cache: {e}")
+
+    def save(self):
+        """Write entries to disk (atomically)"""
+        if not self.path:
+            return
+        with self._lock:
+            entries = [
+                {'hash': f"{h:x}", 'language': lang, 'config': config,
+                 'shape': list(thumbnail.shape),
+                 'thumbnail': base64.b64encode(zlib.compress(thumbnail.tobytes())).decode('ascii'),
+                 'value': value}
+                for (h, lang, config, _), (thumbnail, value) in self._entries.items()
+            ]
+            self._unsaved = 0
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': OCR_CACHE_VERSION, 'entries': entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            logger.debug(f"OCR cache saved: {len(entries)} entries")
+        except Exception as e:
+            logger.error(f"Error saving OCR cache: {e}")
+
+
+class AudioCache:
+    """Size-capped on-disk LRU cache of rendered speech files"""
+
+    def __init__(self, directory, max_bytes=50 * 1024 * 1024):
+        """
+        Initialize cache
+
+        Args:
+            directory: Directory holding the audio files
+            max_bytes: Total size cap; least recently played files are removed
+        """
+        self.directory = directory
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+        self._entries = OrderedDict()   # key -> (path, size), oldest first
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._scan()
+
+    @staticmethod
+    def make_key(text, language, rate, voice, backend):
+        """Stable key for one rendering of a phrase"""
+        raw = json.dumps([text, language, rate, voice, backend], ensure_ascii=False)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _scan(self):
+        """Rebuild the index from files on disk, oldest access first"""
+        files = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            key, ext = os.path.splitext(name)
+            if '.part' in name:
+                # Leftover from an interrupted render
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            if ext in ('.mp3', '.wav') and os.path.isfile(path):
+                stat = os.stat(path)
+                files.append((stat.st_mtime, key, path, stat.st_size))
+        for _, key, path, size in sorted(files):
+            self._entries[key] = (path, size)
+            self.total_bytes += size
+        if files:
+            logger.info(f"Audio cache: {len(files)} files, {self.total_bytes // 1024} KiB")
+
+    def get(self, key):
+        """Return the cached file path for a key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not os.path.exists(entry[0]):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # mtime records last use so LRU order survives restarts
+        try:
+            now = time.time()
+            os.utime(entry[0], (now, now))
+        except OSError:
+            pass
+        return entry[0]
+
+    def path_for(self, key, extension):
+        """Path a new rendering should be written to"""
+        return os.path.join(self.directory, f"{key}{extension}")
+
+    def add(self, key, path):
+        """Register a freshly rendered file and evict old ones past the size cap"""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self.total_bytes -= old[1]
+            self._entries[key] = (path, size)
+            self.total_bytes += size
+            evicted = []
+            while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, (old_path, old_size) = self._entries.popitem(last=False)
+                self.total_bytes -= old_size
+                self.evictions += 1
+                evicted.append(old_path)
+        for old_path in evicted:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+    def stats(self):
+        """Hit/miss counters for tuning"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'files': len(self._entries),
+                'bytes': self.total_bytes,
+            }
@@ -3,49 +3,202 @@
 Camera Module for Reading Eye - Raspberry Pi
 - Handles Pi Camera 3/5 using Picamera2
 - Supports single capture and continuous streaming
+- Streaming mode: a background thread grabs video frames into a small ring
+  buffer so a capture returns the newest frame immediately; full-resolution
+  stills remain available on request
+- YUV420 mode returns the luminance plane directly for OCR (no colour conversion)
+- FileCamera replays images from disk for machines without camera hardware
+- Optional frame pool: captures and conversions write into preallocated arrays
+  instead of allocating full-resolution buffers for every frame
+- OpenCV and Picamera2 are imported on first use (the YUV420 grayscale path never needs OpenCV)
 """
-import cv2
 import time
 import logging
 import os
+import sys
+import glob
+import threading
+import functools
+import importlib.util
+from collections import deque
 from datetime import datetime
 
-logger = logging.getLogger(__name__)
-
 try:
-    from picamera2 import Picamera2
-    PICAMERA2_AVAILABLE = True
+    from .metrics import registry as metrics
 except ImportError:
-    PICAMERA2_AVAILABLE = False
-    logger.warning("Picamera2 not available - using fallback mode")
+    from metrics import registry as metrics
+
+logger = logging.getLogger(__name__)
+
+# Checked without importing; the library itself is loaded when a camera is opened
+PICAMERA2_AVAILABLE = importlib.util.find_spec('picamera2') is not None
+
+COLOR_FORMATS = ('rgb', 'yuv420')
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.webp')
+
+
+def _unreferenced_refcount():
+    """sys.getrefcount() of a list item only the list holds, as seen from the loop in _free_array"""
+    arrays = [object()]
+    for array in arrays:
+        return sys.getrefcount(array)
+
+
+# Depends on the interpreter, so it is measured rather than hard-coded, and
+# _refcounts_reliable() checks it before any pool relies on it
+_FREE_REFCOUNT = _unreferenced_refcount()
+
+
+def _free_array(arrays):
+    """First array only the list references, or None"""
+    for array in arrays:
+        # Views keep their base array alive, so they count as users too
+        if sys.getrefcount(array) <= _FREE_REFCOUNT:
+            return array
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _refcounts_reliable():
+    """
+    Check on real arrays that _free_array skips one that is held (directly
+    or through a view) and finds it again once released
+    """
+    import numpy as np
+    arrays = [np.empty(4, np.uint8), np.empty(4, np.uint8)]
+    held = arrays[0]
+    view = arrays[1][:2]
+    skips_held = _free_array(arrays) is None
+    del held, view
+    reliable = skips_held and _free_array(arrays) is arrays[0]
+    if not reliable:
+        logger.warning("Frame pool cannot track frames on this Python, "
+                       "allocating every frame instead")
+    return reliable
+
+
+class FramePool:
+    """
+    Preallocated frame arrays, reused once nothing references them
+
+    Each (shape, dtype) gets up to `size` arrays, allocated on first use. An
+    array is handed out again only when the pool holds the last reference to
+    it, so a frame (or any view of it, such as the luminance plane or a crop)
+    stays intact for as long as a queue, pipeline stage or caller keeps it.
+    When every array of a shape is in use, a fresh unpooled array is
+    returned instead of overwriting one. If reference counts cannot be
+    trusted on this interpreter, nothing is ever reused.
+    """
+
+    def __init__(self, size):
+        """
+        Initialize pool
+
+        Args:
+            size: Arrays per shape; the number of frames normally in flight
+        """
+        self.size = max(1, int(size))
+        self.reuse = _refcounts_reliable()
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def get(self, shape, dtype='uint8'):
+        """An array of the given shape no one else is using (contents are stale)"""
+        import numpy as np
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            arrays = self._slots.setdefault(key, [])
+            array = _free_array(arrays) if self.reuse else None
+            if array is not None:
+                return array
+            array = np.empty(shape, dtype=dtype)
+            if not self.reuse:
+                return array
+            if len(arrays) < self.size:
+                arrays.append(array)
+                metrics.inc('frame_pool_allocations')
+            else:
+                metrics.inc('frame_pool_exhausted')
+            return array
+
+    def nbytes(self):
+        """Memory held by the pool"""
+        with self._lock:
+            return sum(a.nbytes for arrays in self._slots.values() for a in arrays)
+
+    def clear(self):
+        """Drop every array (frames still in use stay valid; new ones are reallocated)"""
+        with self._lock:
+            self._slots.clear()
 
 
 class PiCamera:
     """Raspberry Pi Camera handler using Picamera2"""
     
-    def __init__(self, resolution=(1280, 720)):
+    def __init__(self, resolution=(1280, 720), color_format='rgb', streaming=False,
+                 stream_resolution=(1280, 720), buffer_size=3, frame_pool=0):
         """
         Initialize camera
         
         Args:
-            resolution: Tuple (width, height) for capture
+            resolution: Tuple (width, height) for capture (stills in streaming mode)
+            color_format: 'rgb' for colour stills, or 'yuv420' to read the
+                grayscale luminance plane without any conversion
+            streaming: Run the sensor in video mode with a background grabber
+            stream_resolution: (width, height) of streamed frames
+            buffer_size: Number of recent streamed frames kept
+            frame_pool: Frames the caller normally holds at once; captures
+                reuse up to that many preallocated arrays once they are no
+                longer referenced (0 = allocate every frame)
         """
-        self.resolution = resolution
+        self.resolution = tuple(resolution)
+        if color_format not in COLOR_FORMATS:
+            logger.warning(f"Unknown color format '{color_format}', using rgb")
+            color_format = 'rgb'
+        self.color_format = color_format
+        self.streaming = streaming
+        self.stream_resolution = tuple(stream_resolution)
         self.camera = None
         self.initialized = False
         
+        # Streaming state: (sequence, timestamp, raw) ring buffer filled by the grabber
+        self._ring = deque(maxlen=max(1, buffer_size))
+        self._frame_ready = threading.Condition()
+        self._sequence = 0
+        self._last_sequence = 0
+        self._camera_lock = threading.Lock()
+        self._still_pending = threading.Event()
+        self._stop = threading.Event()
+        self._grabber = None
+        self._still_config = None
+        self.pool = FramePool(frame_pool) if frame_pool else None
+        # Streamed frames are copied into the caller's pool when handed out, so
+        # the grabber's own arrays are only referenced by the ring (plus the
+        # one being written)
+        self._ring_pool = FramePool(buffer_size + 1) if frame_pool and streaming else None
+        
         if PICAMERA2_AVAILABLE:
             self._init_camera()
         else:
             logger.warning("Picamera2 not available")
 
+    @property
+    def frame_size(self):
+        """(width, height) of the frames returned by the capture methods"""
+        return self.stream_resolution if self.streaming else self.resolution
+
     def _init_camera(self):
         """Initialize Picamera2"""
         try:
+            from picamera2 import Picamera2
             self.camera = Picamera2()
-            config = self.camera.create_still_configuration(
-                main={"size": self.resolution}
-            )
+            main = {"size": self.resolution}
+            if self.color_format == 'yuv420':
+                main["format"] = "YUV420"
+            config = self.camera.create_still_configuration(main=main)
+            if self.streaming:
+                self._still_config = config
+                config = self.camera.create_video_configuration(main=dict(main, size=self.stream_resolution))
             self.camera.configure(config)
             self.camera.start()
             
@@ -53,11 +206,107 @@ class PiCamera:
             time.sleep(1.0)
             
             self.initialized = True
-            logger.info(f"Camera initialized: {self.resolution}")
+            if self.streaming:
+                self._grabber = threading.Thread(target=self._grab_loop, name='camera-grabber', daemon=True)
+                self._grabber.start()
+                logger.info(f"Camera streaming: {self.stream_resolution}, stills {self.resolution} "
+                            f"({self.color_format})")
+            else:
+                logger.info(f"Camera initialized: {self.resolution} ({self.color_format})")
         except Exception as e:
             logger.error(f"Camera initialization failed: {e}")
             self.initialized = False
 
+    def _grab_loop(self):
+        """Grabber thread: keep the ring buffer filled with the newest video frames"""
+        while not self._stop.is_set():
+            if self._still_pending.is_set():
+                # Let a still capture take the camera
+                time.sleep(0.005)
+                continue
+            try:
+                with self._camera_lock:
+                    raw = self._grab(self._ring_pool)
+            except Exception as e:
+                logger.error(f"Frame grab error: {e}")
+                self._stop.wait(0.1)
+                continue
+            with self._frame_ready:
+                self._sequence += 1
+                self._ring.append((self._sequence, time.time(), raw))
+                self._frame_ready.notify_all()
+
+    def recent_frames(self):
+        """
+        Streamed frames currently in the ring buffer (pooled arrays are not
+        reused while the returned frames are referenced)
+        
+        Returns:
+            List of (timestamp, raw array), newest first
+        """
+        with self._frame_ready:
+            return [(timestamp, raw) for _, timestamp, raw in reversed(self._ring)]
+
+    def _newest_raw(self, timeout=1.0):
+        """Newest streamed frame, waiting (up to one frame) if it was already returned"""
+        with self._frame_ready:
+            if not self._frame_ready.wait_for(
+                    lambda: self._ring and self._ring[-1][0] != self._last_sequence, timeout):
+                logger.error("No frame from camera stream")
+                return None
+            self._last_sequence, _, raw = self._ring[-1]
+            if self.pool is None:
+                return raw
+            import numpy as np
+            frame = self.pool.get(raw.shape, raw.dtype)
+            np.copyto(frame, raw)
+            return frame
+
+    def _capture_raw(self):
+        """
+        Capture the raw array in the configured format
+        
+        Returns:
+            RGB array, or planar YUV420 array of shape (height * 3 / 2, width)
+        """
+        if not self.initialized or not self.camera:
+            logger.error("Camera not initialized")
+            return None
+        if self._grabber is not None:
+            return self._newest_raw()
+        
+        try:
+            return self._grab(self.pool)
+        except Exception as e:
+            logger.error(f"Capture error: {e}")
+            return None
+
+    def _grab(self, pool):
+        """One frame from the sensor, copied into an array from pool (if any)"""
+        if pool is None:
+            return self.camera.capture_array()
+        import numpy as np
+        from picamera2 import MappedArray
+        with self.camera.captured_request() as request:
+            with MappedArray(request, 'main') as mapped:
+                frame = pool.get(mapped.array.shape, mapped.array.dtype)
+                np.copyto(frame, mapped.array)
+        return frame
+
+    def _convert(self, arr, code, channels=None):
+        """cv2.cvtColor into a pooled array when pooling is enabled"""
+        import cv2
+        if self.pool is None:
+            return cv2.cvtColor(arr, code)
+        height = arr.shape[0] * 2 // 3 if code == cv2.COLOR_YUV420p2BGR else arr.shape[0]
+        shape = (height, arr.shape[1], channels) if channels else (height, arr.shape[1])
+        return cv2.cvtColor(arr, code, dst=self.pool.get(shape, arr.dtype))
+
+    def _luminance(self, raw, width=None):
+        """Return the Y plane of a YUV420 array as a view (no copy)"""
+        height = raw.shape[0] * 2 // 3
+        return raw[:height, :width or self.frame_size[0]]
+
     def capture_frame(self):
         """
         Capture a single frame
@@ -65,16 +314,21 @@ class PiCamera:
         Returns:
             OpenCV image (BGR) or None if failed
         """
-        if not self.initialized or not self.camera:
-            logger.error("Camera not initialized")
+        with metrics.timer('capture'):
+            arr = self._capture_raw()
+        if arr is None:
+            metrics.inc('capture_failures')
             return None
         
         try:
-            # Capture RGB array from Picamera2
-            arr = self.camera.capture_array()
-            
-            # Convert RGB to BGR for OpenCV
-            frame = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+            import cv2
+            with metrics.timer('conversion'):
+                if self.color_format == 'yuv420':
+                    frame = self._convert(arr, cv2.COLOR_YUV420p2BGR, 3)
+                else:
+                    # Convert RGB to BGR for OpenCV
+                    frame = self._convert(arr, cv2.COLOR_RGB2BGR, 3)
+            metrics.inc('frames_captured')
             
             logger.debug(f"Frame captured: {frame.shape}")
             return frame
@@ -97,6 +351,7 @@ class PiCamera:
             return False
         
         try:
+            import cv2
             cv2.imwrite(output_path, frame)
             logger.info(f"Frame saved to: {output_path}")
             return True
@@ -111,19 +366,99 @@ class PiCamera:
         Returns:
             Grayscale OpenCV image or None
         """
-        frame = self.capture_frame()
-        if frame is None:
+        with metrics.timer('capture'):
+            arr = self._capture_raw()
+        if arr is None:
+            metrics.inc('capture_failures')
             return None
         
         try:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            with metrics.timer('conversion'):
+                if self.color_format == 'yuv420':
+                    gray = self._luminance(arr)
+                else:
+                    import cv2
+                    gray = self._convert(arr, cv2.COLOR_RGB2GRAY)
+            metrics.inc('frames_captured')
             return gray
         except Exception as e:
             logger.error(f"Grayscale conversion error: {e}")
             return None
 
+    def capture_still(self):
+        """
+        Full-resolution grayscale still, for when streamed frames lack detail
+        
+        In streaming mode the sensor briefly switches to the still
+        configuration; otherwise this is a normal capture.
+        
+        Returns:
+            Grayscale image at `resolution` or None
+        """
+        if self._grabber is None:
+            return self.get_grayscale_frame()
+        
+        self._still_pending.set()
+        try:
+            with metrics.timer('still_capture'), self._camera_lock:
+                raw = self.camera.switch_mode_and_capture_array(self._still_config)
+        except Exception as e:
+            logger.error(f"Still capture error: {e}")
+            metrics.inc('capture_failures')
+            return None
+        finally:
+            self._still_pending.clear()
+        
+        metrics.inc('stills_captured')
+        if self.color_format == 'yuv420':
+            return self._luminance(raw, self.resolution[0])
+        import cv2
+        return cv2.cvtColor(raw, cv2.COLOR_RGB2GRAY)
+
+    def capture_burst(self, count=3, method='mean', first=None):
+        """
+        Capture several grayscale frames and fuse them into one for OCR
+
+        Averaging aligned frames removes sensor noise, and the sharpest-region
+        composite sidesteps frames smeared by motion; either way OCR runs once
+        on the result instead of once per frame.
+
+        Args:
+            count: Total number of frames in the burst
+            method: 'mean' (denoise) or 'sharpest' (per-region sharpest frame)
+            first: Already captured grayscale frame to use as the first one
+
+        Returns:
+            Fused grayscale image or None
+        """
+        frames = [first] if first is not None else []
+        while len(frames) < count:
+            gray = self.get_grayscale_frame()
+            if gray is None:
+                break
+            frames.append(gray)
+        if not frames:
+            return None
+        if len(frames) == 1:
+            return frames[0]
+
+        try:
+            try:
+                from .fusion import fuse_frames
+            except ImportError:
+                from fusion import fuse_frames
+            with metrics.timer('fusion'):
+                return fuse_frames(frames, method)
+        except Exception as e:
+            logger.error(f"Burst fusion error: {e}")
+            return frames[0]
+
     def close(self):
         """Close camera and release resources"""
+        if self._grabber is not None:
+            self._stop.set()
+            self._grabber.join(timeout=2.0)
+            self._grabber = None
         if self.camera:
             try:
                 self.camera.stop()
@@ -138,3 +473,109 @@ class PiCamera:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager cleanup"""
         self.close()
+
+
+class FileCamera(PiCamera):
+    """
+    Camera stand-in that replays image files
+
+    Frames are served in the same raw layout Picamera2 would produce
+    (RGB or planar YUV420), so the normal capture paths are exercised
+    on machines without camera hardware. Sensor noise and hand shake
+    can be simulated per capture to exercise burst fusion.
+    """
+
+    def __init__(self, source, resolution=None, color_format='rgb', frame_repeat=1,
+                 noise=0.0, jitter=0, frame_pool=0):
+        """
+        Initialize file-backed camera
+        
+        Args:
+            source: Image file or directory of images (played in name order, looping)
+            resolution: Optional (width, height) to resize frames to
+            color_format: 'rgb' or 'yuv420'
+            frame_repeat: Consecutive captures served from each image (bursts)
+            noise: Standard deviation of Gaussian sensor noise added per capture
+            jitter: Maximum random shift in pixels per capture
+            frame_pool: As for PiCamera (conversions reuse pooled arrays)
+        """
+        self.source = source
+        self.resolution = tuple(resolution) if resolution else None
+        self.color_format = color_format if color_format in COLOR_FORMATS else 'rgb'
+        self.streaming = False
+        self._grabber = None
+        self.pool = FramePool(frame_pool) if frame_pool else None
+        self.frame_repeat = max(1, int(frame_repeat))
+        self.noise = noise
+        self.jitter = int(jitter)
+        self.camera = None
+        self.initialized = False
+        self._frames = []
+        self._index = 0
+        self._rng = None
+        self._init_camera()
+
+    def _init_camera(self):
+        """Load and pre-convert all frames from disk"""
+        import cv2
+        if os.path.isdir(self.source):
+            paths = sorted(
+                p for p in glob.glob(os.path.join(self.source, '*'))
+                if p.lower().endswith(IMAGE_EXTENSIONS)
+            )
+        else:
+            paths = [self.source]
+        
+        for path in paths:
+            bgr = cv2.imread(path, cv2.IMREAD_COLOR)
+            if bgr is None:
+                logger.warning(f"Could not read image: {path}")
+                continue
+            if self.resolution is None:
+                # Like a real sensor, every frame shares the first image's size
+                height, width = bgr.shape[:2]
+                # YUV420 needs even dimensions
+                self.resolution = (width - width % 2, height - height % 2)
+            if (bgr.shape[1], bgr.shape[0]) != self.resolution:
+                bgr = cv2.resize(bgr, self.resolution, interpolation=cv2.INTER_AREA)
+            if self.color_format == 'yuv420':
+                raw = cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV_I420)
+            else:
+                raw = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+            self._frames.append(raw)
+        
+        self.initialized = bool(self._frames)
+        if self.initialized:
+            logger.info(f"File camera initialized: {len(self._frames)} frame(s) from {self.source}")
+        else:
+            logger.error(f"No images found in: {self.source}")
+
+    def _capture_raw(self):
+        """Return the next frame, looping over the loaded images"""
+        if not self.initialized:
+            logger.error("Camera not initialized")
+            return None
+        raw = self._frames[(self._index // self.frame_repeat) % len(self._frames)]
+        self._index += 1
+        if self.noise or self.jitter:
+            raw = self._degrade(raw)
+        return raw
+
+    def _degrade(self, raw):
+        """Apply simulated shake (luminance plane only for YUV420) and sensor noise"""
+        import numpy as np
+        if self._rng is None:
+            self._rng = np.random.default_rng(0)
+        raw = raw.copy()
+        if self.jitter:
+            rows = self.resolution[1] if self.color_format == 'yuv420' else raw.shape[0]
+            dy, dx = self._rng.integers(-self.jitter, self.jitter + 1, size=2)
+            raw[:rows] = np.roll(raw[:rows], (dy, dx), axis=(0, 1))
+        if self.noise:
+            noisy = raw + self._rng.normal(0.0, self.noise, raw.shape)
+            raw = np.clip(noisy, 0, 255).astype(np.uint8)
+        return raw
+
+    def close(self):
+        """Nothing to release for file-backed frames"""
+        logger.info("File camera closed")
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Capture Storage for Reading Eye - Raspberry Pi
+- Saves the exact frame that was OCR'd, with a JSON sidecar (text, confidence, timings)
+- Encoding and disk writes happen on a background thread; a full queue drops
+  the save instead of stalling capture or OCR
+- PNG, JPEG or WebP encoding with configurable quality
+- Ring-buffer retention: the oldest captures are deleted beyond a file count,
+  total size or age limit
+"""
+import os
+import json
+import time
+import queue
+import logging
+import threading
+
+try:
+    from .metrics import registry as metrics
+except ImportError:
+    from metrics import registry as metrics
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_FORMATS = ('png', 'jpg', 'webp')
+CAPTURE_PREFIX = 'capture_'
+
+# zlib level for PNG: level 1 is several times faster than the default 3 on a
+# Pi and OCR frames (mostly flat background) still compress well
+PNG_COMPRESSION = 1
+
+
+class CaptureWriter:
+    """Background writer for OCR'd frames and their sidecars"""
+
+    def __init__(self, directory, image_format='png', quality=90, max_files=500,
+                 max_mb=200, max_age_hours=168, queue_size=4):
+        """
+        Initialize writer
+
+        Args:
+            directory: Capture directory (created if missing)
+            image_format: 'png', 'jpg' or 'webp'
+            quality: JPEG/WebP quality (1-100)
+            max_files: Keep at most this many captures (0 = no limit)
+            max_mb: Keep at most this many megabytes of captures (0 = no limit)
+            max_age_hours: Delete captures older than this (0 = no limit)
+            queue_size: Frames waiting to be written before saves are dropped
+        """
+        if image_format not in CAPTURE_FORMATS:
+            logger.warning(f"Unknown capture format '{image_format}', using png")
+            image_format = 'png'
+        self.directory = str(directory)
+        self.image_format = image_format
+        self.quality = int(quality)
+        self.max_files = max_files
+        self.max_bytes = max_mb * 1024 * 1024
+        self.max_age = max_age_hours * 3600
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+        # Oldest first: (image path, [image path, sidecar path], bytes, mtime)
+        self._entries = []
+        self._total_bytes = 0
+        self._last_base = None
+        self._repeat = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._scan()
+        self._thread = threading.Thread(target=self._run, name='capture-writer', daemon=True)
+        self._thread.start()
+
+    def save(self, gray, metadata=None):
+        """
+        Queue a frame (and its OCR metadata) to be written
+
+        Args:
+            gray: Image exactly as it was passed to OCR (copied here)
+            metadata: JSON-serialisable dict for the sidecar file
+
+        Returns:
+            Path the image will be written to, or None if the queue was full
+        """
+        path = os.path.join(self.directory, self._next_name() + '.' + self.image_format)
+        record = dict(metadata or {}, timestamp=time.strftime('%Y-%m-%dT%H:%M:%S'))
+        try:
+            self._queue.put_nowait((path, gray.copy(), record))
+        except queue.Full:
+            metrics.inc('captures_dropped')
+            logger.warning("Capture writer busy, frame not saved")
+            return None
+        return path
+
+    def close(self, timeout=10.0):
+        """Write the queued frames and stop the writer thread"""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Capture writer did not drain, pending frames lost")
+            return
+        self._thread.join(timeout)
+
+    def _next_name(self):
+        """Unique, time-ordered base name such as capture_20240101_120000_123"""
+        now = time.time()
+        base = f"{CAPTURE_PREFIX}{time.strftime('%Y%m%d_%H%M%S', time.localtime(now))}_{int(now * 1000) % 1000:03d}"
+        if base == self._last_base:
+            # Several captures within one millisecond
+            self._repeat += 1
+            return f"{base}-{self._repeat}"
+        self._last_base, self._repeat = base, 0
+        return base
+
+    def _run(self):
+        """Writer thread: encode, write atomically, then prune"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, image, record = item
+            try:
+                with metrics.timer('capture_save'):
+                    self._write(path, image, record)
+                metrics.inc('captures_saved')
+                self._prune()
+            except Exception as e:
+                logger.error(f"Capture save error: {e}")
+
+    def _write(self, path, image, record):
+        """Encode and write an image and its sidecar"""
+        import cv2
+        if self.image_format == 'jpg':
+            params = [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+        elif self.image_format == 'webp':
+            params = [cv2.IMWRITE_WEBP_QUALITY, self.quality]
+        else:
+            params = [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESSION]
+        ok, encoded = cv2.imencode('.' + self.image_format, image, params)
+        if not ok:
+            raise ValueError(f"{self.image_format} encoding failed")
+
+        sidecar = os.path.splitext(path)[0] + '.json'
+        record = dict(record, image=os.path.basename(path))
+        # Written under a temporary name so readers (e.g. --batch) never see partial files
+        for target, data in ((path, encoded.tobytes()),
+                             (sidecar, json.dumps(record, ensure_ascii=False).encode('utf-8'))):
+            with open(target + '.part', 'wb') as f:
+                f.write(data)
+            os.replace(target + '.part', target)
+
+        size = len(encoded) + os.path.getsize(sidecar)
+        self._entries.append((path, [path, sidecar], size, time.time()))
+        self._total_bytes += size
+        logger.debug(f"Capture saved: {path} ({size / 1024:.0f} KB)")
+
+    def _scan(self):
+        """Index captures left by earlier runs, oldest first"""
+        groups = {}
+        for name in os.listdir(self.directory):
+            if not name.startswith(CAPTURE_PREFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            if name.endswith('.part'):
+                # Interrupted write
+                os.remove(path)
+                continue
+            stem, ext = os.path.splitext(path)
+            if ext == '.json' or ext[1:] in CAPTURE_FORMATS:
+                groups.setdefault(stem, []).append(path)
+
+        for stem, paths in groups.items():
+            try:
+                stats = [os.stat(p) for p in paths]
+            except OSError:
+                continue
+            image = next((p for p in paths if not p.endswith('.json')), paths[0])
+            self._entries.append((image, paths, sum(s.st_size for s in stats),
+                                  max(s.st_mtime for s in stats)))
+        self._entries.sort(key=lambda entry: entry[3])
+        self._total_bytes = sum(entry[2] for entry in self._entries)
+        self._prune()
+
+    def _prune(self):
+        """Delete the oldest captures until every retention limit is met"""
+        cutoff = time.time() - self.max_age if self.max_age else None
+        removed = 0
+        while self._entries:
+            _, paths, size, mtime = self._entries[0]
+            if not ((self.max_files and len(self._entries) > self.max_files)
+                    or (self.max_bytes and self._total_bytes > self.max_bytes)
+                    or (cutoff and mtime < cutoff)):
+                break
+            self._entries.pop(0)
+            self._total_bytes -= size
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            removed += 1
+        if removed:
+            metrics.inc('captures_pruned', removed)
+            logger.debug(f"Pruned {removed} old capture(s)")
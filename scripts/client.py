@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Reading Eye - Daemon Client
+- Thin command-line client for a daemon started with `app_main.py --daemon`
+- Standard library only: no camera, OCR or TTS imports, so it starts instantly
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from daemon import send_request
+
+PROJECT_DIR = Path(__file__).parent.parent
+DEFAULT_SOCKET = 'cache/reading_eye.sock'
+
+
+def default_socket_path():
+    """Socket path from the config file (daemon_socket), relative to the project"""
+    path = DEFAULT_SOCKET
+    try:
+        with open(PROJECT_DIR / 'config' / 'reading_eye_config.json', 'r', encoding='utf-8') as f:
+            path = json.load(f).get('daemon_socket') or DEFAULT_SOCKET
+    except (OSError, ValueError):
+        pass
+    path = Path(path)
+    return str(path if path.is_absolute() else PROJECT_DIR / path)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Reading Eye daemon client')
+    parser.add_argument(
+        'command',
+        choices=['read', 'capture', 'speak', 'status', 'ping', 'shutdown'],
+        help='read = capture, OCR and speak; capture = capture and OCR only'
+    )
+    parser.add_argument('text', nargs='?', help='Text for the speak command')
+    parser.add_argument('--lang', help='OCR language (default from the daemon config)')
+    parser.add_argument('--save-image', action='store_true', help='Save the captured frame')
+    parser.add_argument('--no-wait', action='store_true', help="Don't wait for speech to finish")
+    parser.add_argument('--socket', help='Daemon socket path (default from config)')
+    parser.add_argument('--json', action='store_true', help='Print the raw JSON reply')
+    parser.add_argument('--timeout', type=float, default=120.0, help='Seconds to wait for a reply')
+    args = parser.parse_args()
+
+    request = {'command': args.command}
+    if args.command in ('read', 'capture'):
+        request.update(lang=args.lang, save_image=args.save_image)
+    if args.command in ('read', 'speak'):
+        request['wait'] = not args.no_wait
+    if args.command == 'speak':
+        request['text'] = args.text if args.text is not None else sys.stdin.read()
+
+    socket_path = args.socket or default_socket_path()
+    try:
+        reply = send_request(socket_path, request, timeout=args.timeout)
+    except OSError as e:
+        print(f"Cannot reach daemon at {socket_path}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.json:
+        print(json.dumps(reply, ensure_ascii=False, indent=2))
+    elif not reply.get('ok'):
+        print(f"Error: {reply.get('error')}", file=sys.stderr)
+    elif 'text' in reply and args.command in ('read', 'capture'):
+        print(reply['text'])
+    elif args.command == 'status':
+        print(', '.join(f"{k}={v}" for k, v in reply.items() if k != 'ok'))
+    sys.exit(0 if reply.get('ok') else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Daemon Mode for Reading Eye - Raspberry Pi
+- Keeps camera, OCR and TTS engines warm between requests
+- Newline-delimited JSON requests over a local Unix socket
+- Any number of clients; camera/OCR work is queued and run one job at a time
+- Standard library only, so the client side starts instantly
+"""
+import os
+import json
+import time
+import queue
+import socket
+import threading
+import socketserver
+import logging
+
+logger = logging.getLogger(__name__)
+
+COMMANDS = ('ping', 'status', 'capture', 'read', 'speak', 'shutdown')
+
+
+def send_request(socket_path, request, timeout=120.0):
+    """
+    Send one request to a running daemon
+
+    Args:
+        socket_path: Daemon Unix socket
+        request: Dict with a 'command' and its options
+        timeout: Seconds to wait for the reply
+
+    Returns:
+        Reply dict (always has 'ok')
+
+    Raises:
+        OSError: If the daemon cannot be reached
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        reply = sock.makefile('rb').readline()
+    if not reply:
+        return {'ok': False, 'error': 'no reply from daemon'}
+    return json.loads(reply.decode('utf-8'))
+
+
+class _Job:
+    """Camera/OCR work waiting for the daemon worker"""
+
+    def __init__(self, command, request):
+        self.command = command
+        self.request = request
+        self.reply = None
+        self.done = threading.Event()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """One client connection: one JSON request per line, one JSON reply per line"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line.decode('utf-8'))
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+                reply = self.server.daemon.handle_request(request)
+            except ValueError as e:
+                reply = {'ok': False, 'error': f"bad request: {e}"}
+            except Exception as e:
+                logger.error(f"Daemon request error: {e}")
+                reply = {'ok': False, 'error': str(e)}
+            try:
+                self.wfile.write(json.dumps(reply, ensure_ascii=False).encode('utf-8') + b'\n')
+            except OSError:
+                # Client went away
+                return
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    """Threaded Unix socket server with a back-reference to the daemon"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, daemon):
+        self.daemon = daemon
+        super().__init__(socket_path, _RequestHandler)
+
+
+class ReadingEyeDaemon:
+    """Serves capture/read/speak requests with the app's warm components"""
+
+    def __init__(self, app, socket_path, queue_size=8, request_timeout=60.0):
+        """
+        Initialize daemon
+
+        Args:
+            app: ReadingEyeApp (camera, OCR and TTS already initialized)
+            socket_path: Unix socket to listen on
+            queue_size: Maximum queued camera/OCR jobs before clients get 'busy'
+            request_timeout: Seconds a client waits for its job or speech
+        """
+        self.app = app
+        self.socket_path = socket_path
+        self.request_timeout = request_timeout
+        self.served = 0
+        self.started = time.monotonic()
+        self._jobs = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._stop_event = threading.Event()
+        self._worker = threading.Thread(target=self._worker_loop, name='daemon-worker', daemon=True)
+        self._server = None
+
+    def _bind(self):
+        """Create the listening socket, replacing a stale one"""
+        directory = os.path.dirname(self.socket_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.socket_path):
+            try:
+                send_request(self.socket_path, {'command': 'ping'}, timeout=1.0)
+            except OSError:
+                os.unlink(self.socket_path)
+            else:
+                raise RuntimeError(f"another daemon is already listening on {self.socket_path}")
+        self._server = _Server(self.socket_path, self)
+        os.chmod(self.socket_path, 0o660)
+
+    def serve_forever(self):
+        """Listen for requests until shutdown() is called"""
+        self._bind()
+        self._worker.start()
+        logger.info(f"Daemon listening on {self.socket_path}")
+        self._server.serve_forever(poll_interval=0.5)
+
+    def shutdown(self):
+        """Stop serving (safe to call from any thread, including handlers)"""
+        self._stop_event.set()
+        if self._server:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def close(self):
+        """Release the socket"""
+        self._stop_event.set()
+        if self._server:
+            self._server.server_close()
+            self._server = None
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+        logger.info(f"Daemon stopped after {self.served} requests")
+
+    def handle_request(self, request):
+        """
+        Execute one request (called from client handler threads)
+
+        Returns:
+            Reply dict
+        """
+        command = request.get('command')
+        if command not in COMMANDS:
+            return {'ok': False, 'error': f"unknown command '{command}'", 'commands': list(COMMANDS)}
+        self.served += 1
+
+        if command == 'ping':
+            return {'ok': True}
+        if command == 'status':
+            return {
+                'ok': True,
+                'uptime_s': round(time.monotonic() - self.started, 1),
+                'served': self.served,
+                'queued_jobs': self._jobs.qsize(),
+            }
+        if command == 'shutdown':
+            logger.info("Shutdown requested by client")
+            self.shutdown()
+            return {'ok': True}
+        if command == 'speak':
+            text = request.get('text', '')
+            if not isinstance(text, str):
+                return {'ok': False, 'error': 'text must be a string'}
+            if not text.strip():
+                return {'ok': False, 'error': 'no text to speak'}
+            return self._speak(text, request.get('wait', True))
+
+        # capture / read: queue for the single camera/OCR worker
+        job = _Job(command, request)
+        try:
+            self._jobs.put_nowait(job)
+        except queue.Full:
+            return {'ok': False, 'error': 'busy'}
+        if not job.done.wait(self.request_timeout):
+            return {'ok': False, 'error': 'timed out waiting for the camera'}
+        reply = job.reply
+        if command == 'read' and reply.get('ok') and reply.get('text'):
+            # Speech is waited on here, so the worker can already take the next capture
+            reply.update(self._speak(reply['text'], request.get('wait', True)))
+        return reply
+
+    def _speak(self, text, wait):
+        """Queue speech and optionally wait until it has been spoken"""
+        utterance = self.app.tts.speak(text)
+        if not utterance:
+            return {'ok': True, 'spoken': False}
+        if wait and not utterance.wait(self.request_timeout):
+            return {'ok': True, 'spoken': False, 'error': 'speech still running'}
+        return {'ok': True, 'spoken': not utterance.cancelled}
+
+    def _worker_loop(self):
+        """Run queued camera/OCR jobs one at a time"""
+        while not self._stop_event.is_set():
+            try:
+                job = self._jobs.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                result = self.app.recognize_frame(
+                    lang=job.request.get('lang'),
+                    save_image=bool(job.request.get('save_image'))
+                )
+                if result is None:
+                    job.reply = {'ok': False, 'error': 'capture failed'}
+                else:
+                    job.reply = dict(result, ok=True)
+            except Exception as e:
+                logger.error(f"Daemon job error: {e}")
+                job.reply = {'ok': False, 'error': str(e)}
+            finally:
+                job.done.set()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Multi-frame Fusion for Reading Eye - Raspberry Pi
+- Aligns a burst of grayscale frames to the sharpest one by phase correlation
+- 'mean' averages the aligned frames (sensor noise drops by ~sqrt(N)),
+  leaving out frames noticeably blurrier than the best
+- 'sharpest' builds a composite from the sharpest frame of every tile
+  (local motion blur, focus breathing)
+- Frames that moved too far or do not correlate are skipped
+"""
+import logging
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FUSION_METHODS = ('mean', 'sharpest')
+
+
+def sharpness(gray):
+    """Variance of the Laplacian: higher means more in-focus detail"""
+    return float(cv2.Laplacian(gray, cv2.CV_32F).var())
+
+
+def align_frames(frames, max_width=640, max_shift=0.05, min_response=0.05):
+    """
+    Translate every frame onto the sharpest one
+
+    Args:
+        frames: List of equally sized grayscale images
+        max_width: Shifts are measured on copies downscaled to this width
+        max_shift: Largest accepted shift, as a fraction of the frame size
+        min_response: Smallest accepted phase correlation peak (0-1)
+
+    Returns:
+        List of (aligned uint8 frame, sharpness) pairs, sharpest first
+    """
+    height, width = frames[0].shape[:2]
+    scale = min(1.0, max_width / float(width))
+    smalls = []
+    for frame in frames:
+        small = frame
+        if scale < 1.0:
+            small = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        smalls.append(small.astype(np.float32))
+    scores = [sharpness(small) for small in smalls]
+    reference = int(np.argmax(scores))
+    window = cv2.createHanningWindow((smalls[0].shape[1], smalls[0].shape[0]), cv2.CV_32F)
+
+    aligned = [(frames[reference], scores[reference])]
+    for index, frame in enumerate(frames):
+        if index == reference:
+            continue
+        (dx, dy), response = cv2.phaseCorrelate(smalls[reference], smalls[index], window)
+        dx, dy = dx / scale, dy / scale
+        if response < min_response or abs(dx) > max_shift * width or abs(dy) > max_shift * height:
+            logger.debug(f"Burst frame {index} skipped (shift {dx:.1f},{dy:.1f}, response {response:.2f})")
+            continue
+        matrix = np.float32([[1, 0, -dx], [0, 1, -dy]])
+        warped = cv2.warpAffine(frame, matrix, (width, height), flags=cv2.INTER_LINEAR,
+                                borderMode=cv2.BORDER_REPLICATE)
+        aligned.append((warped, scores[index]))
+    return aligned
+
+
+def _sharpest_tiles(frames, tile=64):
+    """Composite taking every tile from the frame with the most detail there"""
+    height, width = frames[0].shape[:2]
+    grid = (max(1, width // tile), max(1, height // tile))
+    energy = np.stack([
+        cv2.resize(np.abs(cv2.Laplacian(frame, cv2.CV_32F)), grid, interpolation=cv2.INTER_AREA)
+        for frame in frames
+    ])
+    choice = np.argmax(energy, axis=0).astype(np.uint8)
+    choice = cv2.resize(choice, (width, height), interpolation=cv2.INTER_NEAREST)
+    return np.take_along_axis(np.stack(frames), choice[None], axis=0)[0]
+
+
+def fuse_frames(frames, method='mean', blur_tolerance=0.7):
+    """
+    Merge a burst into one cleaner grayscale image
+
+    Args:
+        frames: List of grayscale frames of the same scene
+        method: 'mean' (denoise) or 'sharpest' (per-tile sharpest composite)
+        blur_tolerance: 'mean' only averages frames at least this sharp
+            relative to the sharpest frame
+
+    Returns:
+        Fused uint8 grayscale image
+    """
+    if len(frames) == 1:
+        return frames[0]
+    if method not in FUSION_METHODS:
+        logger.warning(f"Unknown fusion method '{method}', using mean")
+        method = 'mean'
+
+    aligned = align_frames(frames)
+    if len(aligned) == 1:
+        return aligned[0][0]
+
+    if method == 'sharpest':
+        fused = _sharpest_tiles([frame for frame, _ in aligned])
+        used = len(aligned)
+    else:
+        best = aligned[0][1]
+        keep = [frame for frame, score in aligned if score >= blur_tolerance * best]
+        total = np.zeros(keep[0].shape, dtype=np.float32)
+        for frame in keep:
+            total += frame
+        fused = np.clip(total / len(keep) + 0.5, 0, 255).astype(np.uint8)
+        used = len(keep)
+
+    logger.debug(f"Fused {used}/{len(frames)} burst frames ({method})")
+    return fused
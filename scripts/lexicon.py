@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Lexicon Post-correction for Reading Eye - Raspberry Pi
+- SymSpell-style symmetric-delete index: candidates are found by looking up
+  deletions of the word instead of generating every edit, so a lookup costs
+  microseconds to a fraction of a millisecond
+- Word lists are frequency files, one "word count" (or just "word") per line,
+  named after the Tesseract language: fra.txt, eng.txt, ara.txt
+- Every correction carries a confidence (0-1) from edit distance and how
+  clearly the best candidate beats the others
+- Conservative: words shorter than LONG_WORD letters take at most one edit,
+  so unknown names (drugs, places) are not rewritten into dictionary words
+"""
+import os
+import re
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Letters only: digits, punctuation and apostrophes split tokens (l'homme -> l, homme)
+_TOKENS = re.compile(r"[^\W\d_]+")
+_SENTENCE_END = re.compile(r"[.!?]\s*$")
+
+# Words shorter than this may only be corrected by a single edit
+LONG_WORD = 8
+
+
+def edit_distance(a, b, max_distance):
+    """
+    Optimal string alignment (Damerau-Levenshtein) distance with early exit
+
+    Returns:
+        Distance, or max_distance + 1 once it is known to exceed max_distance
+    """
+    # Common prefix and suffix do not change the distance
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if not a or not b:
+        return min(max(len(a), len(b)), max_distance + 1)
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    before = None
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            value = min(previous[j] + 1, current[j - 1] + 1,
+                        previous[j - 1] + (char != b[j - 1]))
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class Lexicon:
+    """Word frequencies with a symmetric-delete index for one language"""
+
+    def __init__(self, max_distance=2, prefix_length=5):
+        """
+        Initialize an empty lexicon
+
+        Args:
+            max_distance: Largest edit distance a correction may have
+            prefix_length: Only this many leading characters are indexed
+                (keeps the index small; full words are still compared)
+        """
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.words = {}
+        self._deletes = {}
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def __len__(self):
+        return len(self.words)
+
+    def load(self, path, max_words=None):
+        """
+        Add words from a frequency file (most frequent first is assumed when
+        max_words truncates it)
+
+        Returns:
+            Number of words added
+        """
+        added = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.split()
+                if not parts:
+                    continue
+                count = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 1
+                self.add(parts[0].lower(), count)
+                added += 1
+                if max_words and added >= max_words:
+                    break
+        return added
+
+    def add(self, word, count=1):
+        """Add a word (or raise its count)"""
+        if word in self.words:
+            self.words[word] += count
+            return
+        self.words[word] = count
+        for delete in self._edits(word[:self.prefix_length]):
+            entry = self._deletes.get(delete)
+            # Most deletes map to a single word; store it bare to save memory
+            if entry is None:
+                self._deletes[delete] = word
+            elif isinstance(entry, str):
+                self._deletes[delete] = [entry, word]
+            else:
+                entry.append(word)
+
+    def _edits(self, prefix):
+        """The prefix and all its deletions up to max_distance"""
+        edits = {prefix}
+        frontier = {prefix}
+        for _ in range(self.max_distance):
+            frontier = {item[:i] + item[i + 1:]
+                        for item in frontier if len(item) > 1 for i in range(len(item))}
+            edits |= frontier
+        return edits
+
+    def lookup(self, word, max_distance=None):
+        """
+        Closest lexicon words
+
+        Args:
+            word: Lowercase word
+            max_distance: Largest distance to consider (default: the lexicon's)
+
+        Returns:
+            List of (candidate, distance, count) at the smallest distance found
+        """
+        if word in self.words:
+            return [(word, 0, self.words[word])]
+        best = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        prefix = word[:self.prefix_length]
+        queue = [prefix]
+        queued = {prefix}
+        checked = set()
+        results = []
+        for candidate in queue:
+            if len(prefix) - len(candidate) > best:
+                break
+            entry = self._deletes.get(candidate)
+            for suggestion in ((entry,) if isinstance(entry, str) else entry or ()):
+                if suggestion in checked or abs(len(suggestion) - len(word)) > best:
+                    continue
+                checked.add(suggestion)
+                distance = edit_distance(word, suggestion, best)
+                if distance > best:
+                    continue
+                if distance < best:
+                    best = distance
+                    results = [r for r in results if r[1] <= best]
+                results.append((suggestion, distance, self.words[suggestion]))
+            if len(prefix) - len(candidate) < best and len(candidate) > 1:
+                for i in range(len(candidate)):
+                    delete = candidate[:i] + candidate[i + 1:]
+                    if delete not in queued:
+                        queued.add(delete)
+                        queue.append(delete)
+        return [r for r in results if r[1] == best]
+
+    def correct(self, word):
+        """
+        Best correction for a word that is not in the lexicon
+
+        Confidence falls quadratically with the edit distance relative to
+        the word length (one edit in a five-letter word gives 0.69, two in an
+        eight-letter word 0.6) and with the share of other candidates at the
+        same distance (two equally common candidates give at most half).
+
+        Returns:
+            (correction, confidence), or None when nothing is close enough
+        """
+        # Short words have many neighbours, and a name two edits away from a
+        # dictionary word is more likely than an OCR error that large
+        candidates = self.lookup(word, 1 if len(word) < LONG_WORD else None)
+        if not candidates:
+            return None
+        candidate, distance, count = max(candidates, key=lambda c: c[2])
+        share = count / float(sum(c[2] for c in candidates))
+        confidence = share * (1.0 - distance / float(len(word) + 1)) ** 2
+        return candidate, round(confidence, 3)
+
+
+class Corrector:
+    """
+    Per-language lexicons applied to OCR text
+
+    Indexing a word list takes a few seconds on a Pi, so lexicons are built
+    on a background thread; text is left uncorrected until its lexicon is ready.
+    """
+
+    def __init__(self, directory, max_words=30000, min_confidence=0.6, min_length=3):
+        """
+        Initialize corrector
+
+        Args:
+            directory: Directory of word lists named <language>.txt (fra, eng, ara)
+            max_words: Load at most this many words per language
+            min_confidence: Apply corrections at least this confident (0-1)
+            min_length: Leave shorter words alone
+        """
+        self.directory = str(directory)
+        self.max_words = max_words
+        self.min_confidence = min_confidence
+        self.min_length = min_length
+        # Language code -> Lexicon, or None when it has no word list
+        self._lexicons = {}
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def preload(self, language, wait=False):
+        """
+        Start indexing the word lists for a language string such as 'fra+eng'
+
+        Args:
+            language: Tesseract language string
+            wait: Block until the lexicons are ready
+        """
+        for code in language.split('+'):
+            with self._lock:
+                if code in self._lexicons:
+                    continue
+                thread = self._loading.get(code)
+                if thread is None:
+                    thread = threading.Thread(target=self._load, args=(code,),
+                                              name=f'lexicon-{code}', daemon=True)
+                    self._loading[code] = thread
+                    thread.start()
+            if wait:
+                thread.join()
+
+    def ready(self):
+        """Language codes whose lexicon is loaded"""
+        return sorted(code for code, lexicon in self._lexicons.items() if lexicon is not None)
+
+    def lexicons(self, language):
+        """Ready lexicons for a language string; missing ones start loading"""
+        if any(code not in self._lexicons for code in language.split('+')):
+            self.preload(language)
+        return [self._lexicons[code] for code in language.split('+')
+                if self._lexicons.get(code) is not None]
+
+    def _load(self, code):
+        """Loader thread: build the index for a language from <directory>/<code>.txt"""
+        path = os.path.join(self.directory, f'{code}.txt')
+        lexicon = None
+        if not os.path.exists(path):
+            logger.info(f"No word list for '{code}' ({path}), OCR text left uncorrected")
+        else:
+            try:
+                start = time.perf_counter()
+                lexicon = Lexicon()
+                count = lexicon.load(path, self.max_words)
+                logger.info(f"Lexicon '{code}': {count} words indexed in "
+                            f"{time.perf_counter() - start:.2f}s")
+            except (OSError, ValueError) as e:
+                logger.error(f"Cannot load word list {path}: {e}")
+                lexicon = None
+        with self._lock:
+            self._lexicons[code] = lexicon
+            self._loading.pop(code, None)
+
+    def correct(self, text, language):
+        """
+        Replace misrecognized words with their closest lexicon word
+
+        Args:
+            text: Cleaned OCR text
+            language: Tesseract language string (e.g. 'fra+eng')
+
+        Returns:
+            (corrected text, list of {'word', 'correction', 'confidence'})
+        """
+        lexicons = self.lexicons(language) if text else []
+        if not lexicons:
+            return text, []
+
+        corrections = []
+        pieces = []
+        position = 0
+        previous_end = 0
+        for match in _TOKENS.finditer(text):
+            token = match.group()
+            # Only the non-letter gap since the previous token decides whether
+            # this one starts a sentence (tokens never touch)
+            gap = text[previous_end:match.start()]
+            mid_sentence = bool(previous_end or gap.strip()) and not _SENTENCE_END.search(gap)
+            previous_end = match.end()
+            replacement = self._correct_token(token, mid_sentence, lexicons)
+            if replacement is None:
+                continue
+            correction, confidence = replacement
+            corrections.append({'word': token, 'correction': correction, 'confidence': confidence})
+            if confidence >= self.min_confidence:
+                pieces.append(text[position:match.start()])
+                pieces.append(correction)
+                position = match.end()
+        pieces.append(text[position:])
+        return ''.join(pieces), corrections
+
+    def _correct_token(self, token, mid_sentence, lexicons):
+        """(correction, confidence) for one token, or None to keep it"""
+        if len(token) < self.min_length:
+            return None
+        word = token.lower()
+        if any(word in lexicon for lexicon in lexicons):
+            return None
+        if token.isupper() and len(token) <= 4:
+            # Acronym
+            return None
+        if token[0].isupper() and mid_sentence:
+            # Capitalized mid-sentence: most likely a name
+            return None
+
+        best = None
+        for lexicon in lexicons:
+            found = lexicon.correct(word)
+            if found and (best is None or found[1] > best[1]):
+                best = found
+        if best is None:
+            return None
+
+        correction, confidence = best
+        # Keep the token's capitalization
+        if token.isupper():
+            correction = correction.upper()
+        elif token[0].isupper():
+            correction = correction[0].upper() + correction[1:]
+        return correction, confidence
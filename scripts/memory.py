@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Memory Watchdog for Reading Eye - Raspberry Pi
+- Samples the process RSS on a background thread and exports it as a gauge
+- Records how much memory each stage (capture, OCR, speech...) grows the
+  process by, and optionally Python allocations via tracemalloc
+- Enforces a memory budget: over budget it collects garbage and returns freed
+  heap to the OS, logs the largest allocation sites, and can stop the
+  application so the service manager restarts it
+"""
+import os
+import gc
+import logging
+import threading
+import tracemalloc
+import _thread
+from contextlib import contextmanager
+
+try:
+    from .metrics import registry as metrics
+except ImportError:
+    from metrics import registry as metrics
+
+logger = logging.getLogger(__name__)
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def rss_bytes():
+    """Resident set size of this process (0 where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _release_heap():
+    """Ask glibc to hand freed heap pages back to the OS"""
+    try:
+        import ctypes
+        ctypes.CDLL('libc.so.6').malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+class MemoryWatchdog:
+    """Periodic RSS checks against a budget, plus per-stage memory growth"""
+
+    def __init__(self, budget_mb=0, interval=30.0, trace=False, exit_over_budget=False):
+        """
+        Initialize watchdog
+
+        Args:
+            budget_mb: RSS budget in megabytes (0 = only monitor)
+            interval: Seconds between checks
+            trace: Also track Python allocations with tracemalloc (slower)
+            exit_over_budget: Stop the application when memory stays over
+                budget after reclaiming
+        """
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.interval = interval
+        self.trace = trace
+        self.exit_over_budget = exit_over_budget
+        self.peak_rss = 0
+        # Set when the watchdog stopped the application
+        self.exceeded = False
+        # Stage name -> {'calls', 'rss_growth', 'traced_growth'} (largest growth seen)
+        self.stages = {}
+        self._over_budget = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the checking thread"""
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        metrics.gauge_callback('memory_rss_bytes', rss_bytes)
+        self._thread = threading.Thread(target=self._run, name='memory-watchdog', daemon=True)
+        self._thread.start()
+        budget = f"{self.budget // (1024 * 1024)} MB budget" if self.budget else "no budget"
+        logger.info(f"Memory watchdog started ({budget}, RSS {rss_bytes() // (1024 * 1024)} MB)")
+        return self
+
+    def stop(self):
+        """Stop the checking thread and log the per-stage summary"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        self.report()
+        if self.trace and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name):
+        """Measure how much a block grows memory: `with watchdog.stage('ocr'): ...`"""
+        rss_before = rss_bytes()
+        traced_before = tracemalloc.get_traced_memory()[0] if self.trace else 0
+        try:
+            yield
+        finally:
+            entry = self.stages.setdefault(name, {'calls': 0, 'rss_growth': 0, 'traced_growth': 0})
+            entry['calls'] += 1
+            entry['rss_growth'] = max(entry['rss_growth'], rss_bytes() - rss_before)
+            if self.trace:
+                traced = tracemalloc.get_traced_memory()[0] - traced_before
+                entry['traced_growth'] = max(entry['traced_growth'], traced)
+
+    def check(self):
+        """
+        Sample memory and enforce the budget
+
+        Returns:
+            Current RSS in bytes
+        """
+        rss = rss_bytes()
+        self.peak_rss = max(self.peak_rss, rss)
+        metrics.set_gauge('memory_peak_rss_bytes', self.peak_rss)
+        if self.trace:
+            metrics.set_gauge('memory_traced_bytes', tracemalloc.get_traced_memory()[0])
+        if not self.budget or rss <= self.budget:
+            self._over_budget = False
+            return rss
+
+        logger.warning(f"Memory over budget: RSS {rss // (1024 * 1024)} MB > "
+                       f"{self.budget // (1024 * 1024)} MB, reclaiming")
+        metrics.inc('memory_over_budget')
+        gc.collect()
+        _release_heap()
+        rss = rss_bytes()
+        if rss <= self.budget:
+            logger.info(f"Memory back within budget: RSS {rss // (1024 * 1024)} MB")
+            self._over_budget = False
+            return rss
+
+        if not self._over_budget:
+            # Full breakdown once per excursion over budget
+            self.report()
+            self._over_budget = True
+        if self.exit_over_budget:
+            logger.error("Memory still over budget after reclaiming, stopping")
+            self.exceeded = True
+            # Raises KeyboardInterrupt in the main thread, which cleans up and exits
+            _thread.interrupt_main()
+            self._stop.set()
+        return rss
+
+    def report(self):
+        """Log RSS, per-stage growth and (when tracing) the top allocation sites"""
+        logger.info(f"Memory: RSS {rss_bytes() // (1024 * 1024)} MB, "
+                    f"peak {self.peak_rss // (1024 * 1024)} MB")
+        for name, entry in sorted(self.stages.items()):
+            traced = f", Python +{entry['traced_growth'] // 1024} KiB" if self.trace else ""
+            logger.info(f"  {name:<12} {entry['calls']:>6} calls, "
+                        f"largest RSS growth {entry['rss_growth'] // 1024} KiB{traced}")
+        if self.trace and tracemalloc.is_tracing():
+            for stat in tracemalloc.take_snapshot().statistics('lineno')[:5]:
+                logger.info(f"  {stat}")
+
+    def _run(self):
+        """Watchdog thread"""
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Memory watchdog error: {e}")
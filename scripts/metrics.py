@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Runtime Metrics for Reading Eye - Raspberry Pi
+- Latency histograms, counters and gauges for each pipeline stage
+- Optional local HTTP or Unix-socket endpoint in Prometheus text format (/metrics, /metrics.json)
+- Optional periodic structured JSON log lines
+- Disabled by default; a disabled timer is a shared no-op object
+"""
+import os
+import json
+import time
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'reading_eye_'
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Histogram:
+    """Cumulative-bucket latency histogram"""
+
+    __slots__ = ('buckets', 'counts', 'count', 'total', 'maximum')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+
+class _Timer:
+    """Context manager recording elapsed seconds into a histogram"""
+
+    __slots__ = ('_registry', '_name', '_start')
+
+    def __init__(self, registry, name):
+        self._registry = registry
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._registry.observe(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class _NullTimer:
+    """Shared do-nothing timer used while metrics are disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Thread-safe store of histograms, counters and gauges"""
+
+    def __init__(self):
+        """Create an empty, disabled registry"""
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._gauges = {}
+        self._gauge_callbacks = {}
+
+    def timer(self, name):
+        """Time a block: `with metrics.timer('ocr'): ...` (records seconds)"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def observe(self, name, value):
+        """Record a latency sample in seconds"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram()
+            histogram.observe(value)
+
+    def inc(self, name, amount=1):
+        """Increase a counter"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name, value):
+        """Set a gauge to a value"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[name] = value
+
+    def gauge_callback(self, name, func):
+        """Register a gauge computed on demand (e.g. a queue depth)"""
+        with self._lock:
+            self._gauge_callbacks[name] = func
+
+    def _gauge_values(self):
+        """Static gauges plus evaluated callbacks"""
+        values = dict(self._gauges)
+        for name, func in self._gauge_callbacks.items():
+            try:
+                values[name] = func()
+            except Exception:
+                continue
+        return values
+
+    def snapshot(self):
+        """Plain dict of all metrics"""
+        with self._lock:
+            histograms = {
+                name: {
+                    'count': h.count,
+                    'sum_s': round(h.total, 6),
+                    'mean_ms': round(1000 * h.total / h.count, 3) if h.count else 0.0,
+                    'max_ms': round(1000 * h.maximum, 3),
+                }
+                for name, h in self._histograms.items()
+            }
+            counters = dict(self._counters)
+            gauges = self._gauge_values()
+        return {'histograms': histograms, 'counters': counters, 'gauges': gauges}
+
+    def render_prometheus(self):
+        """Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name, h in sorted(self._histograms.items()):
+                metric = f"{PREFIX}{name}_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{le="+Inf"}} {h.count}')
+                lines.append(f"{metric}_sum {h.total:.6f}")
+                lines.append(f"{metric}_count {h.count}")
+            for name, value in sorted(self._counters.items()):
+                metric = f"{PREFIX}{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+            for name, value in sorted(self._gauge_values().items()):
+                metric = f"{PREFIX}{name}"
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric} {value}")
+        return '\n'.join(lines) + '\n'
+
+
+# Shared registry used by all modules
+registry = MetricsRegistry()
+
+
+def _server_classes():
+    """
+    HTTP handler and Unix-socket server classes
+
+    Built on first use: http.server costs tens of milliseconds to import and
+    this module is loaded by every component, enabled or not.
+    """
+    import socketserver
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Serves /metrics (Prometheus) and /metrics.json"""
+
+        def do_GET(self):
+            if self.path == '/metrics':
+                body = registry.render_prometheus().encode('utf-8')
+                content_type = 'text/plain; version=0.0.4; charset=utf-8'
+            elif self.path == '/metrics.json':
+                body = json.dumps(registry.snapshot()).encode('utf-8')
+                content_type = 'application/json'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            """Keep scrapes out of the application log"""
+
+    class UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+        """HTTP over a Unix socket (curl --unix-socket PATH http://localhost/metrics)"""
+
+        daemon_threads = True
+
+        def server_bind(self):
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
+            super().server_bind()
+
+    return MetricsHandler, UnixHTTPServer, ThreadingHTTPServer
+
+
+def start_server(port=None, socket_path=None, host='127.0.0.1'):
+    """
+    Serve metrics in a background thread
+
+    Args:
+        port: TCP port for a local HTTP endpoint
+        socket_path: Unix socket path (used instead of the port when set)
+        host: Bind address for the TCP endpoint (local only by default)
+
+    Returns:
+        The server (call shutdown() to stop), or None if disabled or on error
+    """
+    handler, unix_server, tcp_server = _server_classes()
+    try:
+        if socket_path:
+            server = unix_server(socket_path, handler)
+            where = f"unix:{socket_path}"
+        elif port:
+            server = tcp_server((host, port), handler)
+            server.daemon_threads = True
+            where = f"http://{host}:{port}/metrics"
+        else:
+            return None
+    except OSError as e:
+        logger.error(f"Metrics endpoint unavailable: {e}")
+        return None
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    logger.info(f"Metrics endpoint: {where}")
+    return server
+
+
+class JsonLogReporter:
+    """Writes a structured JSON metrics line to the log at a fixed interval"""
+
+    def __init__(self, interval=60.0):
+        """
+        Initialize reporter
+
+        Args:
+            interval: Seconds between log lines
+        """
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='metrics-log', daemon=True)
+
+    def start(self):
+        """Start the reporter thread"""
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.log_once()
+
+    @staticmethod
+    def log_once():
+        """Write one JSON metrics line"""
+        line = dict(registry.snapshot(), type='metrics', ts=round(time.time(), 3))
+        logger.info(json.dumps(line, separators=(',', ':')))
+
+    def stop(self):
+        """Stop the reporter and write a final line"""
+        self._stop_event.set()
+        self.log_once()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+New-Text Filter for Reading Eye - Raspberry Pi
+- Remembers recently spoken sentences (bounded, safe for all-day runs)
+- Tolerates small OCR differences between captures of the same text
+- Lets loop mode speak only sentences it has not read out yet
+"""
+import re
+import logging
+from collections import OrderedDict
+from difflib import SequenceMatcher
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_END = re.compile(r"(?<=[.!?;:…؟])\s+|\n+")
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+class NoveltyFilter:
+    """Keep only the sentences of an OCR result that were not seen recently"""
+
+    def __init__(self, max_entries=256, similarity=0.85, min_chars=3):
+        """
+        Initialize filter
+
+        Args:
+            max_entries: Number of recent sentences remembered (LRU)
+            similarity: Match ratio (0-1) above which two sentences are
+                considered the same text read with OCR noise
+            min_chars: Segments shorter than this (after normalization) are ignored
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.similarity = float(similarity)
+        self.min_chars = int(min_chars)
+        self._seen = OrderedDict()   # normalized sentence -> None, oldest first
+
+    @staticmethod
+    def _normalize(segment):
+        """Lowercase and drop punctuation/spacing, which OCR often gets wrong"""
+        return _NON_WORD.sub('', segment.lower())
+
+    def _find_similar(self, key):
+        """Return a remembered sentence close enough to key, or None"""
+        if key in self._seen:
+            return key
+        matcher = SequenceMatcher(autojunk=False)
+        matcher.set_seq2(key)
+        for candidate in reversed(self._seen):
+            # Cheap length bound before the real comparison
+            if 2.0 * min(len(candidate), len(key)) / (len(candidate) + len(key)) < self.similarity:
+                continue
+            matcher.set_seq1(candidate)
+            if matcher.quick_ratio() >= self.similarity and matcher.ratio() >= self.similarity:
+                return candidate
+        return None
+
+    def _remember(self, key):
+        """Add or refresh a sentence, evicting the least recent one if full"""
+        self._seen[key] = None
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+
+    def filter(self, text):
+        """
+        Extract the new part of an OCR result
+
+        Args:
+            text: Recognized text
+
+        Returns:
+            New sentences joined with spaces ('' if nothing is new)
+        """
+        if not text:
+            return ""
+
+        new_segments = []
+        for segment in _SEGMENT_END.split(text.strip()):
+            segment = segment.strip()
+            key = self._normalize(segment)
+            if len(key) < self.min_chars:
+                continue
+            match = self._find_similar(key)
+            if match is None:
+                new_segments.append(segment)
+                self._remember(key)
+            else:
+                self._remember(match)
+
+        if new_segments:
+            logger.debug(f"New text: {len(new_segments)} segment(s)")
+        return ' '.join(new_segments)
+
+    def reset(self):
+        """Forget everything seen so far"""
+        self._seen.clear()
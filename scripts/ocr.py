@@ -4,36 +4,687 @@ OCR Module for Reading Eye - Raspberry Pi Version
 - Uses Tesseract for text extraction
 - Supports multiple languages: Arabic, French, English
 - Optimized for Raspberry Pi with headless operation
+- Pluggable backends: persistent in-process engine (tesserocr) or pytesseract
+- Optional text-region detection with per-region OCR in a process pool
+- 'auto' language mode: script detection picks the narrowest model per scene
+- Optional LRU result cache keyed by a noise-tolerant fingerprint of the frame
+- Optional preprocessing: glyph-height normalization, deskew, adaptive binarization
+- Word confidences on every result; optional multi-pass mode escalates only
+  low-confidence frames/regions to slower, more thorough settings
 """
 import os
-import pytesseract
+import functools
+import importlib.util
 import shutil
 import subprocess
 import re
+import threading
 import logging
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .cache import OCRCache
+    from .lexicon import Corrector
+    from .metrics import registry as metrics
+    from .scene import SceneChangeDetector
+except ImportError:
+    from cache import OCRCache
+    from lexicon import Corrector
+    from metrics import registry as metrics
+    from scene import SceneChangeDetector
 
 logger = logging.getLogger(__name__)
 
+# Checked without importing; libtesseract is loaded when the backend is created
+TESSEROCR_AVAILABLE = importlib.util.find_spec('tesserocr') is not None
+
+OCR_BACKENDS = ('auto', 'tesserocr', 'pytesseract')
+
+AUTO_LANGUAGE = 'auto'
+
+# The auto language is re-detected when the frame differs from the one it was
+# detected on by more than this mean thumbnail difference. Much finer than the
+# loop-mode scene gate: two different pages on the same layout differ by about
+# 3 at this size, sensor noise by about 0.5, and a needless re-detection only
+# costs time while a missed one reads the page with the wrong model.
+_LANGUAGE_SCENE_THRESHOLD = 2.0
+_LANGUAGE_THUMB_WIDTH = 128
+
+# Width of the OCR cache thumbnail: wide enough that one changed digit in
+# small print stands out from sensor noise (about 37 KB per 16:9 entry)
+_CACHE_THUMB_WIDTH = 256
+
+# Multi-pass OCR tiers, cheapest first: (name, image scale, page segmentation
+# mode). The 'fast' scale is replaced by the configured fast_scale.
+OCR_PASSES = (
+    ('fast', 0.5, 6),
+    ('full', 1.0, 6),
+    ('thorough', 1.5, 3),
+)
+
+# Characters _clean_text removes, per script, and whitespace runs it collapses
+_ARABIC_NOISE = re.compile(r"[^\u0600-\u06FF\s.,?!;:'\"()\-]")
+_LATIN_NOISE = re.compile(r"[^a-zA-Z0-9À-ÿ.,?!;:'\"()\-\s]")
+_SPACES = re.compile(r"\s+")
+
+# Markers used to tell Latin-script languages apart from a first OCR pass
+_ARABIC_CHARS = re.compile(r"[\u0600-\u06FF]")
+_LATIN_CHARS = re.compile(r"[a-zA-ZÀ-ÿ]")
+_WORDS = re.compile(r"[a-zà-ÿ']+")
+_LANGUAGE_MARKERS = {
+    'fra': {
+        'accents': set('éèêàçùâîôûëïœ'),
+        'words': {'le', 'la', 'les', 'des', 'et', 'est', 'une', 'du', 'pour',
+                  'dans', 'que', 'en', 'au', 'sur', 'avec', 'pas', 'vous'},
+    },
+    'eng': {
+        'accents': set(),
+        'words': {'the', 'and', 'of', 'to', 'is', 'in', 'for', 'with', 'on',
+                  'this', 'you', 'are', 'that', 'be', 'it', 'not'},
+    },
+}
+
+
+def frame_fingerprint(gray, thumb_width=_CACHE_THUMB_WIDTH, hash_size=32, margin=2):
+    """
+    Noise-tolerant fingerprint of a frame for the OCR cache
+
+    Returns:
+        Tuple (difference hash of hash_size * hash_size bits, thumbnail).
+        Area downscaling averages out sensor noise, so recaptures of one page
+        get close hashes; the thumbnail keeps enough detail for OCRCache to
+        tell apart pages that differ by a single word. Gradients below
+        margin count as flat, so plain paper does not produce random bits.
+    """
+    import cv2
+    import numpy as np
+    height, width = gray.shape[:2]
+    thumb_width = min(thumb_width, width)
+    thumb_height = max(1, int(round(height * thumb_width / float(width))))
+    thumbnail = cv2.resize(gray, (thumb_width, thumb_height), interpolation=cv2.INTER_AREA)
+    small = cv2.resize(thumbnail, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    small = small.astype(np.int16)
+    bits = ((small[:, 1:] - small[:, :-1]) > margin).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big'), thumbnail
+
+
+@functools.lru_cache(maxsize=None)
+def _region_kernels():
+    """Text-region detection kernels (sized for a ~960 px wide detection image)"""
+    import cv2
+    return (cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)),
+            cv2.getStructuringElement(cv2.MORPH_RECT, (15, 5)))
+
+
+def _parse_tesseract_config(config):
+    """
+    Split a tesseract CLI config string into its parts
+
+    Args:
+        config: String like '--oem 3 --psm 6 -c preserve_interword_spaces=1'
+
+    Returns:
+        Tuple (oem, psm, variables dict)
+    """
+    oem, psm, variables = 3, 6, {}
+    tokens = config.split() if config else []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        value = tokens[i + 1] if i + 1 < len(tokens) else None
+        if token == '--oem' and value is not None:
+            oem = int(value)
+            i += 1
+        elif token == '--psm' and value is not None:
+            psm = int(value)
+            i += 1
+        elif token == '-c' and value is not None and '=' in value:
+            key, val = value.split('=', 1)
+            variables[key] = val
+            i += 1
+        i += 1
+    return oem, psm, variables
+
+
+def _data_to_text(data):
+    """
+    Rebuild text and word confidences from pytesseract image_to_data output
+    
+    Returns:
+        Tuple (text with one line per Tesseract text line, list of word
+        confidences 0-100)
+    """
+    lines, words, confidences = [], [], []
+    current_line = None
+    for i, word in enumerate(data['text']):
+        confidence = float(data['conf'][i])
+        if confidence < 0 or not word.strip():
+            continue
+        line = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        if line != current_line and words:
+            lines.append(' '.join(words))
+            words = []
+        current_line = line
+        words.append(word)
+        confidences.append(confidence)
+    if words:
+        lines.append(' '.join(words))
+    return '\n'.join(lines), confidences
+
+
+def mean_confidence(confidences):
+    """Average word confidence (0-100), 0 when nothing was recognized"""
+    return round(sum(confidences) / float(len(confidences)), 1) if len(confidences) else 0.0
+
+
+def run_passes(recognize, image, language, passes, escalate_below):
+    """
+    Recognize with increasingly thorough settings until one is confident
+    
+    Args:
+        recognize: Callable (image, language, config) -> (text, confidences)
+        image: Image to recognize
+        language: Tesseract language string
+        passes: List of (name, scale, config), cheapest first
+        escalate_below: Mean word confidence that ends the escalation
+    
+    Returns:
+        Dict with the most confident pass's 'text', 'confidence' and
+        'pass' name, plus the number of 'passes' run
+    """
+    import cv2
+    best = None
+    count = 0
+    for name, scale, config in passes:
+        pass_image = image
+        if scale != 1.0:
+            interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+            pass_image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=interpolation)
+        text, confidences = recognize(pass_image, language, config)
+        count += 1
+        confidence = mean_confidence(confidences)
+        if best is None or confidence > best['confidence']:
+            best = {'text': text, 'confidence': confidence, 'pass': name}
+        if confidence >= escalate_below:
+            break
+        if not confidences and scale >= 1.0:
+            # Nothing that looks like text even at full resolution
+            break
+    best['passes'] = count
+    return best
+
+
+def default_tesseract_cmd():
+    """Tesseract binary: TESSERACT_CMD, then PATH, then the usual Linux/Pi location"""
+    return os.environ.get('TESSERACT_CMD') or shutil.which('tesseract') or '/usr/bin/tesseract'
+
+
+class PytesseractBackend:
+    """
+    OCR backend that shells out to the tesseract binary via pytesseract
+
+    pytesseract (and PIL with it) is imported on first use.
+    """
+
+    name = 'pytesseract'
+
+    def __init__(self, tesseract_cmd=None):
+        """
+        Initialize backend
+
+        Args:
+            tesseract_cmd: Path to the tesseract binary (auto-detected if None)
+        """
+        self.tesseract_cmd = tesseract_cmd or default_tesseract_cmd()
+
+    def _pytesseract(self):
+        """The pytesseract module, pointed at this backend's binary"""
+        import pytesseract
+        pytesseract.pytesseract.tesseract_cmd = self.tesseract_cmd
+        return pytesseract
+
+    def image_to_string(self, image, lang, config):
+        """Run OCR on an image and return the raw text"""
+        return self._pytesseract().image_to_string(image, lang=lang, config=config)
+
+    def image_to_data(self, image, lang, config):
+        """Run OCR and return (text, word confidences 0-100)"""
+        pytesseract = self._pytesseract()
+        data = pytesseract.image_to_data(
+            image, lang=lang, config=config, output_type=pytesseract.Output.DICT
+        )
+        return _data_to_text(data)
+
+    def detect_script(self, image):
+        """
+        Run Tesseract orientation and script detection
+        
+        Returns:
+            Tuple (script name such as 'Latin' or 'Arabic', confidence)
+        """
+        pytesseract = self._pytesseract()
+        osd = pytesseract.image_to_osd(image, output_type=pytesseract.Output.DICT)
+        return osd.get('script'), float(osd.get('script_conf', 0.0))
+
+    def close(self):
+        """Nothing to release - every call spawns its own process"""
+
+
+class TesserocrBackend:
+    """
+    Persistent in-process Tesseract engine using tesserocr
+
+    One TessBaseAPI is created per (language, oem) combination and kept
+    for the lifetime of the backend, so traineddata is loaded only once.
+    """
+
+    name = 'tesserocr'
+
+    def __init__(self, tessdata_prefix=None):
+        """
+        Initialize backend
+
+        Args:
+            tessdata_prefix: Tesseract data directory (auto-detected if None)
+        """
+        if not TESSEROCR_AVAILABLE:
+            raise RuntimeError("tesserocr is not installed")
+        import tesserocr
+        self._tesserocr = tesserocr
+
+        self.tessdata_path = self._resolve_tessdata_path(tessdata_prefix)
+        self._apis = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _resolve_tessdata_path(prefix):
+        """Return the directory holding *.traineddata, or None for the library default"""
+        if not prefix or not os.path.isdir(prefix):
+            return None
+        candidates = [os.path.join(prefix, 'tessdata'), prefix]
+        # Debian/Raspberry Pi OS layout: /usr/share/tesseract-ocr/<version>/tessdata
+        for entry in sorted(os.listdir(prefix), reverse=True):
+            candidates.append(os.path.join(prefix, entry, 'tessdata'))
+        for path in candidates:
+            if os.path.isdir(path) and any(f.endswith('.traineddata') for f in os.listdir(path)):
+                return path
+        return None
+
+    def _get_api(self, lang, oem):
+        """Get (or lazily create) the engine for a language combination"""
+        key = (lang, oem)
+        with self._lock:
+            api = self._apis.get(key)
+            if api is None:
+                # OEM and PSM are plain int constants in tesserocr, not enum types
+                kwargs = {'lang': lang, 'oem': oem}
+                if self.tessdata_path:
+                    kwargs['path'] = self.tessdata_path
+                api = self._tesserocr.PyTessBaseAPI(**kwargs)
+                self._apis[key] = api
+                self._locks[key] = threading.Lock()
+                logger.info(f"tesserocr engine loaded: lang={lang}, oem={oem}")
+            return api, self._locks[key]
+
+    @staticmethod
+    def _set_image(api, image):
+        """Hand a numpy image to tesseract without going through a file"""
+        import numpy as np
+        if image.ndim == 3:
+            # OpenCV images are BGR, tesseract expects RGB
+            image = image[..., ::-1]
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        bpp = 1 if image.ndim == 2 else image.shape[2]
+        api.SetImageBytes(image.tobytes(), width, height, bpp, width * bpp)
+
+    def image_to_string(self, image, lang, config):
+        """Run OCR on an image and return the raw text"""
+        oem, psm, variables = _parse_tesseract_config(config)
+        api, lock = self._get_api(lang, oem)
+        with lock:
+            api.SetPageSegMode(psm)
+            for key, value in variables.items():
+                api.SetVariable(key, value)
+            self._set_image(api, image)
+            text = api.GetUTF8Text()
+            api.Clear()
+        return text
+
+    def image_to_data(self, image, lang, config):
+        """Run OCR and return (text, word confidences 0-100)"""
+        oem, psm, variables = _parse_tesseract_config(config)
+        api, lock = self._get_api(lang, oem)
+        with lock:
+            api.SetPageSegMode(psm)
+            for key, value in variables.items():
+                api.SetVariable(key, value)
+            self._set_image(api, image)
+            text = api.GetUTF8Text()
+            confidences = [float(conf) for _, conf in api.MapWordConfidences()]
+            api.Clear()
+        return text, confidences
+
+    def detect_script(self, image):
+        """
+        Run Tesseract orientation and script detection
+        
+        Returns:
+            Tuple (script name such as 'Latin' or 'Arabic', confidence)
+        """
+        api, lock = self._get_api('osd', 3)
+        with lock:
+            api.SetPageSegMode(self._tesserocr.PSM.OSD_ONLY)
+            self._set_image(api, image)
+            osd = api.DetectOrientationScript()
+            api.Clear()
+        if not osd:
+            return None, 0.0
+        return osd.get('script_name'), float(osd.get('script_conf', 0.0))
+
+    def close(self):
+        """Release all loaded engines"""
+        with self._lock:
+            for api in self._apis.values():
+                try:
+                    api.End()
+                except Exception as e:
+                    logger.error(f"tesserocr shutdown error: {e}")
+            self._apis.clear()
+            self._locks.clear()
+
+
+def create_backend(name='auto', tessdata_prefix=None, tesseract_cmd=None):
+    """
+    Create an OCR backend by name
+
+    Args:
+        name: 'auto', 'tesserocr' or 'pytesseract'
+        tessdata_prefix: Tesseract data directory
+        tesseract_cmd: Tesseract binary for the pytesseract backend
+
+    Returns:
+        Backend instance (pytesseract if the requested one is unavailable)
+    """
+    name = (name or 'auto').lower()
+    if name not in OCR_BACKENDS:
+        logger.warning(f"Unknown OCR backend '{name}', using auto")
+        name = 'auto'
+
+    if name in ('auto', 'tesserocr'):
+        if TESSEROCR_AVAILABLE:
+            try:
+                return TesserocrBackend(tessdata_prefix=tessdata_prefix)
+            except Exception as e:
+                logger.error(f"tesserocr backend unavailable: {e}")
+        elif name == 'tesserocr':
+            logger.warning("tesserocr not installed - falling back to pytesseract")
+
+    return PytesseractBackend(tesseract_cmd)
+
+
+def _reading_order(boxes):
+    """Sort (x, y, w, h) boxes top-to-bottom, then left-to-right within a row"""
+    rows = []
+    for box in sorted(boxes, key=lambda b: b[1]):
+        x, y, w, h = box
+        for row in rows:
+            # Same row if the box overlaps the row's vertical band by half its height
+            top, bottom = row['top'], row['bottom']
+            if min(bottom, y + h) - max(top, y) > 0.5 * min(h, bottom - top):
+                row['boxes'].append(box)
+                row['top'], row['bottom'] = min(top, y), max(bottom, y + h)
+                break
+        else:
+            rows.append({'top': y, 'bottom': y + h, 'boxes': [box]})
+    ordered = []
+    for row in rows:
+        ordered.extend(sorted(row['boxes'], key=lambda b: b[0]))
+    return ordered
+
+
+def detect_text_regions(gray, max_width=960, padding=8):
+    """
+    Locate candidate text blocks with a morphological gradient + contours
+    
+    Args:
+        gray: Grayscale image
+        max_width: Detection runs on a copy downscaled to this width
+        padding: Pixels added around each block (full-resolution scale)
+    
+    Returns:
+        List of (x, y, w, h) boxes in reading order
+    """
+    import cv2
+    height, width = gray.shape[:2]
+    scale = min(1.0, max_width / float(width))
+    small = gray
+    if scale < 1.0:
+        small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    
+    # Strokes light up in the gradient; closing joins letters into words and lines into blocks
+    gradient_kernel, block_kernel = _region_kernels()
+    gradient = cv2.morphologyEx(small, cv2.MORPH_GRADIENT, gradient_kernel)
+    _, binary = cv2.threshold(gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    connected = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, block_kernel)
+    contours, _ = cv2.findContours(connected, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    
+    boxes = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if h < 6 or w < 10:
+            continue
+        # Text blocks are partly filled with strokes; solid blobs and thin lines are not
+        density = cv2.countNonZero(binary[y:y + h, x:x + w]) / float(w * h)
+        if density < 0.1 or density > 0.9:
+            continue
+        x0 = max(0, int(x / scale) - padding)
+        y0 = max(0, int(y / scale) - padding)
+        x1 = min(width, int((x + w) / scale) + padding)
+        y1 = min(height, int((y + h) / scale) + padding)
+        boxes.append((x0, y0, x1 - x0, y1 - y0))
+    
+    return _reading_order(boxes)
+
+
+# Preprocessing limits: rescale factor range, largest output width, and the
+# scale band inside which resampling is not worth its cost
+# Upsampling is capped: recognition time grows with the pixel count, and a
+# 1080p frame with small print would otherwise be blown up to ~9 MP (hundreds
+# of milliseconds per frame on a desktop CPU, seconds on a Pi). Frames already
+# at 1080p are never upsampled; small frames and region crops at most 1.5x.
+_MIN_SCALE, _MAX_SCALE = 0.25, 1.5
+_MAX_OUTPUT_PIXELS = 1920 * 1080
+_SCALE_DEADBAND = (0.85, 1.2)
+
+
+def _analysis_image(gray, max_width=1280):
+    """
+    Downscaled, inverted (text = white) binary copy used for measurements
+
+    Returns:
+        Tuple (binary image, downscale factor)
+    """
+    import cv2
+    factor = min(1.0, max_width / float(gray.shape[1]))
+    small = gray
+    if factor < 1.0:
+        small = cv2.resize(gray, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA)
+    block = max(15, (small.shape[0] // 20) | 1)
+    binary = cv2.adaptiveThreshold(
+        small, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, block, 15
+    )
+    return binary, factor
+
+
+def estimate_text_height(binary, min_components=5):
+    """
+    Dominant glyph height of a text-white binary image
+
+    Args:
+        binary: Output of _analysis_image
+        min_components: Glyph-like components needed for an estimate
+
+    Returns:
+        Median glyph height in pixels, or None if there is too little text
+    """
+    import cv2
+    import numpy as np
+    _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    heights = stats[1:, cv2.CC_STAT_HEIGHT]
+    widths = stats[1:, cv2.CC_STAT_WIDTH]
+    areas = stats[1:, cv2.CC_STAT_AREA]
+    # Letter-shaped: not specks, not lines/borders, partly filled
+    glyphs = (
+        (heights >= 4) & (heights <= binary.shape[0] // 4) &
+        (widths <= 5 * heights) & (areas >= 0.1 * widths * heights)
+    )
+    if np.count_nonzero(glyphs) < min_components:
+        return None
+    return float(np.median(heights[glyphs]))
+
+
+def estimate_skew(binary, max_angle=10.0, max_width=600):
+    """
+    Text line angle by projection profile: the rotation that makes row sums
+    sharpest lines the text up horizontally
+
+    Args:
+        binary: Text-white binary image
+        max_angle: Largest skew searched, in degrees
+        max_width: Search runs on a copy downscaled to this width
+
+    Returns:
+        Rotation angle in degrees (cv2.getRotationMatrix2D convention)
+    """
+    import cv2
+    import numpy as np
+    factor = min(1.0, max_width / float(binary.shape[1]))
+    if factor < 1.0:
+        binary = cv2.resize(binary, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA)
+    height, width = binary.shape[:2]
+    center = (width / 2.0, height / 2.0)
+
+    def sharpness(angle):
+        matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
+        rotated = cv2.warpAffine(binary, matrix, (width, height), flags=cv2.INTER_NEAREST)
+        profile = rotated.sum(axis=1, dtype=np.float64)
+        return float(np.sum(np.diff(profile) ** 2))
+
+    # Coarse 1 degree search, then refine to 0.2 degrees
+    best = max(np.arange(-max_angle, max_angle + 0.5, 1.0), key=sharpness)
+    best = max(np.arange(best - 0.8, best + 0.9, 0.2), key=sharpness)
+    return round(float(best), 1)
+
+
+def preprocess_for_ocr(gray, target_height=20, deskew=True, binarize=True):
+    """
+    Normalize an image for Tesseract: rescale so glyphs are about
+    target_height pixels tall (large print is downsampled, small print
+    upsampled within _MAX_SCALE and _MAX_OUTPUT_PIXELS), straighten skewed
+    text and binarize with a local threshold
+
+    Args:
+        gray: Grayscale image
+        target_height: Desired median glyph height in pixels
+        deskew: Rotate text lines to horizontal
+        binarize: Adaptive threshold to black text on white
+
+    Returns:
+        Preprocessed grayscale image
+    """
+    import cv2
+    binary, factor = _analysis_image(gray)
+    text_height = estimate_text_height(binary)
+    angle = estimate_skew(binary) if deskew and text_height else 0.0
+
+    scale = 1.0
+    if text_height:
+        scale = target_height / (text_height / factor)
+        scale = min(max(scale, _MIN_SCALE), _MAX_SCALE)
+        if scale > 1.0:
+            pixels = float(gray.shape[0] * gray.shape[1])
+            scale = min(scale, max(1.0, (_MAX_OUTPUT_PIXELS / pixels) ** 0.5))
+        if _SCALE_DEADBAND[0] < scale < _SCALE_DEADBAND[1]:
+            scale = 1.0
+
+    image = gray
+    if scale != 1.0:
+        interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=interpolation)
+
+    if abs(angle) >= 0.3:
+        height, width = image.shape[:2]
+        matrix = cv2.getRotationMatrix2D((width / 2.0, height / 2.0), angle, 1.0)
+        image = cv2.warpAffine(image, matrix, (width, height), flags=cv2.INTER_LINEAR,
+                               borderMode=cv2.BORDER_REPLICATE)
+
+    if binarize:
+        # Neighbourhood of about two glyphs: evens out shadows and uneven lighting
+        block = max(15, int(2 * target_height) | 1)
+        image = cv2.adaptiveThreshold(
+            image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block, 10
+        )
+
+    logger.debug(f"Preprocess: glyph height={text_height and text_height / factor}, "
+                 f"scale={scale:.2f}, skew={angle}, output={image.shape[1]}x{image.shape[0]}")
+    return image
+
+
+# Per-process backend used by the region OCR pool
+_worker_backend = None
+
+
+def _init_region_worker(backend, tessdata_prefix, tesseract_cmd):
+    """Process pool initializer - load one OCR backend per worker"""
+    global _worker_backend
+    _worker_backend = create_backend(backend, tessdata_prefix, tesseract_cmd)
+
+
+def _ocr_region(crop, language, passes, escalate_below):
+    """Process pool task - OCR a single cropped block"""
+    return run_passes(_worker_backend.image_to_data, crop, language, passes, escalate_below)
+
+
 class OCR:
     """Tesseract-based OCR for Reading Eye"""
     
-    def __init__(self, tesseract_cmd=None, tessdata_prefix=None):
+    def __init__(self, tesseract_cmd=None, tessdata_prefix=None, backend='auto',
+                 use_regions=False, region_workers=None, auto_languages=None,
+                 cache_size=0, cache_path=None, preprocess=False, text_height=20,
+                 deskew=True, binarize=True, multipass=False, escalate_confidence=80.0,
+                 fast_scale=0.5, lexicon_dir=None, lexicon_words=30000,
+                 correction_confidence=0.6):
         """
         Initialize OCR engine
         
         Args:
             tesseract_cmd: Path to tesseract binary (auto-detected if None)
             tessdata_prefix: Path to tessdata directory (auto-detected if None)
+            backend: OCR backend ('auto', 'tesserocr' or 'pytesseract')
+            use_regions: Detect text blocks and OCR only those
+            region_workers: Process pool size for region OCR (None = CPU count)
+            auto_languages: Candidate languages for lang='auto'
+                (default: fra, eng, ara)
+            cache_size: Number of OCR results to cache (0 disables the cache)
+            cache_path: JSON file to persist the cache to (None = memory only)
+            preprocess: Rescale to a normalized glyph height before OCR
+            text_height: Target median glyph height in pixels
+            deskew: Straighten skewed text (full-frame OCR only)
+            binarize: Adaptive-threshold the image before OCR
+            multipass: Start with a fast reduced-resolution pass and escalate
+                to slower settings only while confidence is low
+            escalate_confidence: Mean word confidence (0-100) that is good
+                enough to stop escalating
+            fast_scale: Image scale of the fast first pass
+            lexicon_dir: Directory of word lists (<language>.txt) for
+                post-correction (None disables it)
+            lexicon_words: Most frequent words to index per language
+            correction_confidence: Apply corrections at least this confident (0-1)
         """
         # Priority: explicit arg > env var > which > fallback
-        if tesseract_cmd:
-            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-        else:
-            pytesseract.pytesseract.tesseract_cmd = (
-                os.environ.get('TESSERACT_CMD') or
-                shutil.which('tesseract') or
-                '/usr/bin/tesseract'  # Common path on Linux/Pi
-            )
+        self.tesseract_cmd = tesseract_cmd or default_tesseract_cmd()
 
         if tessdata_prefix:
             os.environ['TESSDATA_PREFIX'] = tessdata_prefix
@@ -49,17 +700,46 @@ class OCR:
                     os.environ['TESSDATA_PREFIX'] = path
                     break
 
-        self.tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
         self.tessdata_prefix = os.environ.get('TESSDATA_PREFIX', '')
+        self.backend_name = backend
+        self.backend = create_backend(backend, self.tessdata_prefix, self.tesseract_cmd)
+        self._fallback_backend = None
+        self.use_regions = use_regions
+        self.region_workers = region_workers or os.cpu_count() or 1
+        self._pool = None
+        self.auto_languages = [
+            self._map_language_code(l) for l in (auto_languages or ['fra', 'eng', 'ara'])
+        ]
+        self.last_language = None
+        self._auto_language = None
+        self._language_scene = SceneChangeDetector(
+            threshold=_LANGUAGE_SCENE_THRESHOLD, settle_time=0.0,
+            thumb_width=_LANGUAGE_THUMB_WIDTH
+        )
+        self.cache = OCRCache(max_entries=cache_size, path=cache_path) if cache_size else None
+        self.preprocess = preprocess
+        self.text_height = text_height
+        self.deskew = deskew
+        self.binarize = binarize
+        self.multipass = multipass
+        self.escalate_confidence = escalate_confidence
+        self.fast_scale = fast_scale
+        self.corrector = None
+        if lexicon_dir:
+            self.corrector = Corrector(lexicon_dir, max_words=lexicon_words,
+                                       min_confidence=correction_confidence)
         
         logger.info(f"OCR initialized with tesseract: {self.tesseract_cmd}")
         logger.info(f"TESSDATA_PREFIX: {self.tessdata_prefix}")
+        logger.info(f"OCR backend: {self.backend.name}")
 
     def set_tesseract_cmd(self, path):
         """Set tesseract executable path"""
         if path and os.path.exists(path):
-            pytesseract.pytesseract.tesseract_cmd = path
             self.tesseract_cmd = path
+            for backend in (self.backend, self._fallback_backend):
+                if isinstance(backend, PytesseractBackend):
+                    backend.tesseract_cmd = path
             logger.info(f"Tesseract path set to: {path}")
 
     def set_tessdata_prefix(self, path):
@@ -116,34 +796,348 @@ class OCR:
         
         Args:
             image: OpenCV image (grayscale or color)
-            lang: Language code (eng, fra, ara, or combinations like 'eng+fra')
+            lang: Language code (eng, fra, ara, combinations like 'eng+fra',
+                or 'auto' to detect the script and use a single model)
         
         Returns:
             Extracted text string
         """
+        return self.extract_text_with_confidence(image, lang=lang)['text']
+
+    def extract_text_with_confidence(self, image, lang='eng'):
+        """
+        Extract text together with how sure Tesseract is about it
+        
+        Args:
+            image: OpenCV image (grayscale or color)
+            lang: Language code (as for extract_text_from_image)
+        
+        Returns:
+            Dict with 'text', 'confidence' (mean word confidence 0-100),
+            'passes' (OCR passes run, 0 for a cache hit), 'language' and
+            'corrections' (lexicon corrections, see _correct); 'error' is
+            present only when the engine failed (a page without text is
+            not an error)
+        """
+        import cv2
+        with metrics.timer('ocr'):
+            if self.cache is None:
+                return self._extract_text(image, lang)
+
+            gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            fingerprint = frame_fingerprint(gray)
+            config = (f"{self._tesseract_config(self._map_language_code(lang))}"
+                      f"|regions={self.use_regions}|prep={self._preprocess_key()}"
+                      f"|passes={self._passes_key()}|lexicon={self._lexicon_key()}")
+            cached = self.cache.get(fingerprint, lang, config)
+            if cached is not None:
+                metrics.inc('ocr_cache_hits')
+                self.last_language = cached['language']
+                return dict(cached, passes=0)
+
+            metrics.inc('ocr_cache_misses')
+            result = self._extract_text(image, lang)
+            if result['text']:
+                self.cache.put(fingerprint, lang, config, result)
+            return result
+
+    def _extract_text(self, image, lang):
+        """Uncached OCR of a full image"""
+        if self.use_regions:
+            result = self.extract_text_regions(image, lang=lang)
+            return {key: result[key] for key in ('text', 'confidence', 'passes', 'language',
+                                                 'corrections', 'error') if key in result}
+
         try:
+            image = self._prepare(image)
+            first_pass = None
+            if lang == AUTO_LANGUAGE:
+                lang, first_pass = self._resolve_auto_language(image)
+
             # Map 2-letter codes to 3-letter tesseract codes
             language = self._map_language_code(lang)
+            self.last_language = language
 
-            # Configure tesseract based on language
-            config = '--oem 3 --psm 6'
-            if 'ara' in language.lower():
-                # Arabic: preserve interword spaces
-                config = '--oem 3 --psm 6 -c preserve_interword_spaces=1'
-
-            # Run OCR
-            text = pytesseract.image_to_string(image, lang=language, config=config)
+            # Run OCR (single-pass auto mode may already have recognized with this model)
+            if first_pass is not None and not self.multipass:
+                text, confidences = first_pass
+                result = {'text': text, 'confidence': mean_confidence(confidences), 'passes': 1}
+            else:
+                result = run_passes(self._run_backend_data, image, language,
+                                    self._passes(language), self.escalate_confidence)
+            metrics.inc('ocr_passes', result['passes'])
             
-            # Clean text based on language
-            text = self._clean_text(text, language)
+            # Clean text based on language, then fix misrecognized words
+            text = self._clean_text(result['text'], language)
+            text, corrections = self._correct(text, language)
             
-            return text.strip()
+            return {'text': text.strip(), 'confidence': result['confidence'],
+                    'passes': result['passes'], 'language': language, 'corrections': corrections}
         except FileNotFoundError as e:
             logger.error(f"OCR file error: {e}")
-            return ""
+            error = str(e)
         except Exception as e:
             logger.error(f"OCR extraction error: {e}")
-            return ""
+            error = str(e)
+        return {'text': "", 'confidence': 0.0, 'passes': 0, 'language': self.last_language,
+                'corrections': [], 'error': error}
+
+    def extract_text_regions(self, image, lang='eng'):
+        """
+        Detect text blocks and OCR them concurrently
+        
+        Args:
+            image: OpenCV image (grayscale or color)
+            lang: Language code (eng, fra, ara, or combinations like 'eng+fra')
+        
+        Returns:
+            Dict with merged 'text', overall 'confidence', total 'passes',
+            'language', 'corrections' and 'blocks', a list of
+            {'box': (x, y, w, h), 'text': str, 'confidence': float,
+            'passes': int} in reading order ('error' as for
+            extract_text_with_confidence)
+        """
+        import cv2
+        try:
+            if lang == AUTO_LANGUAGE:
+                lang, _ = self._resolve_auto_language(image)
+            language = self._map_language_code(lang)
+            passes = self._passes(language)
+            self.last_language = language
+            gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            height, width = gray.shape[:2]
+
+            boxes = detect_text_regions(gray)
+            covered = sum(w * h for _, _, w, h in boxes)
+            if covered > 0.6 * width * height:
+                # Dense page - one full-frame pass is cheaper than many crops
+                boxes = [(0, 0, width, height)]
+
+            # Each block is normalized on its own, so mixed print sizes all
+            # reach the target glyph height (boxes stay in frame coordinates)
+            crops = [self._prepare(gray[y:y + h, x:x + w], deskew=False) for x, y, w, h in boxes]
+            if len(crops) > 1 and self.region_workers > 1:
+                count = len(crops)
+                results = list(self._get_pool().map(
+                    _ocr_region, crops, [language] * count, [passes] * count,
+                    [self.escalate_confidence] * count
+                ))
+            else:
+                results = [
+                    run_passes(self._run_backend_data, crop, language, passes, self.escalate_confidence)
+                    for crop in crops
+                ]
+
+            blocks = []
+            corrections = []
+            for box, result in zip(boxes, results):
+                text, block_corrections = self._correct(self._clean_text(result['text'], language), language)
+                corrections.extend(block_corrections)
+                if text:
+                    blocks.append({'box': box, 'text': text, 'confidence': result['confidence'],
+                                   'passes': result['passes']})
+            total_passes = sum(r['passes'] for r in results)
+            metrics.inc('ocr_passes', total_passes)
+
+            # Overall confidence weighted by the amount of text in each block
+            chars = sum(len(b['text']) for b in blocks)
+            confidence = round(sum(b['confidence'] * len(b['text']) for b in blocks) / chars, 1) if chars else 0.0
+
+            logger.debug(f"Region OCR: {len(blocks)}/{len(boxes)} blocks with text, "
+                         f"confidence {confidence}, {total_passes} passes")
+            return {'text': ' '.join(b['text'] for b in blocks), 'confidence': confidence,
+                    'passes': total_passes, 'language': language, 'corrections': corrections,
+                    'blocks': blocks}
+        except Exception as e:
+            logger.error(f"Region OCR error: {e}")
+            return {'text': "", 'confidence': 0.0, 'passes': 0, 'language': self.last_language,
+                    'corrections': [], 'blocks': [], 'error': str(e)}
+
+    def _resolve_auto_language(self, image):
+        """
+        Pick the narrowest model for this scene, reusing the previous
+        decision until the scene changes
+        
+        Returns:
+            Tuple (language, (raw text, word confidences) of a first pass
+            recognized with that language, or None)
+        """
+        import cv2
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # The detector keeps the frame the language was detected on as its reference
+        changed = self._language_scene.update(gray)
+        if self._auto_language and not changed:
+            return self._auto_language, None
+
+        language, first_pass = self._detect_language(image)
+        self._auto_language = language
+        logger.info(f"Auto language detected: {language}")
+        return language, first_pass
+
+    def _detect_language(self, image):
+        """Script detection (OSD), or a combined-model pass + character histogram"""
+        candidates = self.auto_languages
+        latin = [c for c in candidates if c != 'ara'] or candidates
+
+        try:
+            script, confidence = self.backend.detect_script(image)
+        except Exception as e:
+            # No osd.traineddata, or too little text for OSD
+            logger.debug(f"Script detection unavailable: {e}")
+            script, confidence = None, 0.0
+
+        if script == 'Arabic' and 'ara' in candidates:
+            return 'ara', None
+        if script and len(latin) == 1:
+            return latin[0], None
+
+        if script:
+            # Latin script: one pass with the first model tells the languages apart
+            language = latin[0]
+            first_pass = self._run_backend_data(image, language, self._tesseract_config(language))
+            guess = self._classify_text(first_pass[0], candidates)
+            return guess, (first_pass if guess == language else None)
+
+        combined = '+'.join(candidates)
+        text = self._run_backend(image, combined, self._tesseract_config(combined))
+        return self._classify_text(text, candidates), None
+
+    @staticmethod
+    def _classify_text(text, candidates):
+        """Guess the language of OCR output from its character and word histogram"""
+        latin = [c for c in candidates if c != 'ara'] or candidates
+        if not text:
+            return latin[0]
+
+        if 'ara' in candidates and len(_ARABIC_CHARS.findall(text)) > len(_LATIN_CHARS.findall(text)):
+            return 'ara'
+
+        words = _WORDS.findall(text.lower())
+        best, best_score = latin[0], 0
+        for language in latin:
+            markers = _LANGUAGE_MARKERS.get(language)
+            if not markers:
+                continue
+            score = sum(1 for w in words if w in markers['words'])
+            score += 2 * sum(1 for c in text.lower() if c in markers['accents'])
+            if score > best_score:
+                best, best_score = language, score
+        return best
+
+    @staticmethod
+    def to_tts_language(language):
+        """Map a tesseract language code to the 2-letter code used by TTS"""
+        mapping = {
+            'eng': 'en',
+            'fra': 'fr',
+            'ara': 'ar',
+            'spa': 'es',
+            'deu': 'de',
+            'ita': 'it',
+            'por': 'pt',
+            'rus': 'ru',
+        }
+        if not language:
+            return None
+        return mapping.get(language.split('+')[0], language[:2])
+
+    def _prepare(self, image, deskew=None):
+        """Grayscale image, preprocessed for OCR when enabled"""
+        import cv2
+        if not self.preprocess:
+            return image
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        with metrics.timer('preprocess'):
+            return preprocess_for_ocr(
+                gray,
+                target_height=self.text_height,
+                deskew=self.deskew if deskew is None else deskew,
+                binarize=self.binarize
+            )
+
+    def _preprocess_key(self):
+        """Preprocessing settings, for cache keys"""
+        if not self.preprocess:
+            return 'off'
+        return f"{self.text_height},{int(self.deskew)},{int(self.binarize)}"
+
+    def _lexicon_key(self):
+        """Post-correction settings (and which lexicons are ready), for cache keys"""
+        if self.corrector is None:
+            return 'off'
+        return f"{self.corrector.min_confidence},{'+'.join(self.corrector.ready())}"
+
+    def _get_pool(self):
+        """Lazily start the region OCR process pool"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.region_workers,
+                initializer=_init_region_worker,
+                initargs=(self.backend_name, self.tessdata_prefix, self.tesseract_cmd)
+            )
+            logger.info(f"Region OCR pool started with {self.region_workers} workers")
+        return self._pool
+
+    @staticmethod
+    def _tesseract_config(language, psm=6):
+        """Tesseract config string for a language"""
+        if 'ara' in language.lower():
+            # Arabic: preserve interword spaces
+            return f'--oem 3 --psm {psm} -c preserve_interword_spaces=1'
+        return f'--oem 3 --psm {psm}'
+
+    def _passes(self, language):
+        """OCR passes to run, as (name, scale, config), cheapest first"""
+        if not self.multipass:
+            return [('full', 1.0, self._tesseract_config(language))]
+        return [
+            (name, self.fast_scale if name == 'fast' else scale, self._tesseract_config(language, psm))
+            for name, scale, psm in OCR_PASSES
+        ]
+
+    def _passes_key(self):
+        """Multi-pass settings, for cache keys"""
+        if not self.multipass:
+            return 'single'
+        return f"{self.fast_scale},{self.escalate_confidence}"
+
+    def _run_backend(self, image, language, config):
+        """Run the configured backend and return the raw text"""
+        return self._call_backend('image_to_string', image, language, config)
+
+    def _run_backend_data(self, image, language, config):
+        """Run the configured backend and return (text, word confidences)"""
+        return self._call_backend('image_to_data', image, language, config)
+
+    def _call_backend(self, method, image, language, config):
+        """Call a backend method, falling back to pytesseract on engine errors"""
+        if isinstance(self.backend, PytesseractBackend):
+            return getattr(self.backend, method)(image, language, config)
+        try:
+            return getattr(self.backend, method)(image, language, config)
+        except Exception as e:
+            # e.g. traineddata missing for this language in the in-process
+            # engine, or a tesserocr build with a different API
+            logger.warning(f"{self.backend.name} failed ({e}), using pytesseract")
+            if self._fallback_backend is None:
+                self._fallback_backend = PytesseractBackend(self.tesseract_cmd)
+            return getattr(self._fallback_backend, method)(image, language, config)
+
+    def cache_stats(self):
+        """OCR cache hit/miss counters, or None if caching is disabled"""
+        return self.cache.stats() if self.cache else None
+
+    def close(self):
+        """Release OCR backend resources"""
+        if self.cache is not None:
+            self.cache.save()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        try:
+            self.backend.close()
+        except Exception as e:
+            logger.error(f"OCR backend close error: {e}")
 
     @staticmethod
     def _map_language_code(lang):
@@ -174,11 +1168,42 @@ class OCR:
         
         if 'ara' in language.lower():
             # Keep Arabic characters and punctuation
-            text = re.sub(r"[^\u0600-\u06FF\s.,?!;:'\"()\-]", "", text)
+            text = _ARABIC_NOISE.sub("", text)
         else:
             # Keep Latin characters and punctuation
-            text = re.sub(r"[^a-zA-Z0-9À-ÿ.,?!;:'\"()\-\s]", "", text)
+            text = _LATIN_NOISE.sub("", text)
         
         # Normalize multiple spaces
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _SPACES.sub(" ", text).strip()
         return text
+
+    def _correct(self, text, language):
+        """
+        Lexicon post-correction of cleaned text
+        
+        Returns:
+            (text, corrections) - corrections lists every candidate with its
+            confidence, including those below the threshold that were not applied
+        """
+        if self.corrector is None or not text:
+            return text, []
+        with metrics.timer('correction'):
+            text, corrections = self.corrector.correct(text, language)
+        applied = sum(1 for c in corrections if c['confidence'] >= self.corrector.min_confidence)
+        if applied:
+            metrics.inc('ocr_corrections', applied)
+        return text, corrections
+
+    def preload_lexicons(self, lang, wait=False):
+        """
+        Start indexing the word lists for an OCR language (all auto
+        languages for 'auto') so the first frames are corrected too
+        
+        Args:
+            lang: Language code as passed to extract_text_*
+            wait: Block until the lexicons are ready
+        """
+        if self.corrector is None:
+            return
+        language = '+'.join(self.auto_languages) if lang == AUTO_LANGUAGE else self._map_language_code(lang)
+        self.corrector.preload(language, wait=wait)
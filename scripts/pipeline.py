@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Staged Pipeline for Reading Eye - Raspberry Pi
+- Runs capture, preprocessing, OCR and speech in parallel worker threads
+- Stages are linked by bounded queues so slow stages never pile up work
+- Drop-oldest policy keeps the pipeline working on the freshest frame
+"""
+import threading
+import queue
+import time
+import logging
+
+try:
+    from .metrics import registry as metrics
+except ImportError:
+    from metrics import registry as metrics
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICIES = ('drop_oldest', 'block')
+
+
+class StageQueue:
+    """Bounded hand-off queue between two pipeline stages"""
+
+    def __init__(self, maxsize=2, policy='drop_oldest'):
+        """
+        Initialize queue
+
+        Args:
+            maxsize: Maximum number of pending items
+            policy: 'drop_oldest' discards the oldest item when full,
+                'block' makes the producer wait for space
+        """
+        if policy not in DROP_POLICIES:
+            logger.warning(f"Unknown drop policy '{policy}', using drop_oldest")
+            policy = 'drop_oldest'
+        self.policy = policy
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max(1, int(maxsize)))
+
+    def put(self, item, stop_event):
+        """Add an item according to the queue policy"""
+        while not stop_event.is_set():
+            try:
+                if self.policy == 'block':
+                    self._queue.put(item, timeout=0.2)
+                else:
+                    self._queue.put_nowait(item)
+                return True
+            except queue.Full:
+                if self.policy == 'block':
+                    continue
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                    metrics.inc('frames_dropped')
+                except queue.Empty:
+                    pass
+        return False
+
+    def get(self, timeout=0.2):
+        """Get the next item, or None if nothing arrived within timeout"""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def qsize(self):
+        """Number of pending items"""
+        return self._queue.qsize()
+
+
+class Pipeline:
+    """Source + chain of stages, each stage running in its own thread"""
+
+    def __init__(self, source, stages, interval=0.0, queue_size=2, drop_policy='drop_oldest',
+                 scheduler=None):
+        """
+        Initialize pipeline
+
+        Args:
+            source: Callable producing the next item (or None to skip)
+            stages: List of (name, callable) pairs; each callable takes the
+                previous stage's output and returns its own output, or None
+                to drop the item
+            interval: Minimum seconds between two source calls
+            queue_size: Capacity of each inter-stage queue
+            drop_policy: 'drop_oldest' or 'block'
+            scheduler: Optional AdaptiveScheduler pacing the source instead
+                of the fixed interval
+        """
+        self.source = source
+        self.stages = list(stages)
+        self.interval = interval
+        self.scheduler = scheduler
+        self.queues = [StageQueue(queue_size, drop_policy) for _ in self.stages]
+        for (name, _), stage_queue in zip(self.stages, self.queues):
+            metrics.gauge_callback(f'pipeline_{name}_queue_depth', stage_queue.qsize)
+        self.processed = {name: 0 for name, _ in [('capture', None)] + self.stages}
+        self._stop_event = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """Start all worker threads"""
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._source_loop, name='pipeline-capture', daemon=True)
+        ]
+        for index, (name, func) in enumerate(self.stages):
+            self._threads.append(threading.Thread(
+                target=self._stage_loop,
+                args=(index, name, func),
+                name=f'pipeline-{name}',
+                daemon=True
+            ))
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Pipeline started: {' -> '.join(['capture'] + [n for n, _ in self.stages])}")
+
+    def _source_loop(self):
+        """Produce items at most once per interval"""
+        output = self.queues[0] if self.queues else None
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            if self.scheduler:
+                self.scheduler.start_cycle()
+            try:
+                item = self.source()
+                if item is not None:
+                    self.processed['capture'] += 1
+                    if output:
+                        output.put(item, self._stop_event)
+            except Exception as e:
+                logger.error(f"Pipeline capture error: {e}")
+            if self.scheduler:
+                self.scheduler.wait(self._stop_event)
+                continue
+            remaining = self.interval - (time.monotonic() - started)
+            if remaining > 0:
+                self._stop_event.wait(remaining)
+
+    def _stage_loop(self, index, name, func):
+        """Pull from this stage's queue, process and push downstream"""
+        source_queue = self.queues[index]
+        output = self.queues[index + 1] if index + 1 < len(self.queues) else None
+        while not self._stop_event.is_set():
+            item = source_queue.get()
+            if item is None:
+                continue
+            try:
+                result = func(item)
+                self.processed[name] += 1
+                if result is not None and output:
+                    output.put(result, self._stop_event)
+            except Exception as e:
+                logger.error(f"Pipeline {name} error: {e}")
+
+    def stats(self):
+        """Processed and dropped counts per stage"""
+        dropped = {name: q.dropped for (name, _), q in zip(self.stages, self.queues)}
+        return {'processed': dict(self.processed), 'dropped': dropped}
+
+    def stop(self, timeout=5.0):
+        """Stop all workers and wait for them to exit"""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+        logger.info(f"Pipeline stopped: {self.stats()}")
+
+    def is_running(self):
+        """True while workers are active"""
+        return any(thread.is_alive() for thread in self._threads)
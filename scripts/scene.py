@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Scene Change Detection for Reading Eye - Raspberry Pi
+- Cheap downscaled-difference check on grayscale frames
+- Gates OCR so it only runs once a new scene has settled
+"""
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SceneChangeDetector:
+    """Decide whether a grayscale frame shows a new, stable scene worth OCRing"""
+
+    def __init__(self, threshold=8.0, settle_time=1.0, thumb_width=64):
+        """
+        Initialize detector
+
+        Args:
+            threshold: Mean absolute difference (0-255) above which two
+                thumbnails are considered different scenes
+            settle_time: Seconds the scene must stay still before OCR runs
+            thumb_width: Width of the comparison thumbnail in pixels
+        """
+        self.threshold = float(threshold)
+        self.settle_time = float(settle_time)
+        self.thumb_width = int(thumb_width)
+
+        self._reference = None   # Thumbnail of the last scene sent to OCR
+        self._previous = None    # Thumbnail of the previous frame
+        self._stable_since = None
+        self.pending = False     # Scene changed but has not settled yet
+        self.last_score = 0.0    # Difference to the last OCR'd scene
+
+    def _thumbnail(self, gray):
+        """Downscale a frame - area interpolation also averages out sensor noise"""
+        import cv2
+        import numpy as np
+        height, width = gray.shape[:2]
+        thumb_height = max(1, int(round(height * self.thumb_width / float(width))))
+        thumb = cv2.resize(gray, (self.thumb_width, thumb_height), interpolation=cv2.INTER_AREA)
+        return thumb.astype(np.int16)
+
+    @staticmethod
+    def _difference(a, b):
+        """Mean absolute difference between two thumbnails"""
+        import numpy as np
+        if a is None or b is None or a.shape != b.shape:
+            return float('inf')
+        return float(np.mean(np.abs(a - b)))
+
+    def update(self, gray, now=None):
+        """
+        Feed a new frame
+
+        Args:
+            gray: Grayscale frame from PiCamera.get_grayscale_frame
+            now: Monotonic timestamp (defaults to time.monotonic())
+
+        Returns:
+            True if OCR should run on this frame
+        """
+        if gray is None:
+            return False
+        now = time.monotonic() if now is None else now
+
+        thumb = self._thumbnail(gray)
+        motion = self._difference(thumb, self._previous)
+        self.last_score = self._difference(thumb, self._reference)
+        self._previous = thumb
+
+        if self.last_score > self.threshold:
+            if not self.pending:
+                logger.debug(f"Scene change detected (score={self.last_score:.1f})")
+            self.pending = True
+
+        if motion > self.threshold or self._stable_since is None:
+            self._stable_since = now
+
+        if self.pending and (now - self._stable_since) >= self.settle_time:
+            self._reference = thumb
+            self.pending = False
+            logger.debug("Scene settled, running OCR")
+            return True
+
+        return False
+
+    def reset(self):
+        """Forget the reference scene so the next settled frame is processed"""
+        self._reference = None
+        self._previous = None
+        self._stable_since = None
+        self.pending = False
+        self.last_score = 0.0
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Adaptive Capture Scheduler for Reading Eye - Raspberry Pi
+- Deadline based: processing time is subtracted from the wait, so the
+  capture period does not drift
+- Backs off exponentially while the scene is static
+- Jumps back to the fastest rate as soon as a change is seen
+"""
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveScheduler:
+    """Wall-clock cadence for the capture loop"""
+
+    def __init__(self, interval=5.0, min_interval=0.5, max_interval=30.0, backoff=1.5):
+        """
+        Initialize scheduler
+
+        Args:
+            interval: Starting period in seconds
+            min_interval: Period used while the scene is changing
+            max_interval: Longest period reached while the scene is static
+            backoff: Factor the period grows by after each static cycle
+        """
+        self.min_interval = float(min_interval)
+        self.max_interval = max(float(max_interval), self.min_interval)
+        self.backoff = max(1.0, float(backoff))
+        self.period = min(max(float(interval), self.min_interval), self.max_interval)
+        self._deadline = None
+        self._cycle_start = time.monotonic()
+
+    def start_cycle(self):
+        """Mark the start of a capture cycle"""
+        now = time.monotonic()
+        if self._deadline is None or self._deadline < now:
+            # First cycle, or the previous one overran: don't try to catch up
+            self._deadline = now
+        self._cycle_start = self._deadline
+
+    def report(self, changed):
+        """
+        Adjust the period after a cycle
+
+        Args:
+            changed: True if the scene changed (or is still settling)
+        """
+        previous = self.period
+        if changed:
+            self.period = self.min_interval
+        else:
+            self.period = min(self.period * self.backoff, self.max_interval)
+        if self.period != previous:
+            logger.debug(f"Capture period: {previous:.2f}s -> {self.period:.2f}s")
+
+    def time_until_next(self):
+        """Seconds left before the next cycle is due"""
+        self._deadline = self._cycle_start + self.period
+        return max(0.0, self._deadline - time.monotonic())
+
+    def wait(self, stop_event=None):
+        """Sleep until the next cycle is due (or stop_event is set)"""
+        remaining = self.time_until_next()
+        if stop_event is not None:
+            stop_event.wait(remaining)
+        elif remaining > 0:
+            time.sleep(remaining)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Startup Profiling for Reading Eye - Raspberry Pi
+- Times each import and component initialization on the way to the first read
+- Notes which heavy libraries (OpenCV, Tesseract, TTS engines...) each step loaded
+- Always recorded (a perf_counter call per step); reported only when asked
+"""
+import sys
+import json
+import time
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Libraries worth calling out when a step ends up loading them
+HEAVY_MODULES = ('cv2', 'numpy', 'pytesseract', 'tesserocr', 'pyttsx3', 'gtts',
+                 'picamera2', 'pygame', 'PIL')
+
+
+class StartupProfile:
+    """Ordered list of timed startup steps"""
+
+    def __init__(self):
+        """Start the clock"""
+        self.started = time.perf_counter()
+        self.steps = []
+
+    @contextmanager
+    def step(self, name):
+        """Time a block: `with startup.step('init camera'): ...`"""
+        loaded_before = {m for m in HEAVY_MODULES if m in sys.modules}
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            loaded = [m for m in HEAVY_MODULES if m in sys.modules and m not in loaded_before]
+            self.steps.append({'step': name, 'ms': round(1000 * elapsed, 1), 'loaded': loaded})
+
+    def elapsed(self):
+        """Seconds since the profile was created"""
+        return time.perf_counter() - self.started
+
+    def report(self, path=None):
+        """
+        Log the timing table, and append it as one JSON line to path
+
+        Args:
+            path: Optional JSONL file to track startup time across runs
+        """
+        total_ms = round(1000 * self.elapsed(), 1)
+        logger.info(f"Startup profile ({total_ms} ms to ready):")
+        for entry in self.steps:
+            loaded = f"  [loads {', '.join(entry['loaded'])}]" if entry['loaded'] else ""
+            logger.info(f"  {entry['step']:<24} {entry['ms']:>9.1f} ms{loaded}")
+        if path:
+            line = {
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'total_ms': total_ms,
+                'steps': self.steps,
+            }
+            try:
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(line) + '\n')
+            except OSError as e:
+                logger.error(f"Cannot write startup profile: {e}")
+
+
+# Shared profile, created when the application entry point first imports this module
+profile = StartupProfile()
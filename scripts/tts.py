@@ -5,23 +5,122 @@ Text-to-Speech Module for Reading Eye - Raspberry Pi Version
 - Falls back to gTTS for better language support
 - Supports multiple languages: Arabic, French, English
 - Optimized for headless Raspberry Pi operation
+- Optional on-disk cache of rendered speech for instant, offline replay
+- Streaming mode: sentence chunks are synthesized while the previous one plays
+- Audio goes to a long-lived output sink chosen once at startup
+- Bounded speech queue with per-utterance handles, preemption and stale-text dropping
+- pyttsx3 and gTTS are imported only when that backend is first used
 """
-import pyttsx3
 import threading
 import queue
 import time
+import io
 import os
+import re
 import logging
-from gtts import gTTS
 import tempfile
-import subprocess
+
+try:
+    from .cache import AudioCache
+    from .audio import create_sink
+    from .metrics import registry as metrics
+except ImportError:
+    from cache import AudioCache
+    from audio import create_sink
+    from metrics import registry as metrics
 
 logger = logging.getLogger(__name__)
 
+# Prefix of pyttsx3 scratch files; ones left by a crashed run are swept at start-up
+TEMP_PREFIX = 'reading_eye_tts_'
+# Scratch files younger than this may belong to another running instance
+TEMP_MAX_AGE = 600
+
+# Sentence and clause boundaries (Latin and Arabic punctuation)
+_SENTENCE_END = re.compile(r"(?<=[.!?;:…؟])\s+")
+_CLAUSE_END = re.compile(r"(?<=[,،])\s+")
+
+
+def split_into_chunks(text, min_chars=20, max_chars=200):
+    """
+    Split text into sentence/clause sized chunks for streaming speech
+    
+    Args:
+        text: Text to split
+        min_chars: Shorter fragments are merged into the previous chunk
+        max_chars: Longer sentences are split at clauses, then at spaces
+    
+    Returns:
+        List of chunks
+    """
+    pieces = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        parts = [sentence] if len(sentence) <= max_chars else _CLAUSE_END.split(sentence)
+        for part in parts:
+            while len(part) > max_chars:
+                cut = part.rfind(' ', 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                pieces.append(part[:cut])
+                part = part[cut:].strip()
+            if part:
+                pieces.append(part)
+    
+    chunks = []
+    for piece in pieces:
+        if chunks and len(chunks[-1]) < min_chars:
+            chunks[-1] = f"{chunks[-1]} {piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+QUEUE_POLICIES = ('drop_oldest', 'replace_pending', 'interrupt')
+
+
+class Utterance:
+    """Handle for one queued piece of speech"""
+
+    def __init__(self, text, on_cancel=None):
+        """
+        Create handle
+        
+        Args:
+            text: Text to speak
+            on_cancel: Called when a cancel happens (used to stop playback)
+        """
+        self.text = text
+        self.created = time.monotonic()
+        self.cancelled = False
+        self._on_cancel = on_cancel
+        self._done = threading.Event()
+
+    def cancel(self):
+        """Drop this utterance, or stop it if it is being spoken"""
+        if self._done.is_set():
+            return
+        self.cancelled = True
+        if self._on_cancel:
+            self._on_cancel(self)
+
+    def done(self):
+        """True once spoken, skipped or cancelled"""
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Block until done; returns False on timeout"""
+        return self._done.wait(timeout)
+
+    def _finish(self):
+        """Mark as done (called by the TTS worker)"""
+        self._done.set()
+
+
 class TTS:
     """Text-to-Speech engine using pyttsx3 and gTTS"""
     
-    def __init__(self, language='fr', rate=150, volume=0.9, use_gtts=False):
+    def __init__(self, language='fr', rate=150, volume=0.9, use_gtts=False,
+                 cache_dir=None, cache_max_mb=50, streaming=False, audio_sink='auto',
+                 queue_size=0, queue_policy='drop_oldest', max_age=None):
         """
         Initialize TTS engine
         
@@ -30,24 +129,53 @@ class TTS:
             rate: Speech rate (words per minute)
             volume: Volume level (0.0-1.0)
             use_gtts: Use gTTS instead of pyttsx3 (for better Arabic support)
+            cache_dir: Directory for cached rendered speech (None disables it)
+            cache_max_mb: Size cap of the speech cache in megabytes
+            streaming: Speak sentence by sentence, synthesizing the next
+                chunk while the current one plays
+            audio_sink: Audio output ('auto', 'pygame', 'process' or 'null')
+            queue_size: Maximum pending utterances (0 = unbounded)
+            queue_policy: What speak() does with pending speech:
+                'drop_oldest' (only when full), 'replace_pending' (always
+                cancels pending text) or 'interrupt' (also stops current speech)
+            max_age: Seconds after which queued text is too stale to speak
         """
         self.language = language
         self.rate = rate
         self.volume = volume
         self.use_gtts = use_gtts
+        self.streaming = streaming
         self.engine = None
+        self._engine_lock = threading.Lock()
+        self.sink = create_sink(audio_sink, volume=volume)
         
-        self._queue = queue.Queue()
+        self.audio_cache = None
+        if cache_dir:
+            try:
+                self.audio_cache = AudioCache(cache_dir, max_bytes=cache_max_mb * 1024 * 1024)
+            except Exception as e:
+                logger.error(f"Audio cache unavailable: {e}")
+        
+        if queue_policy not in QUEUE_POLICIES:
+            logger.warning(f"Unknown TTS queue policy '{queue_policy}', using drop_oldest")
+            queue_policy = 'drop_oldest'
+        self.queue_policy = queue_policy
+        self.max_age = max_age
+        self.dropped = 0
+        self._current = None
+        self._queue_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=queue_size)
+        metrics.gauge_callback('tts_queue_depth', self._queue.qsize)
         self._worker_thread = threading.Thread(
             target=self._worker_loop,
             daemon=True
         )
         self._stop_event = threading.Event()
         
+        self._sweep_temp_files()
         self._init_engine()
         self._worker_thread.start()
         
-        self.temp_files = []  # For cleanup
         logger.info(f"TTS initialized: language={language}, rate={rate}, volume={volume}")
 
     def _init_engine(self):
@@ -57,6 +185,7 @@ class TTS:
                 logger.info("Using gTTS for TTS")
                 return
             
+            import pyttsx3
             self.engine = pyttsx3.init()
             
             # Configure rate and volume
@@ -89,33 +218,132 @@ class TTS:
         self.volume = volume
         if self.engine:
             self.engine.setProperty('volume', volume)
+        self.sink.set_volume(volume)
         logger.info(f"TTS volume changed to: {volume}")
 
     def speak(self, text):
-        """Queue text for speech"""
+        """
+        Queue text for speech
+        
+        Returns:
+            Utterance handle (wait()/done()/cancel()), or None for empty text
+        """
         if not text or not text.strip():
-            return
+            return None
+        
+        utterance = Utterance(text.strip(), on_cancel=self._on_cancel)
+        with self._queue_lock:
+            if self._stop_event.is_set():
+                # Stopped: nothing will ever speak it
+                utterance.cancelled = True
+                utterance._finish()
+                return utterance
+            if self.queue_policy in ('replace_pending', 'interrupt'):
+                self._drop_pending()
+            if self.queue_policy == 'interrupt' and self._current:
+                self._current.cancel()
+            
+            # Add to queue for background worker, making room if bounded
+            while True:
+                try:
+                    self._queue.put_nowait(utterance)
+                    break
+                except queue.Full:
+                    self._drop_pending(limit=1)
         
-        # Add to queue for background worker
-        self._queue.put(text.strip())
         logger.debug(f"Queued for TTS: {text[:100]}")
+        return utterance
+
+    def _cancel_queued(self, limit=None):
+        """
+        Cancel queued (not yet spoken) utterances, oldest first, releasing
+        their waiters
+
+        Returns:
+            Number of utterances cancelled
+        """
+        cancelled = 0
+        while limit is None or cancelled < limit:
+            try:
+                utterance = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            utterance.cancelled = True
+            utterance._finish()
+            self._queue.task_done()
+            cancelled += 1
+        return cancelled
+
+    def _drop_pending(self, limit=None):
+        """Cancel queued utterances to make room for newer speech"""
+        dropped = self._cancel_queued(limit)
+        if dropped:
+            self.dropped += dropped
+            metrics.inc('tts_dropped', dropped)
+            logger.debug(f"Dropped {dropped} pending utterance(s)")
+
+    def _on_cancel(self, utterance):
+        """Stop playback if the cancelled utterance is the one being spoken"""
+        if utterance is not self._current:
+            return
+        self.sink.stop()
+        if self.engine:
+            try:
+                self.engine.stop()
+            except Exception:
+                pass
+
+    def _should_abort(self):
+        """True when current speech must stop (shutdown or cancel)"""
+        current = self._current
+        return self._stop_event.is_set() or (current is not None and current.cancelled)
 
     def _worker_loop(self):
         """Background worker for TTS processing"""
         while not self._stop_event.is_set():
             try:
                 # Wait for text with timeout to allow checking stop event
-                text = self._queue.get(timeout=1.0)
-                if text:
-                    self._speak_text(text)
+                utterance = self._queue.get(timeout=1.0)
             except queue.Empty:
                 continue
+            
+            try:
+                if utterance.cancelled or self._stop_event.is_set():
+                    utterance.cancelled = True
+                    continue
+                age = time.monotonic() - utterance.created
+                if self.max_age and age > self.max_age:
+                    logger.info(f"Dropping stale speech ({age:.1f}s old)")
+                    utterance.cancelled = True
+                    self.dropped += 1
+                    metrics.inc('tts_dropped')
+                    continue
+                metrics.observe('tts_queue_wait', age)
+                self._current = utterance
+                with metrics.timer('speech'):
+                    self._speak_text(utterance.text)
             except Exception as e:
                 logger.error(f"TTS worker error: {e}")
+            finally:
+                self._current = None
+                utterance._finish()
+                self._queue.task_done()
 
     def _speak_text(self, text):
         """Actually speak the text"""
         try:
+            if self.streaming:
+                chunks = split_into_chunks(text)
+                if len(chunks) > 1:
+                    self._speak_chunks(chunks)
+                    return
+            if self.audio_cache is not None:
+                with metrics.timer('synthesis'):
+                    path = self._render_to_cache(text)
+                if path:
+                    self._play_audio(path)
+                    logger.info(f"Spoke {len(text)} chars from audio cache")
+                    return
             if self.use_gtts:
                 self._speak_gtts(text)
             else:
@@ -123,6 +351,215 @@ class TTS:
         except Exception as e:
             logger.error(f"Error speaking text: {e}")
 
+    def _speak_chunks(self, chunks):
+        """
+        Double-buffered playback: a render thread synthesizes chunk N+1
+        while chunk N plays, so speech starts after the first sentence
+        """
+        rendered = queue.Queue(maxsize=1)
+        
+        def render_worker():
+            for chunk in chunks:
+                if self._should_abort():
+                    break
+                with metrics.timer('synthesis'):
+                    item = self._render_chunk(chunk)
+                rendered.put(item)
+            rendered.put(None)
+        
+        renderer = threading.Thread(target=render_worker, daemon=True)
+        renderer.start()
+        
+        while True:
+            item = rendered.get()
+            if item is None:
+                break
+            path, data, fmt = item
+            if self._should_abort():
+                continue
+            if path:
+                self._play_audio(path)
+            elif data:
+                with metrics.timer('playback'):
+                    self.sink.play_bytes(data, fmt)
+        
+        renderer.join()
+        logger.info(f"Spoke {sum(len(c) for c in chunks)} chars in {len(chunks)} chunks")
+
+    def _render_chunk(self, text):
+        """
+        Synthesize one chunk
+        
+        Returns:
+            Tuple (cached file path, in-memory audio data, format); path or
+            data is None
+        """
+        if self.audio_cache is not None:
+            path = self._render_to_cache(text)
+            if path:
+                return path, None, None
+        
+        try:
+            if self.use_gtts:
+                return None, self._synthesize_gtts(text), 'mp3'
+            if self.engine:
+                return None, self._synthesize_pyttsx3(text), 'wav'
+        except Exception as e:
+            logger.error(f"Chunk render error: {e}")
+        return None, None, None
+
+    def render_to_file(self, text, output_path):
+        """
+        Render text to an audio file without playing it
+
+        Args:
+            text: Text to synthesize
+            output_path: Path without extension; '.mp3' (gTTS) or '.wav'
+                (pyttsx3) is appended
+
+        Returns:
+            Path of the written file, or None if rendering failed
+        """
+        try:
+            with metrics.timer('synthesis'):
+                if self.use_gtts:
+                    path = output_path + '.mp3'
+                    data = self._synthesize_gtts(text)
+                    with open(path, 'wb') as f:
+                        f.write(data)
+                elif self.engine:
+                    path = output_path + '.wav'
+                    with self._engine_lock:
+                        self.engine.save_to_file(text, path)
+                        self.engine.runAndWait()
+                else:
+                    logger.warning("No TTS engine available for rendering")
+                    return None
+            return path if os.path.exists(path) else None
+        except Exception as e:
+            logger.error(f"Audio render error: {e}")
+            return None
+
+    def _synthesize_gtts(self, text):
+        """Render text with gTTS into in-memory MP3 data"""
+        from gtts import gTTS
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=self._gtts_language(), slow=False).write_to_fp(buffer)
+        return buffer.getvalue()
+
+    def _synthesize_pyttsx3(self, text):
+        """Render text with pyttsx3 into in-memory WAV data"""
+        # The espeak driver can only write to a path; the file is dropped right away
+        with tempfile.NamedTemporaryFile(prefix=TEMP_PREFIX, suffix='.wav', delete=False) as f:
+            path = f.name
+        try:
+            with self._engine_lock:
+                self.engine.save_to_file(text, path)
+                self.engine.runAndWait()
+            with open(path, 'rb') as f:
+                return f.read()
+        finally:
+            self._remove_file(path)
+
+    @staticmethod
+    def _sweep_temp_files():
+        """Delete scratch files that earlier, interrupted runs left in the temp directory"""
+        directory = tempfile.gettempdir()
+        cutoff = time.time() - TEMP_MAX_AGE
+        removed = 0
+        try:
+            for name in os.listdir(directory):
+                path = os.path.join(directory, name)
+                if name.startswith(TEMP_PREFIX) and os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+        except OSError as e:
+            logger.debug(f"Temp file sweep: {e}")
+        if removed:
+            logger.info(f"Removed {removed} stale TTS temp file(s)")
+
+    @staticmethod
+    def _remove_file(path):
+        """Delete a file, ignoring errors"""
+        try:
+            if path and os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
+
+    def _render_to_cache(self, text):
+        """
+        Return the cached rendering of text, synthesizing it on a miss
+        
+        Returns:
+            Path to an audio file, or None if rendering failed
+        """
+        backend = 'gtts' if self.use_gtts else 'pyttsx3'
+        voice = None
+        if self.engine:
+            with self._engine_lock:
+                voice = self.engine.getProperty('voice')
+        key = AudioCache.make_key(text, self.language, self.rate, voice, backend)
+        
+        path = self.audio_cache.get(key)
+        if path:
+            return path
+        
+        tmp_path = None
+        try:
+            if self.use_gtts:
+                path = self.audio_cache.path_for(key, '.mp3')
+                tmp_path = path + '.part'
+                with open(tmp_path, 'wb') as f:
+                    f.write(self._synthesize_gtts(text))
+            else:
+                if not self.engine:
+                    return None
+                path = self.audio_cache.path_for(key, '.wav')
+                tmp_path = path[:-len('.wav')] + '.part.wav'
+                with self._engine_lock:
+                    self.engine.save_to_file(text, tmp_path)
+                    self.engine.runAndWait()
+            
+            if not os.path.exists(tmp_path):
+                return None
+            os.replace(tmp_path, path)
+            self.audio_cache.add(key, path)
+            return path
+        except Exception as e:
+            logger.error(f"Audio cache render error: {e}")
+            return None
+        finally:
+            # Left behind only when rendering failed
+            self._remove_file(tmp_path)
+
+    def prewarm(self, phrases):
+        """
+        Render common phrases into the audio cache ahead of time
+        
+        Args:
+            phrases: Iterable of strings
+        
+        Returns:
+            Number of phrases available in the cache
+        """
+        if self.audio_cache is None:
+            logger.warning("Audio cache disabled - nothing to prewarm")
+            return 0
+        
+        ready = 0
+        for phrase in phrases:
+            phrase = phrase.strip()
+            if phrase and self._render_to_cache(phrase):
+                ready += 1
+        logger.info(f"Audio cache prewarmed: {ready} phrases, {self.audio_cache.stats()}")
+        return ready
+
+    def _gtts_language(self):
+        """Map the current language to a gTTS language code"""
+        lang_map = {'fr': 'fr', 'en': 'en', 'ar': 'ar'}
+        return lang_map.get(self.language[:2], 'fr')
+
     def _speak_pyttsx3(self, text):
         """Speak using pyttsx3"""
         if not self.engine:
@@ -130,8 +567,11 @@ class TTS:
             return
         
         try:
-            self.engine.say(text)
-            self.engine.runAndWait()
+            # Rendered to memory and played through the sink like every other path
+            with metrics.timer('synthesis'):
+                data = self._synthesize_pyttsx3(text)
+            with metrics.timer('playback'):
+                self.sink.play_bytes(data, 'wav')
             logger.info(f"Spoke {len(text)} chars via pyttsx3")
         except Exception as e:
             logger.error(f"pyttsx3 speech error: {e}")
@@ -139,76 +579,55 @@ class TTS:
     def _speak_gtts(self, text):
         """Speak using Google Text-to-Speech"""
         try:
-            # Map language codes
-            lang_map = {'fr': 'fr', 'en': 'en', 'ar': 'ar'}
-            lang = lang_map.get(self.language[:2], 'fr')
-            
-            # Generate speech
-            tts = gTTS(text=text, lang=lang, slow=False)
-            
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-                temp_file = f.name
-                tts.save(temp_file)
-            
-            self.temp_files.append(temp_file)
-            
-            # Play using system tools
-            self._play_audio(temp_file)
+            # Generate speech in memory and hand it straight to the sink
+            with metrics.timer('synthesis'):
+                data = self._synthesize_gtts(text)
+            with metrics.timer('playback'):
+                self.sink.play_bytes(data, 'mp3')
             
             logger.info(f"Spoke {len(text)} chars via gTTS")
         except Exception as e:
             logger.error(f"gTTS error: {e}")
 
-    @staticmethod
-    def _play_audio(file_path):
-        """Play audio file using available system tools"""
+    def _play_audio(self, file_path):
+        """Play an audio file through the output sink"""
         try:
-            # Try different audio players
-            players = [
-                ['mpg123', file_path],
-                ['play', file_path],  # SoX
-                ['ffplay', '-nodisp', '-autoexit', file_path],
-                ['cvlc', '--play-and-exit', file_path],
-            ]
-            
-            for player_cmd in players:
-                try:
-                    subprocess.run(
-                        player_cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        timeout=60
-                    )
-                    return
-                except (FileNotFoundError, subprocess.TimeoutExpired):
-                    continue
-            
-            logger.warning("No audio player found")
+            with metrics.timer('playback'):
+                self.sink.play_file(file_path)
         except Exception as e:
             logger.error(f"Audio playback error: {e}")
 
     def stop(self):
-        """Stop TTS and cleanup"""
-        self._stop_event.set()
+        """Stop TTS and cleanup; queued and current speech is cancelled"""
+        with self._queue_lock:
+            self._stop_event.set()
+            cancelled = self._cancel_queued()
+        current = self._current
+        if current is not None:
+            current.cancel()
+        if cancelled:
+            logger.debug(f"Cancelled {cancelled} queued utterance(s) on stop")
         if self.engine:
             try:
                 self.engine.stop()
             except:
                 pass
-        
-        # Cleanup temp files
-        for f in self.temp_files:
-            try:
-                if os.path.exists(f):
-                    os.remove(f)
-            except:
-                pass
+        self.sink.close()
         
         logger.info("TTS stopped and cleaned up")
 
     def wait_for_completion(self, timeout=10):
-        """Wait for all queued speech to complete"""
-        start = time.time()
-        while not self._queue.empty() and (time.time() - start) < timeout:
-            time.sleep(0.1)
+        """
+        Wait until all queued speech has actually been spoken (or dropped)
+        
+        Returns:
+            True if everything finished within timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
@@ -0,0 +1,80 @@
+"""Audio sinks: WAV conversion to the player format and volume"""
+import io
+import sys
+import wave
+
+import numpy as np
+import pytest
+
+from scripts import audio
+from scripts.audio import PCM_RATE, ProcessSink, scale_pcm, wav_to_pcm
+
+
+def _wav(samples, rate=PCM_RATE, channels=1, width=2):
+    """WAV bytes holding the given integer samples (interleaved if multi-channel)"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(width)
+        wav.setframerate(rate)
+        wav.writeframes(np.asarray(samples, {1: np.uint8, 2: '<i2', 4: '<i4'}.get(width, np.uint8)).tobytes())
+    return buffer.getvalue()
+
+
+def _pcm(data):
+    return np.frombuffer(data, '<i2')
+
+
+def test_mono_16_bit_at_player_rate_is_unchanged():
+    samples = [0, 1000, -1000, 32767, -32768]
+
+    assert _pcm(wav_to_pcm(_wav(samples))).tolist() == samples
+
+
+def test_stereo_is_mixed_down():
+    stereo = [1000, 3000, -2000, 0]
+
+    assert _pcm(wav_to_pcm(_wav(stereo, channels=2))).tolist() == [2000, -1000]
+
+
+def test_8_and_32_bit_are_converted():
+    assert _pcm(wav_to_pcm(_wav([128, 255, 0], width=1))).tolist() == [0, 127 << 8, -128 << 8]
+    assert _pcm(wav_to_pcm(_wav([1 << 30, -(1 << 30)], width=4))).tolist() == [1 << 14, -(1 << 14)]
+
+
+def test_other_rates_are_resampled():
+    tone = (10000 * np.sin(np.arange(44100) * 2 * np.pi * 440 / 44100)).astype(np.int16)
+    pcm = _pcm(wav_to_pcm(_wav(tone, rate=44100)))
+
+    assert abs(len(pcm) - PCM_RATE) <= 1
+    assert np.abs(pcm - tone[::2][:len(pcm)]).max() < 200
+
+
+def test_unsupported_width_raises():
+    with pytest.raises(ValueError):
+        wav_to_pcm(_wav(np.zeros(6, np.uint8), width=3))
+
+
+def test_volume_scales_samples():
+    pcm = np.array([1000, -1000, 32767], '<i2').tobytes()
+
+    assert scale_pcm(pcm, 1.0) is pcm
+    assert _pcm(scale_pcm(pcm, 0.5)).tolist() == [500, -500, 16383]
+    assert _pcm(scale_pcm(pcm, 2.0)).tolist() == [1000, -1000, 32767]
+
+
+def test_process_sink_writes_pcm_at_its_volume(monkeypatch, tmp_path):
+    output = tmp_path / 'played.raw'
+    monkeypatch.setattr(audio.shutil, 'which', lambda binary: binary == 'aplay' and '/usr/bin/aplay')
+    sink = ProcessSink(volume=0.5)
+    sink.command = [sys.executable, '-c',
+                    f"import sys; open({str(output)!r}, 'wb').write(sys.stdin.buffer.read())"]
+
+    assert sink.play_bytes(_wav([2000] * 200), 'wav')
+    sink.set_volume(0.25)
+    assert sink.play_bytes(_wav([2000] * 200), 'wav')
+    process = sink._process
+    process.stdin.close()
+    process.wait(timeout=10)
+
+    assert _pcm(output.read_bytes()).tolist() == [1000] * 200 + [500] * 200
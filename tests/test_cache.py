@@ -0,0 +1,95 @@
+"""OCR result cache: noisy recaptures hit, different pages miss, LRU eviction"""
+import cv2
+import numpy as np
+
+from scripts.cache import OCRCache
+from scripts.ocr import frame_fingerprint
+
+
+def _label(text, noise=0.0, seed=0, gain=0, title="PARACETAMOL 500 mg", size=(240, 640), scale=1.0):
+    """Grayscale label with a title and one line of text, optionally with sensor noise"""
+    image = np.full(size, 235, np.uint8)
+    cv2.putText(image, title, (20, 60), cv2.FONT_HERSHEY_SIMPLEX, scale, 30, 2)
+    cv2.putText(image, text, (20, 130), cv2.FONT_HERSHEY_SIMPLEX, scale, 30, 2)
+    if noise:
+        rng = np.random.default_rng(seed)
+        image = np.clip(image + gain + rng.normal(0, noise, image.shape), 0, 255).astype(np.uint8)
+    return image
+
+
+def _cache_with(image, value='x', **kwargs):
+    cache = OCRCache(max_entries=4, **kwargs)
+    cache.put(frame_fingerprint(image), 'fra', 'cfg', {'text': value})
+    return cache
+
+
+def test_noisy_recapture_hits():
+    cache = _cache_with(_label("deux fois par jour", 4, seed=1), "deux fois par jour")
+
+    assert cache.get(frame_fingerprint(_label("deux fois par jour", 4, seed=2)), 'fra', 'cfg') == \
+        {'text': "deux fois par jour"}
+    assert cache.get(frame_fingerprint(_label("deux fois par jour", 8, seed=3, gain=10)),
+                     'fra', 'cfg') is not None
+    assert cache.stats()['hits'] == 2
+
+
+def test_noisy_recapture_of_small_print_hits():
+    cache = _cache_with(_label("take 1 tablet daily", 6, seed=1, size=(1080, 1920), scale=0.7))
+
+    assert cache.get(frame_fingerprint(_label("take 1 tablet daily", 6, seed=2, size=(1080, 1920),
+                                              scale=0.7)), 'fra', 'cfg') is not None
+
+
+def test_different_text_on_same_layout_misses():
+    cache = _cache_with(_label("deux fois par jour", 4, seed=1))
+
+    assert cache.get(frame_fingerprint(_label("trois fois par jour", 4, seed=2)), 'fra', 'cfg') is None
+    assert cache.get(frame_fingerprint(_label("deux fois par jour", 4, seed=3,
+                                              title="PARACETAMOL 100 mg")), 'fra', 'cfg') is None
+    assert cache.stats()['misses'] == 2
+
+
+def test_one_digit_in_small_print_misses():
+    cache = _cache_with(_label("take 1 tablet daily", 6, seed=1, size=(1080, 1920), scale=0.7))
+
+    assert cache.get(frame_fingerprint(_label("take 4 tablet daily", 6, seed=2, size=(1080, 1920),
+                                              scale=0.7)), 'fra', 'cfg') is None
+
+
+def test_different_page_misses():
+    cache = _cache_with(_label("deux fois par jour", 4, seed=1))
+    page = _label("Conserver au frais", 4, seed=2, title="Notice")
+
+    assert cache.get(frame_fingerprint(page), 'fra', 'cfg') is None
+
+
+def test_language_and_config_are_part_of_the_key():
+    image = _label("deux fois par jour")
+    cache = _cache_with(image)
+
+    assert cache.get(frame_fingerprint(image), 'eng', 'cfg') is None
+    assert cache.get(frame_fingerprint(image), 'fra', 'other') is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    a, b, c = (frame_fingerprint(_label(text)) for text in ("un", "deux fois", "trois fois par jour"))
+    cache = OCRCache(max_entries=2)
+    cache.put(a, 'fra', 'cfg', 1)
+    cache.put(b, 'fra', 'cfg', 2)
+    cache.get(a, 'fra', 'cfg')
+    cache.put(c, 'fra', 'cfg', 3)
+
+    assert cache.get(b, 'fra', 'cfg') is None
+    assert cache.get(a, 'fra', 'cfg') == 1
+    assert cache.stats()['evictions'] == 1
+
+
+def test_entries_persist(tmp_path):
+    path = str(tmp_path / 'ocr_cache.json')
+    cache = _cache_with(_label("deux fois par jour", 4, seed=1), path=path)
+    cache.save()
+
+    loaded = OCRCache(max_entries=4, path=path)
+    assert loaded.get(frame_fingerprint(_label("deux fois par jour", 4, seed=2)), 'fra', 'cfg') == \
+        {'text': 'x'}
+    assert loaded.get(frame_fingerprint(_label("trois fois par jour", 4, seed=2)), 'fra', 'cfg') is None
@@ -0,0 +1,87 @@
+"""Frame pool: arrays are reused only once nothing references them"""
+import numpy as np
+import pytest
+
+from scripts import camera
+from scripts.camera import FramePool
+
+
+def test_released_array_is_reused():
+    pool = FramePool(2)
+    frame = pool.get((4, 6))
+    frame_id = id(frame)
+    del frame
+
+    assert id(pool.get((4, 6))) == frame_id
+    assert pool.nbytes() == 4 * 6
+
+
+def test_held_array_is_not_handed_out_again():
+    pool = FramePool(2)
+    first = pool.get((4, 6))
+    second = pool.get((4, 6))
+    first[:] = 1
+
+    assert second is not first
+    third = pool.get((4, 6))
+    assert third is not first and third is not second
+    assert (first == 1).all()
+
+
+def test_view_keeps_array_in_use():
+    pool = FramePool(1)
+    frame = pool.get((4, 6))
+    frame_id = id(frame)
+    luminance = frame[:2]
+    del frame
+
+    assert id(pool.get((4, 6))) != frame_id
+    del luminance
+    assert id(pool.get((4, 6))) == frame_id
+
+
+def test_exhausted_pool_allocates_without_growing():
+    pool = FramePool(1)
+    held = pool.get((4, 6))
+    extra = pool.get((4, 6))
+
+    assert extra is not held
+    assert pool.nbytes() == held.nbytes
+
+
+def test_shapes_and_dtypes_are_pooled_separately():
+    pool = FramePool(1)
+    gray = pool.get((4, 6))
+    color = pool.get((4, 6, 3))
+    floats = pool.get((4, 6), np.float32)
+
+    assert color.shape == (4, 6, 3)
+    assert floats.dtype == np.float32
+    assert gray.base is None and color.base is None
+
+
+def test_reference_held_across_gets_is_never_reused():
+    pool = FramePool(3)
+    held = pool.get((4, 6))
+    held[:] = 7
+    for _ in range(10):
+        frame = pool.get((4, 6))
+        assert frame is not held
+        frame[:] = 0
+
+    assert (held == 7).all()
+
+
+@pytest.mark.parametrize('error', [-1, 1])
+def test_unreliable_refcounts_disable_reuse(monkeypatch, error):
+    monkeypatch.setattr(camera, '_FREE_REFCOUNT', camera._FREE_REFCOUNT + error)
+    camera._refcounts_reliable.cache_clear()
+    try:
+        pool = FramePool(2)
+        held = pool.get((4, 6))
+
+        assert not pool.reuse
+        assert pool.get((4, 6)) is not held
+        assert pool.nbytes() == 0
+    finally:
+        camera._refcounts_reliable.cache_clear()
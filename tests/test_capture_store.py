@@ -0,0 +1,84 @@
+"""Capture writer: background saves with sidecars, dropped saves and retention"""
+import json
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from scripts.capture_store import CaptureWriter
+
+
+def _frame(value=0):
+    frame = np.full((24, 32), 235, np.uint8)
+    frame[8:16, 4:28] = value
+    return frame
+
+
+def _captures(directory, extension):
+    return sorted(name for name in os.listdir(directory) if name.endswith(extension))
+
+
+def test_frame_and_sidecar_are_written(tmp_path):
+    writer = CaptureWriter(tmp_path)
+    frame = _frame(30)
+    path = writer.save(frame, {'text': "deux fois par jour", 'confidence': 91.0})
+    frame[:] = 0   # the writer keeps its own copy
+    writer.close()
+
+    assert (cv2.imread(path, cv2.IMREAD_GRAYSCALE) == _frame(30)).all()
+    with open(os.path.splitext(path)[0] + '.json', encoding='utf-8') as f:
+        record = json.load(f)
+    assert record['text'] == "deux fois par jour" and record['image'] == os.path.basename(path)
+    assert not _captures(tmp_path, '.part')
+
+
+def test_oldest_captures_are_pruned_beyond_max_files(tmp_path):
+    writer = CaptureWriter(tmp_path, max_files=3, queue_size=8)
+    paths = [writer.save(_frame(value)) for value in range(5)]
+    writer.close()
+
+    assert set(_captures(tmp_path, '.png')) == {os.path.basename(p) for p in paths[2:]}
+    assert len(_captures(tmp_path, '.json')) == 3
+
+
+def test_full_queue_drops_the_save(tmp_path):
+    writer = CaptureWriter(tmp_path, queue_size=1)
+    writing, release = threading.Event(), threading.Event()
+    write = writer._write
+
+    def slow_write(*args):
+        writing.set()
+        release.wait(5)
+        write(*args)
+
+    writer._write = slow_write
+    first = writer.save(_frame(1))
+    assert writing.wait(5)
+    queued = writer.save(_frame(2))
+    dropped = writer.save(_frame(3))
+    release.set()
+    writer.close()
+
+    assert first and queued and dropped is None
+    assert len(_captures(tmp_path, '.png')) == 2
+
+
+def test_leftovers_are_indexed_and_pruned_at_startup(tmp_path):
+    old = time.time() - 3 * 3600
+    for index in range(4):
+        for extension in ('.png', '.json'):
+            path = tmp_path / f"capture_20240101_12000{index}_000{extension}"
+            path.write_bytes(b'x')
+            os.utime(path, (old + index, old + index))
+    (tmp_path / "capture_20240101_120009_000.png.part").write_bytes(b'x')
+    (tmp_path / "notes.txt").write_bytes(b'kept')
+
+    CaptureWriter(tmp_path, max_files=2).close()
+    assert _captures(tmp_path, '.png') == ["capture_20240101_120002_000.png",
+                                           "capture_20240101_120003_000.png"]
+    assert not _captures(tmp_path, '.part') and (tmp_path / "notes.txt").exists()
+
+    CaptureWriter(tmp_path, max_age_hours=1).close()
+    assert not _captures(tmp_path, '.png') and not _captures(tmp_path, '.json')
@@ -0,0 +1,137 @@
+"""Daemon: JSON requests over the Unix socket against a stand-in app"""
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from scripts.daemon import ReadingEyeDaemon, send_request
+from scripts.tts import Utterance
+
+
+class _FakeTTS:
+    def __init__(self):
+        self.spoken = []
+
+    def speak(self, text):
+        self.spoken.append(text)
+        utterance = Utterance(text)
+        utterance._finish()
+        return utterance
+
+
+class _FakeApp:
+    """recognize_frame returns the queued results in turn (None = capture failed)"""
+
+    def __init__(self, *results):
+        self.tts = _FakeTTS()
+        self.results = list(results)
+        self.requests = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def recognize_frame(self, lang=None, save_image=False):
+        self.requests.append((lang, save_image))
+        self.release.wait(5)
+        return self.results.pop(0)
+
+
+@pytest.fixture
+def serve(tmp_path):
+    daemons = []
+
+    def start(app, **kwargs):
+        daemon = ReadingEyeDaemon(app, str(tmp_path / 'eye.sock'), **kwargs)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while not os.path.exists(daemon.socket_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        daemons.append((daemon, thread))
+        return daemon
+
+    yield start
+    for daemon, thread in daemons:
+        daemon.shutdown()
+        thread.join(5)
+        daemon.close()
+
+
+def _raw_request(path, payload):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(5)
+        sock.connect(path)
+        sock.sendall(payload + b'\n')
+        return sock.makefile('rb').readline()
+
+
+def test_ping_status_and_unknown_commands(serve):
+    daemon = serve(_FakeApp())
+
+    assert send_request(daemon.socket_path, {'command': 'ping'}) == {'ok': True}
+    status = send_request(daemon.socket_path, {'command': 'status'})
+    assert status['ok'] and status['served'] == 2 and status['queued_jobs'] == 0
+    unknown = send_request(daemon.socket_path, {'command': 'dance'})
+    assert not unknown['ok'] and 'ping' in unknown['commands']
+
+
+def test_malformed_requests_get_an_error_reply(serve):
+    daemon = serve(_FakeApp())
+
+    assert b'bad request' in _raw_request(daemon.socket_path, b'{not json')
+    assert b'must be a JSON object' in _raw_request(daemon.socket_path, b'["read"]')
+    assert send_request(daemon.socket_path, {'command': 'speak', 'text': 42}) == \
+        {'ok': False, 'error': 'text must be a string'}
+    assert send_request(daemon.socket_path, {'command': 'speak', 'text': '  '})['ok'] is False
+
+
+def test_read_runs_ocr_and_speaks_the_text(serve):
+    app = _FakeApp({'text': "deux fois par jour", 'confidence': 90.0}, None)
+    daemon = serve(app)
+
+    reply = send_request(daemon.socket_path, {'command': 'read', 'lang': 'fra', 'save_image': True})
+    assert reply['ok'] and reply['text'] == "deux fois par jour" and reply['spoken']
+    assert app.requests == [('fra', True)] and app.tts.spoken == ["deux fois par jour"]
+    assert send_request(daemon.socket_path, {'command': 'capture'}) == \
+        {'ok': False, 'error': 'capture failed'}
+
+
+def test_full_job_queue_replies_busy(serve):
+    app = _FakeApp({'text': ''}, {'text': ''})
+    app.release.clear()
+    daemon = serve(app, queue_size=1)
+    replies = []
+
+    def read():
+        replies.append(send_request(daemon.socket_path, {'command': 'capture'}))
+
+    clients = [threading.Thread(target=read) for _ in range(2)]
+    clients[0].start()
+    deadline = time.monotonic() + 5
+    while not app.requests and time.monotonic() < deadline:
+        time.sleep(0.01)
+    clients[1].start()
+    while daemon._jobs.qsize() < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert send_request(daemon.socket_path, {'command': 'capture'}) == {'ok': False, 'error': 'busy'}
+    app.release.set()
+    for client in clients:
+        client.join(5)
+    assert [reply['ok'] for reply in replies] == [True, True]
+
+
+def test_shutdown_request_stops_the_server(serve):
+    daemon = serve(_FakeApp())
+
+    assert send_request(daemon.socket_path, {'command': 'shutdown'}) == {'ok': True}
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            send_request(daemon.socket_path, {'command': 'ping'}, timeout=0.5)
+        except OSError:
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("daemon still answering after shutdown")
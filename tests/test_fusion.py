@@ -0,0 +1,76 @@
+"""Burst fusion: alignment, denoising by averaging and sharpest-tile composites"""
+import cv2
+import numpy as np
+
+from scripts.fusion import align_frames, fuse_frames, sharpness
+
+
+def _page():
+    image = np.full((240, 320), 235, np.uint8)
+    lines = ("PARACETAMOL 500 mg", "deux fois par jour", "Ne pas depasser",
+             "la dose prescrite.", "Lot 2731-B")
+    for row, text in enumerate(lines):
+        cv2.putText(image, text, (10 + 7 * row, 40 + 40 * row), cv2.FONT_HERSHEY_SIMPLEX, 0.8, 30, 2)
+    return image
+
+
+def _shifted(image, dx, dy):
+    matrix = np.float32([[1, 0, dx], [0, 1, dy]])
+    return cv2.warpAffine(image, matrix, image.shape[::-1], borderMode=cv2.BORDER_REPLICATE)
+
+
+def _noisy(image, seed, sigma=12):
+    rng = np.random.default_rng(seed)
+    return np.clip(image + rng.normal(0, sigma, image.shape), 0, 255).astype(np.uint8)
+
+
+def _error(image, reference, margin=8):
+    """Mean absolute error away from the borders (where shifts replicate edges)"""
+    inner = (slice(margin, -margin), slice(margin, -margin))
+    return float(np.mean(np.abs(image[inner].astype(np.float32) - reference[inner])))
+
+
+def test_single_frame_is_returned_unchanged():
+    frame = _page()
+
+    assert fuse_frames([frame]) is frame
+
+
+def test_mean_of_shifted_noisy_frames_is_cleaner():
+    page = _page()
+    frames = [_noisy(_shifted(page, dx, dy), seed)
+              for seed, (dx, dy) in enumerate([(0, 0), (3, -2), (-2, 4), (1, 1), (-3, -1)])]
+    fused = fuse_frames(frames, 'mean')
+
+    assert fused.shape == page.shape and fused.dtype == np.uint8
+    assert _error(fused, page) < 0.6 * min(_error(_noisy(page, 9), page), _error(frames[0], page))
+
+
+def test_frames_that_moved_too_far_or_do_not_match_are_skipped():
+    page = _page()
+    unrelated = np.full(page.shape, 235, np.uint8)
+    cv2.putText(unrelated, "Notice", (90, 130), cv2.FONT_HERSHEY_SIMPLEX, 1.0, 30, 2)
+    aligned = align_frames([page, _shifted(page, 2, 1), _shifted(page, 60, 0), unrelated])
+
+    assert len(aligned) == 2
+    assert _error(aligned[1][0], page) < 3
+
+
+def test_mean_leaves_out_blurred_frames():
+    page = _page()
+    blurred = cv2.GaussianBlur(page, (9, 9), 3)
+
+    assert sharpness(blurred) < 0.7 * sharpness(page)
+    assert np.array_equal(fuse_frames([page, blurred, blurred], 'mean'), page)
+
+
+def test_sharpest_composite_takes_each_region_from_its_sharp_frame():
+    page = _page()
+    blurred = cv2.GaussianBlur(page, (9, 9), 3)
+    # Each frame has one region smeared (e.g. a hand moving through it)
+    first, second = page.copy(), page.copy()
+    first[:120, :160] = blurred[:120, :160]
+    second[120:, 160:] = blurred[120:, 160:]
+    fused = fuse_frames([first, second], 'sharpest')
+
+    assert _error(fused, page) < 0.5 * min(_error(first, page), _error(second, page))
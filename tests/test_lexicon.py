@@ -0,0 +1,40 @@
+"""Lexicon lookup: symmetric-delete candidates at the smallest distance"""
+from scripts.lexicon import Lexicon, edit_distance
+
+
+def _lexicon(**kwargs):
+    lexicon = Lexicon(**kwargs)
+    for word, count in (('comprimé', 50), ('comprimés', 40), ('dose', 90), ('dosage', 20),
+                        ('jour', 80), ('pour', 300), ('tour', 30)):
+        lexicon.add(word, count)
+    return lexicon
+
+
+def test_known_word_is_exact():
+    assert _lexicon().lookup('dose') == [('dose', 0, 90)]
+
+
+def test_closest_candidates_only():
+    lexicon = _lexicon()
+
+    assert lexicon.lookup('comprine') == [('comprimé', 2, 50)]
+    assert sorted(lexicon.lookup('xour')) == \
+        [('jour', 1, 80), ('pour', 1, 300), ('tour', 1, 30)]
+
+
+def test_max_distance_limits_candidates():
+    lexicon = _lexicon()
+
+    assert lexicon.lookup('comprine', max_distance=1) == []
+    assert lexicon.lookup('xyzzy') == []
+
+
+def test_transposition_is_one_edit():
+    assert edit_distance('dsoe', 'dose', 2) == 1
+    assert _lexicon().lookup('dsoe') == [('dose', 1, 90)]
+
+
+def test_words_longer_than_prefix_are_found():
+    lexicon = _lexicon(prefix_length=3)
+
+    assert lexicon.lookup('comprimes') == [('comprimés', 1, 40)]
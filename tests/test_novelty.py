@@ -0,0 +1,42 @@
+"""New-text filter: repeated sentences are dropped, OCR noise tolerated"""
+from scripts.novelty import NoveltyFilter
+
+
+def test_only_new_sentences_pass():
+    novelty = NoveltyFilter()
+
+    assert novelty.filter("Prendre deux comprimés. Ne pas dépasser la dose.") == \
+        "Prendre deux comprimés. Ne pas dépasser la dose."
+    assert novelty.filter("Prendre deux comprimés. Conserver au frais.") == "Conserver au frais."
+    assert novelty.filter("Prendre deux comprimés.") == ""
+
+
+def test_ocr_noise_is_the_same_sentence():
+    novelty = NoveltyFilter(similarity=0.85)
+    novelty.filter("Ne pas dépasser la dose prescrite.")
+
+    assert novelty.filter("Ne pas depasser Ia dose prescrite") == ""
+
+
+def test_short_fragments_are_ignored():
+    novelty = NoveltyFilter(min_chars=3)
+
+    assert novelty.filter("a.\n--\nConserver au frais.") == "Conserver au frais."
+    assert novelty.filter("") == ""
+
+
+def test_oldest_sentence_is_forgotten():
+    novelty = NoveltyFilter(max_entries=2)
+    for text in ("premier texte", "deuxième texte", "troisième texte"):
+        novelty.filter(text)
+
+    assert novelty.filter("troisième texte") == ""
+    assert novelty.filter("premier texte") == "premier texte"
+
+
+def test_reset_forgets_everything():
+    novelty = NoveltyFilter()
+    novelty.filter("Conserver au frais.")
+    novelty.reset()
+
+    assert novelty.filter("Conserver au frais.") == "Conserver au frais."
@@ -0,0 +1,202 @@
+"""OCR backends and region reading order"""
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from scripts import ocr
+from scripts.ocr import _reading_order
+
+
+def test_rows_top_to_bottom_then_left_to_right():
+    title = (40, 10, 300, 40)
+    left, right = (20, 100, 120, 30), (200, 104, 150, 26)
+    footer = (30, 200, 250, 20)
+
+    assert _reading_order([footer, right, title, left]) == [title, left, right, footer]
+
+
+def test_slightly_offset_boxes_share_a_row():
+    first, second = (300, 52, 80, 30), (10, 60, 80, 30)
+
+    assert _reading_order([first, second]) == [second, first]
+
+
+def test_boxes_overlapping_less_than_half_are_separate_rows():
+    upper, lower = (300, 0, 80, 30), (10, 20, 80, 30)
+
+    assert _reading_order([lower, upper]) == [upper, lower]
+
+
+def test_no_boxes():
+    assert _reading_order([]) == []
+
+
+class _StubAPI:
+    """Records how the tesserocr backend drives the engine"""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.page_seg_modes = []
+
+    def SetPageSegMode(self, psm):
+        self.page_seg_modes.append(psm)
+
+    def SetVariable(self, key, value):
+        pass
+
+    def SetImageBytes(self, data, width, height, bpp, stride):
+        pass
+
+    def GetUTF8Text(self):
+        return "deux fois par jour"
+
+    def MapWordConfidences(self):
+        return [("deux", 91), ("fois", 88)]
+
+    def Clear(self):
+        pass
+
+    def End(self):
+        pass
+
+
+class _Constants:
+    """tesserocr's OEM/PSM: integer attributes, not callable enums"""
+
+    def __init__(self):
+        raise TypeError("cannot create instances")
+
+
+@pytest.fixture
+def stub_tesserocr(monkeypatch):
+    module = types.ModuleType('tesserocr')
+    module.OEM = type('OEM', (_Constants,), {'LSTM_ONLY': 1, 'DEFAULT': 3})
+    module.PSM = type('PSM', (_Constants,), {'OSD_ONLY': 0, 'SINGLE_BLOCK': 6})
+    module.PyTessBaseAPI = _StubAPI
+    monkeypatch.setitem(sys.modules, 'tesserocr', module)
+    monkeypatch.setattr(ocr, 'TESSEROCR_AVAILABLE', True)
+    return module
+
+
+def test_tesserocr_backend_passes_plain_ints(stub_tesserocr):
+    backend = ocr.TesserocrBackend()
+    image = np.zeros((20, 40), np.uint8)
+
+    text, confidences = backend.image_to_data(image, 'fra', '--oem 1 --psm 4')
+    api = backend._apis[('fra', 1)]
+
+    assert text == "deux fois par jour" and confidences == [91.0, 88.0]
+    assert api.kwargs == {'lang': 'fra', 'oem': 1}
+    assert api.page_seg_modes == [4]
+    assert backend.image_to_string(image, 'fra', '--oem 1 --psm 6') == "deux fois par jour"
+    assert api.page_seg_modes == [4, 6]
+
+
+def test_engine_errors_fall_back_to_pytesseract(stub_tesserocr, monkeypatch, tmp_path):
+    class Broken(_StubAPI):
+        def GetUTF8Text(self):
+            raise TypeError("unexpected engine API")
+
+    class Fallback:
+        def __init__(self, tesseract_cmd=None):
+            pass
+
+        def image_to_string(self, image, lang, config):
+            return "from pytesseract"
+
+    monkeypatch.setenv('TESSDATA_PREFIX', str(tmp_path))
+    monkeypatch.setattr(stub_tesserocr, 'PyTessBaseAPI', Broken)
+    engine = ocr.OCR(backend='tesserocr')
+    monkeypatch.setattr(ocr, 'PytesseractBackend', Fallback)
+
+    assert engine.backend.name == 'tesserocr'
+    assert engine._run_backend(np.zeros((20, 40), np.uint8), 'fra', '--psm 6') == "from pytesseract"
+
+
+def _page(scale, size=(1080, 1920), angle=0.0, lines=12):
+    """White page of dark text lines at a FONT_HERSHEY_SIMPLEX scale, optionally rotated"""
+    import cv2
+    height, width = size
+    image = np.full(size, 235, np.uint8)
+    step = max(8, int(45 * scale))
+    for row in range(lines):
+        cv2.putText(image, "take one tablet twice a day", (40, 80 + row * step),
+                    cv2.FONT_HERSHEY_SIMPLEX, scale, 30, max(1, int(2 * scale)))
+    if angle:
+        matrix = cv2.getRotationMatrix2D((width / 2.0, height / 2.0), angle, 1.0)
+        image = cv2.warpAffine(image, matrix, (width, height), borderValue=235)
+    return image
+
+
+def _glyph_height(image):
+    binary, factor = ocr._analysis_image(image)
+    return ocr.estimate_text_height(binary) / factor
+
+
+def test_large_print_is_scaled_to_target_height():
+    out = ocr.preprocess_for_ocr(_page(2.0, lines=8), target_height=20, binarize=False)
+
+    assert out.shape[1] < 1920
+    assert abs(_glyph_height(out) - 20) <= 4
+
+
+def test_small_print_upscale_is_capped():
+    small = _page(0.4, size=(360, 640))
+    assert ocr.preprocess_for_ocr(small, target_height=20, binarize=False).shape == (540, 960)
+    # A 1080p frame is never upsampled past its own size
+    assert ocr.preprocess_for_ocr(_page(0.4), target_height=20).shape == (1080, 1920)
+
+
+def test_skew_is_measured_and_removed():
+    skewed = _page(1.0, angle=4.0)
+    binary, _ = ocr._analysis_image(skewed)
+
+    assert abs(ocr.estimate_skew(binary) + 4.0) <= 0.6
+    straight = ocr.preprocess_for_ocr(skewed, target_height=22, binarize=False)
+    assert abs(ocr.estimate_skew(ocr._analysis_image(straight)[0])) <= 0.6
+
+
+def test_blank_page_is_left_alone():
+    blank = np.full((480, 640), 235, np.uint8)
+
+    assert ocr.preprocess_for_ocr(blank, binarize=False) is blank
+
+
+_PASSES = [('fast', 0.5, '--psm 6'), ('full', 1.0, '--psm 6'), ('thorough', 1.5, '--psm 3')]
+
+
+def _scripted(*outputs):
+    """recognize() stand-in returning the given (text, confidences) in turn"""
+    calls = []
+
+    def recognize(image, language, config):
+        calls.append((image.shape, language, config))
+        return outputs[len(calls) - 1]
+
+    return recognize, calls
+
+
+def test_confident_first_pass_stops_early():
+    recognize, calls = _scripted(("deux fois", [92, 88]))
+    result = ocr.run_passes(recognize, np.zeros((100, 200), np.uint8), 'fra', _PASSES, 80)
+
+    assert result == {'text': "deux fois", 'confidence': 90.0, 'pass': 'fast', 'passes': 1}
+    assert calls == [((50, 100), 'fra', '--psm 6')]
+
+
+def test_low_confidence_escalates_and_keeps_the_best_pass():
+    recognize, calls = _scripted(("dcux", [40]), ("deux fois", [75, 71]), ("deux fo1s", [60, 50]))
+    result = ocr.run_passes(recognize, np.zeros((100, 200), np.uint8), 'fra', _PASSES, 80)
+
+    assert result == {'text': "deux fois", 'confidence': 73.0, 'pass': 'full', 'passes': 3}
+    assert [call[0] for call in calls] == [(50, 100), (100, 200), (150, 300)]
+    assert calls[2][2] == '--psm 3'
+
+
+def test_no_text_at_full_resolution_stops():
+    recognize, calls = _scripted(("", []), ("", []))
+    result = ocr.run_passes(recognize, np.zeros((100, 200), np.uint8), 'fra', _PASSES, 80)
+
+    assert result['text'] == "" and result['passes'] == 2
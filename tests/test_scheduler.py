@@ -0,0 +1,61 @@
+"""Adaptive scheduler: backoff while static, deadlines that do not drift"""
+import pytest
+
+from scripts import scheduler
+from scripts.scheduler import AdaptiveScheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(scheduler.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_period_backs_off_and_resets(clock):
+    schedule = AdaptiveScheduler(interval=1.0, min_interval=0.5, max_interval=4.0, backoff=2.0)
+
+    periods = []
+    for _ in range(4):
+        schedule.report(False)
+        periods.append(schedule.period)
+    assert periods == [2.0, 4.0, 4.0, 4.0]
+
+    schedule.report(True)
+    assert schedule.period == 0.5
+
+
+def test_interval_is_clamped():
+    assert AdaptiveScheduler(interval=0.1, min_interval=0.5).period == 0.5
+    assert AdaptiveScheduler(interval=60, max_interval=30).period == 30.0
+
+
+def test_processing_time_is_subtracted(clock):
+    schedule = AdaptiveScheduler(interval=2.0, min_interval=0.5, max_interval=30.0, backoff=1.5)
+    schedule.start_cycle()
+    clock[0] += 0.25
+    schedule.report(False)
+
+    assert schedule.time_until_next() == pytest.approx(3.0 - 0.25)
+
+
+def test_deadlines_do_not_drift(clock):
+    schedule = AdaptiveScheduler(interval=2.0, min_interval=2.0, max_interval=2.0)
+    schedule.start_cycle()
+    clock[0] += 0.5
+    assert schedule.time_until_next() == pytest.approx(1.5)
+
+    clock[0] += 1.5
+    schedule.start_cycle()
+    clock[0] += 0.25
+    assert schedule.time_until_next() == pytest.approx(1.75)
+
+
+def test_overrun_does_not_catch_up(clock):
+    schedule = AdaptiveScheduler(interval=1.0, min_interval=1.0, max_interval=1.0)
+    schedule.start_cycle()
+    clock[0] += 5.0
+    assert schedule.time_until_next() == 0.0
+
+    schedule.start_cycle()
+    assert schedule.time_until_next() == pytest.approx(1.0)
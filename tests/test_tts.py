@@ -0,0 +1,125 @@
+"""Speech: sentence chunking for streaming and the utterance queue policies"""
+import threading
+import time
+
+import pytest
+
+from scripts.tts import TTS, split_into_chunks
+
+
+def test_splits_at_sentences():
+    text = "Prendre deux comprimés par jour. Ne pas dépasser la dose prescrite."
+
+    assert split_into_chunks(text) == ["Prendre deux comprimés par jour.",
+                                       "Ne pas dépasser la dose prescrite."]
+
+
+def test_short_fragments_are_merged():
+    assert split_into_chunks("Oui. Non. Conserver au frais.", min_chars=10) == \
+        ["Oui. Non. Conserver au frais."]
+
+
+def test_long_sentences_split_at_clauses_then_spaces():
+    text = "Conserver au frais, à l'abri de la lumière, hors de portée des enfants"
+    chunks = split_into_chunks(text, min_chars=0, max_chars=30)
+
+    assert chunks == ["Conserver au frais,", "à l'abri de la lumière,",
+                      "hors de portée des enfants"]
+    words = "mot " * 40
+    assert all(len(chunk) <= 30 for chunk in split_into_chunks(words, min_chars=0, max_chars=30))
+    assert ' '.join(split_into_chunks(words, min_chars=0, max_chars=30)).split() == words.split()
+
+
+def test_empty_text():
+    assert split_into_chunks("   ") == []
+
+
+class _Speaker:
+    """Stands in for synthesis and playback; each utterance plays until released or cancelled"""
+
+    def __init__(self, tts):
+        self.tts = tts
+        self.spoken = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, text):
+        self.spoken.append(text)
+        self.started.set()
+        while not self.release.is_set() and not self.tts._should_abort():
+            time.sleep(0.005)
+
+
+@pytest.fixture
+def make_tts():
+    engines = []
+
+    def make(**kwargs):
+        tts = TTS(use_gtts=True, audio_sink='null', **kwargs)
+        speaker = _Speaker(tts)
+        tts._speak_text = speaker
+        engines.append(tts)
+        return tts, speaker
+
+    yield make
+    for tts in engines:
+        tts.stop()
+
+
+def _speak_while_busy(tts, speaker, *texts):
+    """Speak the first text, wait until it is playing, then queue the rest"""
+    first = tts.speak(texts[0])
+    assert speaker.started.wait(5)
+    return [first] + [tts.speak(text) for text in texts[1:]]
+
+
+def test_drop_oldest_only_drops_when_full(make_tts):
+    tts, speaker = make_tts(queue_size=2, queue_policy='drop_oldest')
+    a, b, c, d = _speak_while_busy(tts, speaker, "a", "b", "c", "d")
+
+    assert b.done() and b.cancelled and not c.done()
+    speaker.release.set()
+    assert tts.wait_for_completion(5)
+    assert speaker.spoken == ["a", "c", "d"]
+    assert not a.cancelled and tts.dropped == 1
+
+
+def test_replace_pending_keeps_only_the_newest(make_tts):
+    tts, speaker = make_tts(queue_policy='replace_pending')
+    a, b, c = _speak_while_busy(tts, speaker, "a", "b", "c")
+
+    assert b.cancelled and not c.cancelled
+    speaker.release.set()
+    assert c.wait(5)
+    assert speaker.spoken == ["a", "c"] and not a.cancelled
+
+
+def test_interrupt_stops_current_speech(make_tts):
+    tts, speaker = make_tts(queue_policy='interrupt')
+    a, b = _speak_while_busy(tts, speaker, "a", "b")
+
+    assert a.wait(5) and a.cancelled
+    speaker.release.set()
+    assert b.wait(5) and not b.cancelled
+    assert speaker.spoken == ["a", "b"]
+
+
+def test_stale_speech_is_dropped(make_tts):
+    tts, speaker = make_tts(max_age=0.05)
+    a, b = _speak_while_busy(tts, speaker, "a", "b")
+    time.sleep(0.1)
+    speaker.release.set()
+
+    assert b.wait(5) and b.cancelled
+    assert speaker.spoken == ["a"] and tts.dropped == 1
+
+
+def test_stop_cancels_queued_and_current_speech(make_tts):
+    tts, speaker = make_tts()
+    a, b = _speak_while_busy(tts, speaker, "a", "b")
+    tts.stop()
+
+    assert a.wait(5) and a.cancelled
+    assert b.done() and b.cancelled
+    after = tts.speak("c")
+    assert after.done() and after.cancelled